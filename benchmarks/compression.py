@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of compressed request bodies
+
+Compares the size and upload time of uncompressed and compressed request bodies for the polygons in
+ohsome/test/data. The requests are sent to a local server, so the upload time mostly measures the encoding. The upload
+time at a constrained bandwidth is estimated from the size of the body.
+
+Usage: python benchmarks/compression.py [--repeat 1000] [--bandwidth 10]
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+from urllib3 import Retry
+
+from ohsome import OhsomeClient
+
+DATA_DIR = Path(__file__).parents[1] / "ohsome" / "test" / "data"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Reads the request body and answers with an empty count result."""
+
+    received_bytes = 0
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        _Handler.received_bytes = len(self.rfile.read(length))
+        body = b'{"result": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    """Send the test polygons uncompressed and compressed to a local server and print the sizes and durations."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1000,
+        help="Number of copies of the test polygons, to get a payload of realistic size",
+    )
+    parser.add_argument(
+        "--bandwidth",
+        type=float,
+        default=10,
+        help="Upload bandwidth in Mbit/s used to estimate the upload time",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Runs per compression")
+    args = parser.parse_args()
+
+    bpolys = gpd.read_file(DATA_DIR / "polygons.geojson")
+    # shift the copies, so they are not compressed better than distinct polygons
+    bpolys = pd.concat(
+        [
+            bpolys.set_geometry(bpolys.translate(i * 1.234e-5, i * 2.345e-5))
+            for i in range(args.repeat)
+        ],
+        ignore_index=True,
+    )
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+
+    print(
+        f"{'compression':<12}{'bytes':>14}{'ratio':>8}{'local [s]':>12}"
+        f"{f'at {args.bandwidth:g} Mbit/s [s]':>22}"
+    )
+    uncompressed_bytes = None
+    for compression in [None, "deflate", "gzip"]:
+        client = OhsomeClient(
+            base_api_url=url, log=False, retry=Retry(total=0), compression=compression
+        )
+        durations = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            client.elements.count.post(bpolys=bpolys, time="2020-01-01")
+            durations.append(time.perf_counter() - start)
+        client.close()
+
+        sent_bytes = _Handler.received_bytes
+        uncompressed_bytes = uncompressed_bytes or sent_bytes
+        local = min(durations)
+        estimated = local + sent_bytes * 8 / (args.bandwidth * 1e6)
+        print(
+            f"{str(compression):<12}{sent_bytes:>14,}{sent_bytes / uncompressed_bytes:>8.2f}"
+            f"{local:>12.3f}{estimated:>22.3f}"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the conversion of data extraction responses to GeoDataFrames
+
+Compares OhsomeResponse.as_dataframe() with the previous conversion, which rewrote the properties of every feature and
+used GeoDataFrame.from_features(). Each conversion runs in its own process to measure its peak memory.
+
+Usage: python benchmarks/geodataframe.py [--features 1000000]
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+
+import geopandas as gpd
+
+from ohsome import OhsomeResponse
+
+
+def create_response(n_features: int) -> dict:
+    """Create a response of polygons with a few tags each."""
+    features = []
+    for i in range(n_features):
+        x, y = 8.6 + (i % 1000) * 1e-4, 49.4 + (i // 1000) * 1e-4
+        features.append(
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [
+                            [x, y],
+                            [x + 5e-5, y],
+                            [x + 5e-5, y + 5e-5],
+                            [x, y + 5e-5],
+                            [x, y],
+                        ]
+                    ],
+                },
+                "properties": {
+                    "@osmId": f"way/{i}",
+                    "@snapshotTimestamp": "2024-01-01T00:00:00Z",
+                    "building": "yes",
+                    "name": f"Building {i}",
+                    "height": str(i % 30),
+                },
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def previous_conversion(data: dict, explode_tags: tuple) -> gpd.GeoDataFrame:
+    """The conversion of ohsome-py 0.4.0 without the formatting of timestamps and the index."""
+    for feature in data["features"]:
+        properties = feature["properties"]
+        tags = {}
+        new_properties = {k: None for k in explode_tags}
+        for k in properties.keys():
+            if (k.startswith("@")) or (k == "timestamp") or (k in explode_tags):
+                new_properties[k] = properties.get(k)
+            else:
+                tags[k] = properties.get(k)
+        new_properties["@other_tags"] = tags
+        feature["properties"] = new_properties
+    return gpd.GeoDataFrame().from_features(data, crs="epsg:4326")
+
+
+def current_conversion(data: dict, explode_tags: tuple) -> gpd.GeoDataFrame:
+    """The conversion of OhsomeResponse without the index, which also formats the timestamps."""
+    return OhsomeResponse(data=data)._features_to_geodataframe(
+        data["features"], explode_tags
+    )
+
+
+def run(conversion, n_features: int, queue: multiprocessing.Queue) -> None:
+    """Measure the duration and additional peak memory of a conversion and put them into the queue."""
+    data = create_response(n_features)
+    memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    conversion(data, ("building",))
+    duration = time.perf_counter() - start
+    memory_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in kilobytes on Linux
+    queue.put((duration, (memory_after - memory_before) / 1024))
+
+
+def main():
+    """Run each conversion in its own process and print its duration and additional peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--features", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'conversion':<12}{'time [s]':>10}{'additional peak memory [MB]':>30}")
+    for name, conversion in [
+        ("previous", previous_conversion),
+        ("current", current_conversion),
+    ]:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=run, args=(conversion, args.features, queue)
+        )
+        process.start()
+        duration, memory = queue.get()
+        process.join()
+        print(f"{name:<12}{duration:>10.2f}{memory:>30.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the parsing of timestamps of large groupBy results
+
+Compares the conversion of a groupBy result to a DataFrame using the current timestamp parsing, which parses each
+distinct timestamp once, with the previous parsing of every row.
+
+Usage: python benchmarks/timestamps.py [--groups 10000] [--timestamps 100]
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+from ohsome import OhsomeResponse
+
+
+def previous_format_timestamp(dt: pd.Series, utc: bool = False) -> pd.Series:
+    """The parsing of ohsome-py 0.4.0."""
+    return pd.to_datetime(dt.str.replace("Z", ""), format="ISO8601")
+
+
+def create_response(n_groups: int, n_timestamps: int) -> OhsomeResponse:
+    """Create a groupBy boundary result with monthly timestamps."""
+    timestamps = pd.date_range("2008-01-01", periods=n_timestamps, freq="MS")
+    timestamps = timestamps.strftime("%Y-%m-%dT%H:%M:%SZ").tolist()
+    data = {
+        "groupByResult": [
+            {
+                "groupByObject": f"boundary{i}",
+                "result": [{"timestamp": t, "value": 1.0} for t in timestamps],
+            }
+            for i in range(n_groups)
+        ]
+    }
+    return OhsomeResponse(
+        data=data, url="https://api.ohsome.org/v1/elements/count/groupBy/boundary"
+    )
+
+
+def measure(response: OhsomeResponse, utc: bool = False) -> float:
+    """Minimal duration of the conversion to a DataFrame of three runs."""
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter()
+        response._as_dataframe(utc=utc)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    """Compare the timestamp parsing of ohsome-py 0.4.0 with the current one and print the durations."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--groups", type=int, default=10000)
+    parser.add_argument("--timestamps", type=int, default=100)
+    args = parser.parse_args()
+
+    response = create_response(args.groups, args.timestamps)
+    print(f"{args.groups * args.timestamps:,} rows, {args.timestamps} timestamps")
+    with patch.object(
+        OhsomeResponse,
+        "_format_timestamp",
+        staticmethod(previous_format_timestamp),
+    ):
+        print(f"previous: {measure(response):.2f} s")
+    print(f"current: {measure(response):.2f} s")
+    print(f"current, time zone aware: {measure(response, utc=True):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
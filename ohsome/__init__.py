@@ -6,4 +6,5 @@
 # The order of imports here must remain to prevent circular imports
 from .exceptions import OhsomeException  # noqa
 from .response import OhsomeResponse  # noqa
-from .clients import OhsomeClient  # noqa
+from .cache import ResponseCache, MetadataCache  # noqa
+from .clients import OhsomeClient, AsyncOhsomeClient  # noqa
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Classes to cache responses and metadata of the ohsome API"""
+
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union, Callable, Tuple, Iterator
+
+from ohsome.constants import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_CHECK_INTERVAL,
+    DEFAULT_METADATA_TTL,
+)
+from ohsome.exceptions import OhsomeException
+
+# name of the files of cached responses: cache key and replication sequence number
+CACHE_FILE_NAME = re.compile(r"[0-9a-f]{64}_\d+\.json")
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    """
+    Write a file via a temporary file, so other processes never read incomplete content
+    :param path: Path of the file
+    :param content: Content of the file
+    :return:
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(file_descriptor, "wb") as dst:
+        dst.write(content)
+    os.replace(temporary_path, path)
+
+
+class ResponseCache:
+    """
+    Persistent cache of ohsome API responses. Responses are stored together with the replication sequence number of
+    the data they were computed from. They are invalidated as soon as the ohsome API serves newer data.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = DEFAULT_CACHE_DIR,
+        max_size: Optional[int] = DEFAULT_CACHE_MAX_SIZE,
+        max_age: Optional[dt.timedelta] = None,
+        check_interval: Optional[dt.timedelta] = DEFAULT_CACHE_CHECK_INTERVAL,
+    ):
+        """
+        Initialize ResponseCache object
+        :param cache_dir: Directory for cached responses, default: ./ohsome_cache
+        :param max_size: Maximum size of all cached responses in bytes. The least recently used responses are removed
+        first. None for no limit, default: 1 GB
+        :param max_age: Maximum age of cached responses, None for no limit, default: None
+        :param check_interval: Time after which the replication sequence number of the ohsome API is checked again,
+        default: 1 minute
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.max_age = max_age
+        self.check_interval = check_interval
+        self.__sequence_numbers = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, parameters: dict) -> str:
+        """
+        Create the cache key of a request
+        :param url: Url of the request
+        :param parameters: Formatted parameters of the request
+        :return: Hash of the url and parameters
+        """
+        request = {
+            "url": url,
+            "parameters": {k: str(v) for k, v in parameters.items() if v is not None},
+        }
+        return hashlib.sha256(
+            json.dumps(request, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def sequence_number(self, base_api_url: str, fetch: Callable[[], int]) -> int:
+        """
+        Get the replication sequence number of the data served by an ohsome API instance
+        :param base_api_url: URL of ohsome API instance
+        :param fetch: Function requesting the current replication sequence number from the ohsome API
+        :return:
+        """
+        with self.__lock:
+            sequence_number, checked = self.__sequence_numbers.get(
+                base_api_url, (None, None)
+            )
+            if sequence_number is None or (
+                self.check_interval is not None
+                and time.monotonic() - checked > self.check_interval.total_seconds()
+            ):
+                sequence_number = fetch()
+                self.__sequence_numbers[base_api_url] = (
+                    sequence_number,
+                    time.monotonic(),
+                )
+        return sequence_number
+
+    def get(self, key: str, sequence_number: int) -> Optional[bytes]:
+        """
+        Get a cached response
+        :param key: Cache key of the request
+        :param sequence_number: Current replication sequence number of the ohsome API
+        :return: Content of the response or None if it is not cached
+        """
+        for path in self._files(f"{key}_*.json"):
+            try:
+                modified = path.stat().st_mtime
+                if path.stem != f"{key}_{sequence_number}" or self._is_expired(
+                    modified
+                ):
+                    path.unlink(missing_ok=True)
+                    continue
+                content = path.read_bytes()
+                # mark as recently used for the eviction by the access time, the age is kept as modification time
+                os.utime(path, (time.time(), modified))
+            except FileNotFoundError:
+                continue
+            return content
+        return None
+
+    def put(self, key: str, content: bytes, sequence_number: int) -> None:
+        """
+        Cache a response and evict old responses
+        :param key: Cache key of the request created by ResponseCache.key()
+        :param content: Content of the response
+        :param sequence_number: Replication sequence number of the data the response was computed from
+        :return:
+        """
+        path = self.cache_dir / f"{key}_{sequence_number}.json"
+        if not CACHE_FILE_NAME.fullmatch(path.name):
+            raise ValueError(
+                f"Invalid cache key '{key}', use ResponseCache.key() to create it."
+            )
+        _write_atomic(path, content)
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        for path in self._files():
+            path.unlink(missing_ok=True)
+
+    def _files(self, pattern: str = "*.json") -> Iterator[Path]:
+        """
+        Files of cached responses in the cache directory, other files are never touched
+        :param pattern: Glob pattern of the files
+        :return:
+        """
+        for path in self.cache_dir.glob(pattern):
+            if CACHE_FILE_NAME.fullmatch(path.name):
+                yield path
+
+    def _is_expired(self, modified: float) -> bool:
+        """Check if a cached response last modified at the given time is older than the maximum age."""
+        return (
+            self.max_age is not None
+            and time.time() - modified > self.max_age.total_seconds()
+        )
+
+    def _evict(self) -> None:
+        """Remove expired responses and the least recently used ones exceeding the maximum size."""
+        entries = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if self._is_expired(stat.st_mtime):
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_atime, stat.st_size, path))
+
+        if self.max_size is None:
+            return
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def __repr__(self):
+        return f"<ResponseCache: {self.cache_dir}>"
+
+
+class MetadataCache:
+    """
+    Cache of the metadata of ohsome API instances shared by all clients of a process. Optionally, the metadata is
+    stored on disk as well to share it with other processes. Once half of the time to live has passed, the metadata is
+    refreshed in the background while the cached metadata is still returned.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[dt.timedelta] = DEFAULT_METADATA_TTL,
+        cache_dir: Optional[Union[str, Path]] = None,
+        refresh: bool = True,
+    ):
+        """
+        Initialize MetadataCache object
+        :param ttl: Time after which the metadata is requested again, None for no limit, default: 1 hour
+        :param cache_dir: Directory to store the metadata on disk, None to keep it in memory only, default: None
+        :param refresh: Refresh the metadata in the background before it expires, default: True
+        """
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh = refresh
+        self.__metadata = {}
+        self.__refreshing = set()
+        self.__lock = threading.Lock()
+
+    def get(self, base_api_url: str, fetch: Callable[[], dict]) -> dict:
+        """
+        Get the metadata of an ohsome API instance
+        :param base_api_url: URL of ohsome API instance
+        :param fetch: Function requesting the metadata from the ohsome API
+        :return: Metadata of the ohsome API instance
+        """
+        with self.__lock:
+            metadata, fetched = self.__metadata.get(base_api_url, (None, None))
+        if metadata is None or self._age(fetched) >= self._ttl_seconds():
+            metadata, fetched = self._read(base_api_url)
+        if metadata is None or self._age(fetched) >= self._ttl_seconds():
+            return self._update(base_api_url, fetch)
+
+        if self.refresh and self._age(fetched) >= self._ttl_seconds() / 2:
+            self._refresh_in_background(base_api_url, fetch)
+        return metadata
+
+    def clear(self) -> None:
+        """Remove the metadata of all ohsome API instances."""
+        with self.__lock:
+            self.__metadata = {}
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.metadata"):
+                path.unlink(missing_ok=True)
+
+    def _update(self, base_api_url: str, fetch: Callable[[], dict]) -> dict:
+        """Request the metadata and store it in memory and on disk."""
+        metadata = fetch()
+        with self.__lock:
+            self.__metadata[base_api_url] = (metadata, time.time())
+        if self.cache_dir is not None:
+            _write_atomic(
+                self._path(base_api_url), json.dumps(metadata).encode("utf-8")
+            )
+        return metadata
+
+    def _refresh_in_background(
+        self, base_api_url: str, fetch: Callable[[], dict]
+    ) -> None:
+        """Start updating the metadata in a background thread, unless it is already being updated."""
+        with self.__lock:
+            if base_api_url in self.__refreshing:
+                return
+            self.__refreshing.add(base_api_url)
+
+        def refresh():
+            try:
+                self._update(base_api_url, fetch)
+            except OhsomeException:
+                # the cached metadata is kept and requested again at the next access
+                pass
+            finally:
+                with self.__lock:
+                    self.__refreshing.discard(base_api_url)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _read(self, base_api_url: str) -> Tuple[Optional[dict], Optional[float]]:
+        """Read the metadata stored on disk by this or another process."""
+        if self.cache_dir is None:
+            return None, None
+        path = self._path(base_api_url)
+        try:
+            fetched = path.stat().st_mtime
+            metadata = json.loads(path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None, None
+        with self.__lock:
+            self.__metadata[base_api_url] = (metadata, fetched)
+        return metadata, fetched
+
+    def _path(self, base_api_url: str) -> Path:
+        """Path of the metadata of an ohsome API instance on disk."""
+        url_hash = hashlib.sha256(base_api_url.encode("utf-8")).hexdigest()
+        # not a .json file, so a response cache in the same directory does not evict it
+        return self.cache_dir / f"{url_hash}.metadata"
+
+    def _ttl_seconds(self) -> float:
+        return self.ttl.total_seconds() if self.ttl is not None else float("inf")
+
+    @staticmethod
+    def _age(fetched: float) -> float:
+        return time.time() - fetched
+
+    def __repr__(self):
+        return f"<MetadataCache: {self.cache_dir or 'memory'}>"
+
+
+# metadata cache used by all clients, unless another one is passed
+shared_metadata_cache = MetadataCache()
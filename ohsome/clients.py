@@ -2,12 +2,15 @@
 # -*- coding: utf-8 -*-
 
 """OhsomeClient classes to build and handle requests to ohsome API"""
+import asyncio
+import copy
 import datetime as dt
 import json
-from functools import cached_property
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Union, Optional, List
-from urllib.parse import urljoin
+from typing import Union, Optional, List, Iterator, Tuple, Callable
+from urllib.parse import urljoin, urlencode
 
 import geopandas as gpd
 import pandas as pd
@@ -16,21 +19,45 @@ import shapely
 from requests import Session, Response
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RetryError, JSONDecodeError
-from urllib3 import Retry
-
-from ohsome import OhsomeException, OhsomeResponse
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import Retry, HTTPResponse
+from urllib3.exceptions import MaxRetryError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from ohsome import OhsomeException, OhsomeResponse, ResponseCache, MetadataCache
+from ohsome.cache import shared_metadata_cache
 from ohsome.constants import (
+    ACCEPT_ENCODING,
+    COMPRESSION_MIN_SIZE,
     DEFAULT_LOG_DIR,
     DEFAULT_LOG,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_POOL_SIZE,
+    EXTRACTION_ENDPOINTS,
     OHSOME_BASE_API_URL,
     OHSOME_VERSION,
+    QUERY_PARAMETERS,
+    REQUEST_COMPRESSIONS,
+    VALIDATION_MODES,
 )
 from ohsome.helper import (
+    compress_body,
     extract_error_message_from_invalid_json,
     format_boundary,
     format_time,
     convert_arrays,
     format_list_parameters,
+    find_groupby_names,
+    split_bpolys,
+    split_time_interval,
+    stitch_history_features,
+    validate_boundary,
+    validate_time,
 )
 
 
@@ -43,6 +70,11 @@ class _OhsomeBaseClient:
         cache: Optional[list] = None,
         user_agent: Optional[str] = None,
         retry: Optional[Retry] = None,
+        response_cache: Optional[ResponseCache] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        metadata_cache: Optional[MetadataCache] = None,
+        compression: Optional[str] = None,
+        validate: Optional[str] = None,
     ):
         """
         Initialize _OhsomeInfoClient object
@@ -54,7 +86,21 @@ class _OhsomeBaseClient:
         :param retry: Set a custom retry mechanism for requests. Be aware that ohsome-py will call the API once more
         after all retries have failed. This overcomes the problem that the cause of the retries is shadowed behind a
         RetryError by the underlying library.
+        :param response_cache: Cache for responses of the ohsome API, default: None
+        :param pool_size: Maximum number of connections to the ohsome API kept open and shared by all endpoints,
+        default: 10
+        :param metadata_cache: Cache for the metadata of the ohsome API, default: cache shared by all clients of the
+        process keeping the metadata in memory for 1 hour
+        :param compression: Compress the bodies of large requests using 'gzip' or 'deflate'. Only use it if the
+        ohsome API instance or a proxy in front of it accepts compressed requests, default: None
+        :param validate: Check boundaries and timestamps against the extent of the ohsome API given by its metadata
+        before sending requests: 'reject' raises an OhsomeException, 'drop' removes the ones outside the extent and
+        'clip' clips them to it, default: None
         """
+        if validate is not None and validate not in VALIDATION_MODES:
+            raise ValueError(
+                f"Validation '{validate}' is not supported, use one of {VALIDATION_MODES}."
+            )
         self.log = log
         self.log_dir = Path(log_dir or DEFAULT_LOG_DIR)
         if self.log:
@@ -70,39 +116,189 @@ class _OhsomeBaseClient:
             agent_list.append(user_agent)
         self.user_agent = " ".join(agent_list)
 
-        if retry is None:
-            self.__retry = Retry(
+        if not retry:
+            retry = Retry(
                 total=3,
                 status_forcelist=[429, 500, 502, 503, 504],
                 allowed_methods=["GET", "POST"],
                 backoff_factor=1,
             )
-        else:
-            self.__retry = retry or Retry(
-                total=3,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["GET", "POST"],
-                backoff_factor=1,
+        self._transport = _OhsomeTransport(
+            self.user_agent, retry, pool_size, compression=compression
+        )
+        self._response_cache = response_cache
+        self._metadata_cache = metadata_cache or shared_metadata_cache
+        self._validate = validate
+        self._parameters = None
+
+    def _session(self, retry: bool = True) -> Session:
+        """
+        Get the request session shared with all endpoints of the client
+        :param retry: Use the retry configuration of the client
+        :return:
+        """
+        return self._transport.session(retry)
+
+    def close(self) -> None:
+        """Close all connections of the client."""
+        self._transport.close()
+
+    def _fetch_metadata(self) -> dict:
+        """
+        Send ohsome GET request for metadata
+        :return:
+        """
+        metadata_url = f"{self._base_api_url}metadata"
+        try:
+            response = self._session().get(metadata_url)
+            response.raise_for_status()
+        except requests.exceptions.ConnectionError:
+            raise OhsomeException(
+                message="Connection Error: Query could not be sent. Make sure there are no network "
+                f"problems and that the ohsome API URL {metadata_url} is valid.",
+                url=metadata_url,
+                params=self._parameters,
+            )
+        except requests.exceptions.HTTPError as e:
+            raise OhsomeException(
+                message=e.response.json()["message"],
+                url=metadata_url,
+                params=self._parameters,
+                error_code=e.response.status_code,
             )
-        self.__session = None
+        else:
+            return response.json()
 
-    def _session(self):
+    def _endpoint(self, endpoint_class, *components):
         """
-        Set up request session
+        Create the client of a child endpoint, which inherits the settings of this client
+        :param endpoint_class: Client class of the child endpoint
+        :param components: Components appended to the endpoint url
         :return:
         """
-        if self.__session is None:
-            adapter = HTTPAdapter(max_retries=self.__retry)
-            self.__session = Session()
-            self.__session.mount("https://", adapter)
-            self.__session.mount("http://", adapter)
-            self.__session.headers["user-agent"] = self.user_agent
-        return self.__session
+        endpoint = endpoint_class(
+            self._base_api_url,
+            self.log,
+            self.log_dir,
+            self._cache + list(components),
+            response_cache=self._response_cache,
+            metadata_cache=self._metadata_cache,
+            validate=self._validate,
+        )
+        endpoint._transport = self._transport
+        return endpoint
 
     def __repr__(self):
         return f"<OhsomeClient: {self._base_api_url}>"
 
 
+class _OhsomeTransport:
+    """HTTP connections shared by a client and all of its endpoints"""
+
+    def __init__(
+        self,
+        user_agent: str,
+        retry: Retry,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        asynchronous: bool = False,
+        compression: Optional[str] = None,
+    ):
+        """
+        Initialize _OhsomeTransport object
+        :param user_agent: User agent passed with the request to the ohsome API
+        :param retry: Retry configuration for requests
+        :param pool_size: Maximum number of connections kept open per host
+        :param asynchronous: Send requests using aiohttp instead of requests
+        :param compression: Content encoding of request bodies, 'gzip', 'deflate' or None
+        """
+        if compression is not None and compression not in REQUEST_COMPRESSIONS:
+            raise ValueError(
+                f"Compression '{compression}' is not supported, use one of {REQUEST_COMPRESSIONS}."
+            )
+        self.user_agent = user_agent
+        self.retry = retry
+        self.pool_size = pool_size
+        self.asynchronous = asynchronous
+        self.compression = compression
+        self.__sessions = {}
+        self.__lock = threading.Lock()
+        self.__async_session = None
+        self.__loop = None
+
+    def session(self, retry: bool = True) -> Session:
+        """
+        Set up request session lazily
+        :param retry: Use the retry configuration, otherwise a separate session without retries is returned
+        :return:
+        """
+        with self.__lock:
+            if retry not in self.__sessions:
+                adapter = HTTPAdapter(
+                    max_retries=self.retry if retry else False,
+                    pool_maxsize=self.pool_size,
+                )
+                session = Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["user-agent"] = self.user_agent
+                session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+                self.__sessions[retry] = session
+            return self.__sessions[retry]
+
+    async def async_session(self) -> "aiohttp.ClientSession":
+        """
+        Set up the asynchronous session lazily within the running event loop
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self.__async_session is None
+            or self.__async_session.closed
+            or self.__loop is not loop
+        ):
+            await self._discard_async_session()
+            self.__async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                headers={
+                    "user-agent": self.user_agent,
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                },
+                # like requests, wait for the ohsome API to answer, which applies its own timeout
+                timeout=aiohttp.ClientTimeout(total=None),
+            )
+            self.__loop = loop
+        return self.__async_session
+
+    async def _discard_async_session(self) -> None:
+        """
+        Close the connections of the asynchronous session, which cannot be used anymore once its event loop changed
+        :return:
+        """
+        session, self.__async_session = self.__async_session, None
+        if session is None or session.closed:
+            return
+        if self.__loop is asyncio.get_running_loop():
+            await session.close()
+            return
+        # the session cannot be closed within another event loop, so its connector is closed on its own
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            await connector.close()
+
+    def close(self) -> None:
+        """Close all connections of the request sessions."""
+        with self.__lock:
+            for session in self.__sessions.values():
+                session.close()
+            self.__sessions = {}
+
+    async def close_async(self) -> None:
+        """Close all connections including those of the asynchronous session."""
+        self.close()
+        await self._discard_async_session()
+
+
 class _OhsomeInfoClient(_OhsomeBaseClient):
     """Client for metadata of ohsome API"""
 
@@ -114,6 +310,11 @@ class _OhsomeInfoClient(_OhsomeBaseClient):
         cache: Optional[list] = None,
         user_agent: Optional[str] = None,
         retry: Optional[Retry] = None,
+        response_cache: Optional[ResponseCache] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        metadata_cache: Optional[MetadataCache] = None,
+        compression: Optional[str] = None,
+        validate: Optional[str] = None,
     ):
         """
         Initialize _OhsomeInfoClient object
@@ -125,9 +326,29 @@ class _OhsomeInfoClient(_OhsomeBaseClient):
         :param retry: Set a custom retry mechanism for requests. Be aware that ohsome-py will call the API once more
         after all retries have failed. This overcomes the problem that the cause of the retries is shadowed behind a
         RetryError by the underlying library.
+        :param response_cache: Cache for responses of the ohsome API, default: None
+        :param pool_size: Maximum number of connections to the ohsome API kept open and shared by all endpoints,
+        default: 10
+        :param metadata_cache: Cache for the metadata of the ohsome API, default: cache shared by all clients of the
+        process keeping the metadata in memory for 1 hour
+        :param compression: Compress the bodies of large requests using 'gzip' or 'deflate'. Only use it if the
+        ohsome API instance or a proxy in front of it accepts compressed requests, default: None
+        :param validate: Check boundaries and timestamps against the extent of the ohsome API given by its metadata
+        before sending requests: 'reject' raises an OhsomeException, 'drop' removes the ones outside the extent and
+        'clip' clips them to it, default: None
         """
         super(_OhsomeInfoClient, self).__init__(
-            base_api_url, log, log_dir, cache, user_agent, retry
+            base_api_url,
+            log,
+            log_dir,
+            cache,
+            user_agent,
+            retry,
+            response_cache,
+            pool_size,
+            metadata_cache,
+            compression,
+            validate,
         )
         self._parameters = None
         self._metadata_url = f"{self.base_api_url}metadata"
@@ -164,31 +385,14 @@ class _OhsomeInfoClient(_OhsomeBaseClient):
         """
         return self.metadata["apiVersion"]
 
-    @cached_property
+    @property
     def metadata(self):
         """
-        Send ohsome GET request
+        Returns the metadata of the ohsome API, which is requested once and shared by all clients using the same
+        metadata cache
         :return:
         """
-        try:
-            response = self._session().get(self._metadata_url)
-            response.raise_for_status()
-        except requests.exceptions.ConnectionError:
-            raise OhsomeException(
-                message="Connection Error: Query could not be sent. Make sure there are no network "
-                f"problems and that the ohsome API URL {self._metadata_url} is valid.",
-                url=self._metadata_url,
-                params=self._parameters,
-            )
-        except requests.exceptions.HTTPError as e:
-            raise OhsomeException(
-                message=e.response.json()["message"],
-                url=self._metadata_url,
-                params=self._parameters,
-                error_code=e.response.status_code,
-            )
-        else:
-            return response.json()
+        return self._metadata_cache.get(self._base_api_url, self._fetch_metadata)
 
 
 class _OhsomePostClient(_OhsomeBaseClient):
@@ -202,6 +406,11 @@ class _OhsomePostClient(_OhsomeBaseClient):
         cache: Optional[list] = None,
         user_agent: Optional[str] = None,
         retry: Optional[Retry] = None,
+        response_cache: Optional[ResponseCache] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        metadata_cache: Optional[MetadataCache] = None,
+        compression: Optional[str] = None,
+        validate: Optional[str] = None,
     ):
         """
         Initialize _OhsomePostClient object
@@ -213,9 +422,29 @@ class _OhsomePostClient(_OhsomeBaseClient):
         :param retry: Set a custom retry mechanism for requests. Be aware that ohsome-py will call the API once more
         after all retries have failed. This overcomes the problem that the cause of the retries is shadowed behind a
         RetryError by the underlying library.
+        :param response_cache: Cache for responses of the ohsome API, default: None
+        :param pool_size: Maximum number of connections to the ohsome API kept open and shared by all endpoints,
+        default: 10
+        :param metadata_cache: Cache for the metadata of the ohsome API, default: cache shared by all clients of the
+        process keeping the metadata in memory for 1 hour
+        :param compression: Compress the bodies of large requests using 'gzip' or 'deflate'. Only use it if the
+        ohsome API instance or a proxy in front of it accepts compressed requests, default: None
+        :param validate: Check boundaries and timestamps against the extent of the ohsome API given by its metadata
+        before sending requests: 'reject' raises an OhsomeException, 'drop' removes the ones outside the extent and
+        'clip' clips them to it, default: None
         """
         super(_OhsomePostClient, self).__init__(
-            base_api_url, log, log_dir, cache, user_agent, retry
+            base_api_url,
+            log,
+            log_dir,
+            cache,
+            user_agent,
+            retry,
+            response_cache,
+            pool_size,
+            metadata_cache,
+            compression,
+            validate,
         )
         self._parameters = None
         self._url = None
@@ -268,6 +497,13 @@ class _OhsomePostClient(_OhsomeBaseClient):
         properties: Optional[Union[str, List[str]]] = None,
         clipGeometry: Optional[bool] = None,
         endpoint: Optional[str] = None,
+        chunk_features: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        chunk_period: Optional[Union[str, pd.DateOffset]] = None,
+        stream: bool = False,
+        precision: Optional[int] = None,
+        simplify: Optional[float] = None,
+        drop_properties: bool = False,
     ) -> OhsomeResponse:
         """
         Sends request to ohsome API
@@ -319,34 +555,344 @@ class _OhsomePostClient(_OhsomeBaseClient):
 
         :param endpoint: (str) Url of the endpoint if post is called directly e.g. OhsomeClient().post("elements/count")
 
+        :param chunk_features: (int) Split 'bpolys' given as geopandas object into chunks of this number of features,
+        which are sent in parallel and merged into one response. Only for groupBy/boundary and data extraction queries.
+        Data extraction queries require clipGeometry=False, since features crossing the borders of the chunks would
+        be clipped to each chunk and returned as separate parts instead of the features of a single request.
+
+        :param chunk_bytes: (int) Split 'bpolys' given as geopandas object into chunks of this size of the GeoJSON
+        features, which are sent in parallel and merged into one response. Only for groupBy/boundary and data extraction
+        queries, see chunk_features.
+
+        :param chunk_period: (str, pandas.DateOffset) Split the time interval into sub-intervals of this period given as
+        pandas frequency string e.g. 'YS' or '6MS', which are sent in parallel and merged into one response. Versions of
+        OSM elements valid across the border of two sub-intervals are merged again. Only for full history and
+        contribution data extraction queries.
+
+        :param stream: (bool) Download the response while its features are used via OhsomeResponse.iter_features()
+        instead of loading it completely. Only for data extraction queries. Not supported in combination with chunking
+        or by the AsyncOhsomeClient.
+
+        :param precision: (int) Number of decimal places the coordinates of 'bboxes', 'bcircles' and 'bpolys' are
+        rounded to, which shortens the request for boundaries given with many digits; default: all digits
+
+        :param simplify: (float) Simplify the polygons of 'bpolys' with this tolerance in degrees while keeping the
+        borders shared by adjacent polygons free of gaps and overlaps, see shapely.coverage_simplify(); default: no
+        simplification
+
+        :param drop_properties: (bool) Send only the geometries and ids of 'bpolys' without their other columns, which
+        are not used by the ohsome API; default: False
+
         :return: Response from ohsome API (OhsomeResponse)
         """
         params = locals().copy()
-        del params["self"], params["endpoint"]
+        del params["self"], params["endpoint"], params["stream"]
+        del params["chunk_features"], params["chunk_bytes"], params["chunk_period"]
+        boundary_options = {
+            "precision": params.pop("precision"),
+            "simplify": params.pop("simplify"),
+            "drop_properties": params.pop("drop_properties"),
+        }
         self._construct_resource_url(endpoint)
-        self._format_parameters(params)
-        return self._handle_request()
+        if stream and (
+            self._transport.asynchronous
+            or any(c is not None for c in (chunk_features, chunk_bytes, chunk_period))
+        ):
+            raise OhsomeException(
+                message="Streaming is neither supported in combination with chunking nor by the AsyncOhsomeClient.",
+                url=self._url,
+                params=params,
+            )
+        if chunk_period is not None:
+            if chunk_features is not None or chunk_bytes is not None:
+                raise OhsomeException(
+                    message="Chunking by time cannot be combined with chunking of 'bpolys'.",
+                    url=self._url,
+                    params=params,
+                )
+            return self._post_time_chunks(
+                params, endpoint, chunk_period, boundary_options
+            )
+        if chunk_features is not None or chunk_bytes is not None:
+            return self._post_bpolys_chunks(
+                params, endpoint, chunk_features, chunk_bytes, boundary_options
+            )
+        self._format_parameters(params, boundary_options)
+        return self._handle_request(stream)
+
+    def _post_bpolys_chunks(
+        self,
+        params: dict,
+        endpoint: Optional[str],
+        chunk_features: Optional[int],
+        chunk_bytes: Optional[int],
+        boundary_options: Optional[dict] = None,
+    ) -> OhsomeResponse:
+        """
+        Sends the request in parallel for chunks of the 'bpolys' parameter and merges the responses
+        :param params: Parameters for request
+        :param endpoint: Url of the endpoint if post is called directly
+        :param chunk_features: Maximum number of features per chunk
+        :param chunk_bytes: Maximum size of the GeoJSON features per chunk
+        :param boundary_options: Options of the encoding of the boundary
+        :return:
+        """
+        is_extraction = self._url.rstrip("/").rsplit("/", 1)[-1] in EXTRACTION_ENDPOINTS
+        if not is_extraction and "boundary" not in find_groupby_names(self._url):
+            raise OhsomeException(
+                message="Chunking of 'bpolys' is only supported for groupBy/boundary and data extraction queries, "
+                "since other results cannot be merged.",
+                url=self._url,
+                params=params,
+            )
+        if params["bpolys"] is None:
+            raise OhsomeException(
+                message="Chunking is only supported for the 'bpolys' parameter.",
+                url=self._url,
+                params=params,
+            )
+        if self._transport.asynchronous:
+            raise OhsomeException(
+                message="Chunking is not supported by the AsyncOhsomeClient.",
+                url=self._url,
+                params=params,
+            )
+        if is_extraction and str(params.get("clipGeometry")).lower() != "false":
+            # features crossing the border of two chunks would be returned as separately clipped parts
+            raise OhsomeException(
+                message="Chunking of 'bpolys' for data extraction queries requires clipGeometry=False, since "
+                "features crossing the borders of the chunks would be clipped to each chunk.",
+                url=self._url,
+                params=params,
+            )
+
+        chunks = split_bpolys(params["bpolys"], chunk_features, chunk_bytes)
+        results = list(
+            self.post_many(
+                [
+                    {
+                        **params,
+                        "bpolys": chunk,
+                        "endpoint": endpoint,
+                        **(boundary_options or {}),
+                    }
+                    for chunk in chunks
+                ]
+            )
+        )
+        for result in results:
+            if isinstance(result, OhsomeException):
+                raise result
+        return OhsomeResponse.concat(results, drop_duplicate_features=is_extraction)
+
+    def _post_time_chunks(
+        self,
+        params: dict,
+        endpoint: Optional[str],
+        chunk_period: Union[str, pd.DateOffset],
+        boundary_options: Optional[dict] = None,
+    ) -> OhsomeResponse:
+        """
+        Sends the request in parallel for sub-intervals of the 'time' parameter and merges the responses
+        :param params: Parameters for request
+        :param endpoint: Url of the endpoint if post is called directly
+        :param chunk_period: Period of the sub-intervals
+        :param boundary_options: Options of the encoding of the boundary
+        :return:
+        """
+        components = self._url.rstrip("/").split("/")
+        if (
+            components[-1] not in EXTRACTION_ENDPOINTS
+            or "latest" in components
+            or not {"elementsFullHistory", "contributions"}.intersection(components)
+        ):
+            raise OhsomeException(
+                message="Chunking by time is only supported for full history and contribution data extraction "
+                "queries.",
+                url=self._url,
+                params=params,
+            )
+        if self._transport.asynchronous:
+            raise OhsomeException(
+                message="Chunking is not supported by the AsyncOhsomeClient.",
+                url=self._url,
+                params=params,
+            )
+        if params["time"] is None:
+            raise OhsomeException(
+                message="A time interval is required for chunking by time.",
+                url=self._url,
+                params=params,
+            )
+
+        borders = split_time_interval(
+            self._validate_time(format_time(params["time"])), chunk_period
+        )
+        results = list(
+            self.post_many(
+                [
+                    {
+                        **params,
+                        "time": f"{start},{end}",
+                        "endpoint": endpoint,
+                        **(boundary_options or {}),
+                    }
+                    for start, end in zip(borders[:-1], borders[1:])
+                ]
+            )
+        )
+        for result in results:
+            if isinstance(result, OhsomeException):
+                raise result
+
+        features = stitch_history_features(
+            [result.data["features"] for result in results], borders
+        )
+        return OhsomeResponse(
+            data={**results[0].data, "features": features}, url=results[0].url
+        )
+
+    def post_many(
+        self,
+        parameters: List[dict],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+    ) -> Iterator[Union[OhsomeResponse, OhsomeException]]:
+        """
+        Sends several requests to the ohsome API in parallel. Failed requests do not abort the other requests but
+        their OhsomeException is returned in place of the response. Not supported by the AsyncOhsomeClient, use
+        asyncio.gather() to send several requests instead.
+
+        :param parameters: List of dictionaries containing the keyword arguments of post() for each request,
+        e.g. [{"bboxes": "8.67,49.39,8.71,49.42", "time": "2020-01-01"}, {"bboxes": ...}]
+
+        :param max_workers: (int) Maximum number of requests sent at the same time; default: 10
+
+        :param ordered: (bool) If true, the results are returned in the order of the given parameters. Otherwise,
+        they are returned as soon as they are finished.
 
-    def _handle_request(self) -> OhsomeResponse:
+        :return: Iterator of responses from ohsome API (OhsomeResponse) or the exception of a failed request
+        (OhsomeException)
+        """
+        if self._transport.asynchronous:
+            raise OhsomeException(
+                message="post_many is not supported by the AsyncOhsomeClient, use asyncio.gather() instead.",
+                url=self._resource_url(),
+            )
+        return _post_parallel(
+            lambda params: copy.copy(self).post(**params),
+            parameters,
+            max_workers,
+            ordered,
+            lambda params: self._resource_url(params.get("endpoint")),
+        )
+
+    def prepare(
+        self,
+        bboxes=None,
+        bcircles=None,
+        bpolys=None,
+        endpoint: Optional[str] = None,
+        precision: Optional[int] = None,
+        simplify: Optional[float] = None,
+        drop_properties: bool = False,
+        **parameters,
+    ) -> "PreparedQuery":
+        """
+        Prepares queries of the endpoint for one boundary, which is formatted only once for all requests sent with
+        PreparedQuery.post(), e.g. for different filters and timestamps
+
+        :param bboxes: Bounding boxes, see post()
+        :param bcircles: Circles, see post()
+        :param bpolys: Polygons, see post()
+        :param endpoint: (str) Url of the endpoint if prepare is called directly e.g. OhsomeClient().prepare(...,
+        endpoint="elements/count")
+        :param precision: (int) Number of decimal places the coordinates are rounded to, see post()
+        :param simplify: (float) Tolerance of the simplification of 'bpolys', see post()
+        :param drop_properties: (bool) Send only the geometries and ids of 'bpolys', see post()
+        :param parameters: Other parameters of post(), e.g. filter, used by all requests unless they are given again
+        to PreparedQuery.post()
+
+        :return: PreparedQuery
+        """
+        query_endpoint = copy.copy(self)
+        query_endpoint._construct_resource_url(endpoint)
+        boundary = {"bboxes": bboxes, "bcircles": bcircles, "bpolys": bpolys}
+        boundary = format_boundary(
+            convert_arrays(boundary), precision, simplify, drop_properties
+        )
+        query_endpoint._validate_boundary(boundary)
+        return PreparedQuery(query_endpoint, boundary, parameters)
+
+    def _handle_request(self, stream: bool = False) -> OhsomeResponse:
         """
         Handles request to ohsome API
+        :param stream: Do not download the content of the response yet
         :return:
         """
+        if self._transport.asynchronous:
+            # the coroutine works on a copy, so the endpoint can be posted to again before it is awaited
+            return copy.copy(self)._handle_request_async()
+
+        cache_entry = None
+        if self._response_cache is not None and not stream:
+            cache_entry = self._cache_entry()
+            cached_content = self._response_cache.get(*cache_entry)
+            if cached_content is not None:
+                return OhsomeResponse(content=cached_content, url=self._url)
 
         try:
-            response = self._post_request()
+            response = self._post_request(stream)
             self._check_response(response)
+            if stream:
+                return OhsomeResponse(url=self._url, stream=response)
             data = self._get_response_data(response)
         except OhsomeException as ohsome_exception:
             if self.log:
                 ohsome_exception.log(self.log_dir)
             raise ohsome_exception
 
+        if cache_entry is not None:
+            self._response_cache.put(cache_entry[0], response.content, cache_entry[1])
         return OhsomeResponse(data=data, url=self._url)
 
-    def _post_request(self) -> Response:
+    def _cache_entry(self) -> Tuple[str, int]:
+        """
+        Get the entry of the request in the response cache
+        :return: Cache key and the current replication sequence number of the ohsome API
+        """
+        sequence_number = self._response_cache.sequence_number(
+            self._base_api_url,
+            lambda: self._fetch_metadata()["extractRegion"][
+                "replicationSequenceNumber"
+            ],
+        )
+        return ResponseCache.key(self._url, self._parameters), sequence_number
+
+    def _request_body(self) -> Tuple[Union[dict, bytes], dict]:
+        """
+        Encode the parameters as body of the request, which is compressed if the client is configured to do so
+        :return: Form data or encoded body and additional headers of the request
+        """
+        compression = self._transport.compression
+        if compression is None:
+            return self._parameters, {}
+        body = urlencode(
+            {k: v for k, v in self._parameters.items() if v is not None}
+        ).encode("utf-8")
+        if len(body) < COMPRESSION_MIN_SIZE:
+            return self._parameters, {}
+        return compress_body(body, compression), {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Content-Encoding": compression,
+        }
+
+    def _post_request(self, stream: bool = False, retry: bool = True) -> Response:
+        data, headers = self._request_body()
         try:
-            response = self._session().post(url=self._url, data=self._parameters)
+            response = self._session(retry).post(
+                url=self._url, data=data, headers=headers, stream=stream
+            )
         except KeyboardInterrupt:
             raise OhsomeException(
                 message="Keyboard Interrupt: Query was interrupted by the user.",
@@ -363,12 +909,10 @@ class _OhsomePostClient(_OhsomeBaseClient):
                 response=e.response,
             )
         except requests.exceptions.RequestException as e:
-            if isinstance(e, RetryError):
+            if isinstance(e, RetryError) and retry:
                 # retry one last time without retries, this will raise the original error instead of a cryptic retry
                 # error (or succeed)
-                self._OhsomeBaseClient__session = None
-                self._OhsomeBaseClient__retry = False
-                self._handle_request()
+                return self._post_request(stream, retry=False)
 
             raise OhsomeException(
                 message=str(e),
@@ -378,6 +922,129 @@ class _OhsomePostClient(_OhsomeBaseClient):
             )
         return response
 
+    async def _handle_request_async(self) -> OhsomeResponse:
+        """
+        Handles asynchronous request to ohsome API
+        :return:
+        """
+        # the response cache and the metadata it requests are accessed in a thread to not block the event loop
+        loop = asyncio.get_running_loop()
+        cache_entry = None
+        if self._response_cache is not None:
+            cache_entry = await loop.run_in_executor(None, self._cache_entry)
+            cached_content = await loop.run_in_executor(
+                None, self._response_cache.get, *cache_entry
+            )
+            if cached_content is not None:
+                return OhsomeResponse(content=cached_content, url=self._url)
+
+        try:
+            response = await self._post_request_async()
+            self._check_response(response)
+            data = self._get_response_data(response)
+        except OhsomeException as ohsome_exception:
+            if self.log:
+                ohsome_exception.log(self.log_dir)
+            raise ohsome_exception
+
+        if cache_entry is not None:
+            await loop.run_in_executor(
+                None,
+                self._response_cache.put,
+                cache_entry[0],
+                response.content,
+                cache_entry[1],
+            )
+        return OhsomeResponse(data=data, url=self._url)
+
+    async def _post_request_async(self) -> Response:
+        """
+        Send the request using the asynchronous transport. Retries are handled according to the retry configuration of
+        the client. If all retries failed, the last response is returned to report its error.
+        :return: Response converted to a requests.Response
+        """
+        data, headers = self._request_body()
+        if isinstance(data, dict):
+            data = {k: str(v) for k, v in data.items() if v is not None}
+        retry = self._transport.retry
+        while True:
+            try:
+                async with (await self._transport.async_session()).post(
+                    url=self._url, data=data, headers=headers
+                ) as async_response:
+                    body = await async_response.read()
+            except aiohttp.ClientError as e:
+                error = OhsomeException(
+                    message="Connection Error: Query could not be sent. Make sure there are no network "
+                    f"problems and that the ohsome API URL {self._url} is valid. {e}",
+                    url=self._url,
+                    params=self._parameters,
+                )
+                # like the requests session, retry connection errors according to the retry configuration
+                if not retry:
+                    raise error
+                try:
+                    retry = retry.increment(method="POST", url=self._url, error=e)
+                except MaxRetryError:
+                    raise error
+                await asyncio.sleep(retry.get_backoff_time())
+                continue
+
+            response = self._to_requests_response(async_response, body, data, headers)
+            if retry and retry.is_retry(
+                "POST", response.status_code, "Retry-After" in response.headers
+            ):
+                # the response is passed to count the retry as status retry and to respect its Retry-After header
+                retry_response = HTTPResponse(
+                    status=response.status_code, headers=dict(response.headers)
+                )
+                try:
+                    retry = retry.increment(
+                        method="POST", url=self._url, response=retry_response
+                    )
+                except MaxRetryError:
+                    return response
+                retry_after = (
+                    retry.get_retry_after(retry_response)
+                    if retry.respect_retry_after_header
+                    else None
+                )
+                await asyncio.sleep(
+                    retry_after if retry_after is not None else retry.get_backoff_time()
+                )
+            else:
+                return response
+
+    def _to_requests_response(
+        self,
+        async_response,
+        body: bytes,
+        data: Union[dict, bytes],
+        headers: dict,
+    ):
+        """
+        Convert an aiohttp response to a requests.Response, so it can be checked and logged like a synchronous one
+        :param async_response: aiohttp response
+        :param body: Content of the response
+        :param data: Form data or encoded body sent with the request
+        :param headers: Additional headers sent with the request
+        :return:
+        """
+        response = Response()
+        response.status_code = async_response.status
+        response.reason = async_response.reason
+        response.headers = CaseInsensitiveDict(async_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = self._url
+        response._content = body
+        response.request = requests.Request(
+            method="POST",
+            url=self._url,
+            data=data,
+            headers={"user-agent": self._transport.user_agent, **headers},
+        ).prepare()
+        return response
+
     def _check_response(self, response: Response) -> None:
         try:
             response.raise_for_status()
@@ -421,42 +1088,101 @@ class _OhsomePostClient(_OhsomeBaseClient):
                 params=self._parameters,
             )
 
-    def _format_parameters(self, params):
+    def _format_parameters(self, params, boundary_options: Optional[dict] = None):
         """
         Check and format parameters of the query
         :param params: Parameters for request
+        :param boundary_options: Options of the encoding of the boundary, see format_boundary()
         :return:
         """
         self._parameters = params.copy()
 
         self._parameters = convert_arrays(self._parameters)
 
-        self._parameters = format_boundary(self._parameters)
+        self._parameters = format_boundary(self._parameters, **(boundary_options or {}))
+        self._validate_boundary(self._parameters)
 
+        self._format_query_parameters()
+
+    def _format_query_parameters(self) -> None:
+        """
+        Format the parameters of the query other than the boundary
+        :return:
+        """
         if self._parameters.get("time") is not None:
-            self._parameters["time"] = format_time(self._parameters.get("time"))
+            self._parameters["time"] = self._validate_time(
+                format_time(self._parameters.get("time"))
+            )
 
         self._parameters = format_list_parameters(self._parameters)
 
+    def _validate_boundary(self, params: dict) -> None:
+        """
+        Check the formatted boundary against the spatial extent of the ohsome API if the client validates requests
+        :param params: Parameters containing the formatted boundary, which is replaced if boundaries are dropped or
+        clipped
+        :return:
+        """
+        if self._validate is not None:
+            validate_boundary(
+                params, self._extract_region()["spatialExtent"], self._validate
+            )
+
+    def _validate_time(self, time: str) -> str:
+        """
+        Check the formatted time parameter against the temporal extent of the ohsome API if the client validates
+        requests
+        :param time: Formatted time parameter
+        :return:
+        """
+        if self._validate is None:
+            return time
+        # full history, contribution and user queries refer to the interval between two timestamps
+        components = self._url.rstrip("/").split("/")
+        min_timestamps = (
+            2
+            if {"elementsFullHistory", "contributions", "users"}.intersection(
+                components
+            )
+            else 1
+        )
+        return validate_time(
+            time,
+            self._extract_region()["temporalExtent"],
+            self._validate,
+            min_timestamps=min_timestamps,
+        )
+
+    def _extract_region(self) -> dict:
+        """
+        Spatial and temporal extent of the data of the ohsome API given by its cached metadata
+        :return:
+        """
+        return self._metadata_cache.get(self._base_api_url, self._fetch_metadata)[
+            "extractRegion"
+        ]
+
     def _construct_resource_url(self, endpoint=None):
         """
         Constructs the full url of the ohsome request
         :param endpoint: Endpoint of ohsome API
         :return:
         """
+        self._url = self._resource_url(endpoint)
+
+    def _resource_url(self, endpoint=None) -> str:
+        """
+        Full url of the ohsome request without setting it
+        :param endpoint: Endpoint of ohsome API
+        :return:
+        """
         if endpoint:
-            self._url = urljoin(self._base_api_url, endpoint.strip("/"))
-        else:
-            self._url = urljoin(self._base_api_url, "/".join(self._cache))
+            return urljoin(self._base_api_url, endpoint.strip("/"))
+        return urljoin(self._base_api_url, "/".join(self._cache))
 
     def _(self, name):
         # Enables method chaining
-        return _OhsomePostClient(
-            base_api_url=None,
-            log=DEFAULT_LOG,
-            log_dir=DEFAULT_LOG_DIR,
-            cache=self._cache + [name],
-        )
+        return self._endpoint(_OhsomePostClient, name)
 
     def __getattr__(self, name):
         valid_endpoints = [
@@ -485,91 +1211,281 @@ class _OhsomePostClient(_OhsomeBaseClient):
             return self._(name)
 
 
+class PreparedQuery:
+    """
+    Queries of an endpoint for one boundary, which is formatted once by _OhsomePostClient.prepare() and reused by all
+    requests
+    """
+
+    def __init__(
+        self, endpoint: _OhsomePostClient, boundary: dict, parameters: dict
+    ) -> None:
+        """
+        Initialize the PreparedQuery class.
+        :param endpoint: Endpoint the requests are sent to
+        :param boundary: Formatted boundary parameters
+        :param parameters: Parameters of all requests unless they are given again
+        """
+        self._endpoint = endpoint
+        self._boundary = boundary
+        self._check_parameters(parameters)
+        self._default_parameters = parameters
+
+    @property
+    def url(self) -> str:
+        """Url of the endpoint"""
+        return self._endpoint._url
+
+    def post(self, stream: bool = False, **parameters) -> OhsomeResponse:
+        """
+        Sends a request for the prepared boundary to ohsome API. The boundary is not formatted again, only the other
+        parameters are. If the query was prepared by an endpoint of the AsyncOhsomeClient, an awaitable is returned.
+
+        :param stream: (bool) Download the response while its features are used, see post() of the endpoint
+        :param parameters: Parameters of post() other than the boundary and its encoding options, e.g. time or filter,
+        which override the ones given to prepare()
+
+        :return: Response from ohsome API (OhsomeResponse)
+        """
+        self._check_parameters(parameters)
+        endpoint = copy.copy(self._endpoint)
+        endpoint._parameters = {
+            **convert_arrays({**self._default_parameters, **parameters}),
+            **self._boundary,
+        }
+        if stream and endpoint._transport.asynchronous:
+            raise OhsomeException(
+                message="Streaming is not supported by the AsyncOhsomeClient.",
+                url=self.url,
+                params=endpoint._parameters,
+            )
+        endpoint._format_query_parameters()
+        return endpoint._handle_request(stream)
+
+    def post_many(
+        self,
+        parameters: List[dict],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+    ) -> Iterator[Union[OhsomeResponse, OhsomeException]]:
+        """
+        Sends several requests for the prepared boundary in parallel, like the post_many method of the endpoint. Not
+        supported by the AsyncOhsomeClient.
+
+        :param parameters: List of dictionaries containing the keyword arguments of PreparedQuery.post() for each
+        request, e.g. [{"filter": "building=*"}, {"filter": "highway=*"}]
+
+        :param max_workers: (int) Maximum number of requests sent at the same time; default: 10
+
+        :param ordered: (bool) If true, the results are returned in the order of the given parameters. Otherwise,
+        they are returned as soon as they are finished.
+
+        :return: Iterator of responses from ohsome API (OhsomeResponse) or the exception of a failed request
+        (OhsomeException)
+        """
+        if self._endpoint._transport.asynchronous:
+            raise OhsomeException(
+                message="post_many is not supported by the AsyncOhsomeClient, use asyncio.gather() instead.",
+                url=self.url,
+            )
+        return _post_parallel(
+            lambda params: self.post(**params),
+            parameters,
+            max_workers,
+            ordered,
+            lambda params: self.url,
+        )
+
+    def _check_parameters(self, parameters: dict) -> None:
+        """
+        Check that only parameters other than the boundary are given
+        :param parameters: Parameters of a request
+        :return:
+        """
+        unknown_parameters = set(parameters).difference(QUERY_PARAMETERS)
+        if unknown_parameters:
+            raise OhsomeException(
+                message=f"The parameters {sorted(unknown_parameters)} cannot be used with a prepared query. Only "
+                f"{QUERY_PARAMETERS} can be given, the boundary is fixed when the query is prepared.",
+                url=self.url,
+                params=parameters,
+            )
+
+    def __repr__(self):
+        return f"<PreparedQuery: {self.url}>"
+
+
+def _post_parallel(
+    post: Callable[[dict], OhsomeResponse],
+    parameters: List[dict],
+    max_workers: int,
+    ordered: bool,
+    url: Callable[[dict], str],
+) -> Iterator[Union[OhsomeResponse, OhsomeException]]:
+    """
+    Sends several requests in parallel using a thread pool
+    :param post: Function sending one request given its parameters
+    :param parameters: Parameters of each request
+    :param max_workers: Maximum number of requests sent at the same time
+    :param ordered: Return the results in the order of the parameters instead of as soon as they are finished
+    :param url: Function returning the url of one request given its parameters, which is reported by the
+    OhsomeException of other errors
+    :return: Iterator of responses or the exceptions of failed requests
+    """
+
+    def post_or_exception(params: dict) -> Union[OhsomeResponse, OhsomeException]:
+        try:
+            return post(params)
+        except OhsomeException as ohsome_exception:
+            return ohsome_exception
+        except Exception as e:
+            # other errors, e.g. of parameters that cannot be formatted, must not abort the other requests either
+            ohsome_exception = OhsomeException(
+                message=f"{type(e).__name__}: {e}", url=url(params), params=params
+            )
+            ohsome_exception.__cause__ = e
+            return ohsome_exception
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(post_or_exception, params) for params in parameters]
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+
+
 class OhsomeClient(_OhsomeInfoClient, _OhsomePostClient):
     """Class to handle requests to the ohsome API"""
 
     @property
     def elements(self):
         """Return elements objects."""
-        return _OhsomeClientElements(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["elements"],
-        )
+        return self._endpoint(_OhsomeClientElements, "elements")
 
     @property
     def elementsFullHistory(self):
         """Return full history elements."""
-        return _OhsomeClientElementsFullHistory(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["elementsFullHistory"],
-        )
+        return self._endpoint(_OhsomeClientElementsFullHistory, "elementsFullHistory")
 
     @property
     def contributions(self):
         """Return contrubioins object."""
-        return _OhsomeClientContributions(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["contributions"]
-        )
+        return self._endpoint(_OhsomeClientContributions, "contributions")
 
     @property
     def users(self):
         """Return users object."""
-        return _OhsomeClientUsers(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["users"]
-        )
+        return self._endpoint(_OhsomeClientUsers, "users")
 
     def __repr__(self):
         return f"<OhsomeClient: {self._base_api_url}>"
 
 
+class AsyncOhsomeClient(OhsomeClient):
+    """
+    Class to handle asynchronous requests to the ohsome API
+
+    The endpoints are the same as for the OhsomeClient, but their post() method returns an awaitable. All endpoints
+    share the connection pool of the client, which should be closed after use, e.g. by using the client as an
+    asynchronous context manager. The response cache is read and written in a thread pool, but the metadata needed
+    by the properties of the client or by the validation of requests is requested synchronously, which blocks the
+    event loop once per metadata cache period.
+    """
+
+    def __init__(
+        self,
+        base_api_url: Optional[str] = None,
+        log: Optional[bool] = DEFAULT_LOG,
+        log_dir: Optional[Union[str, Path]] = DEFAULT_LOG_DIR,
+        cache: Optional[list] = None,
+        user_agent: Optional[str] = None,
+        retry: Optional[Retry] = None,
+        response_cache: Optional[ResponseCache] = None,
+        pool_size: int = 100,
+        metadata_cache: Optional[MetadataCache] = None,
+        compression: Optional[str] = None,
+        validate: Optional[str] = None,
+    ):
+        """
+        Initialize AsyncOhsomeClient object
+        :param base_api_url: URL of ohsome API instance
+        :param log: Log failed queries, default:True
+        :param log_dir: Directory for log files, default: ./ohsome_log
+        :param cache: Cache for endpoint components
+        :param user_agent: User agent passed with the request to the ohsome API
+        :param retry: Set a custom retry mechanism for requests.
+        :param response_cache: Cache for responses of the ohsome API, default: None
+        :param pool_size: Maximum number of simultaneous connections to the ohsome API shared by all endpoints,
+        default: 100
+        :param metadata_cache: Cache for the metadata of the ohsome API, default: cache shared by all clients of the
+        process keeping the metadata in memory for 1 hour
+        :param compression: Compress the bodies of large requests using 'gzip' or 'deflate'. Only use it if the
+        ohsome API instance or a proxy in front of it accepts compressed requests, default: None
+        :param validate: Check boundaries and timestamps against the extent of the ohsome API given by its metadata
+        before sending requests: 'reject' raises an OhsomeException, 'drop' removes the ones outside the extent and
+        'clip' clips them to it, default: None
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "The AsyncOhsomeClient requires aiohttp. Install it using 'pip install ohsome[async]'."
+            )
+        super(AsyncOhsomeClient, self).__init__(
+            base_api_url,
+            log,
+            log_dir,
+            cache,
+            user_agent,
+            retry,
+            response_cache,
+            pool_size,
+            metadata_cache,
+            compression,
+            validate,
+        )
+        self._transport.asynchronous = True
+
+    async def close(self) -> None:
+        """Close all connections of the client."""
+        await self._transport.close_async()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return f"<AsyncOhsomeClient: {self._base_api_url}>"
+
+
 class _OhsomeClientElements(_OhsomeBaseClient):
     """Subclass of _OhsomePostClient to define endpoints of ohsome API"""
 
     @property
     def area(self):
-        return _OhsomeClientElementsAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["area"]
-        )
+        return self._endpoint(_OhsomeClientElementsAggregated, "area")
 
     @property
     def count(self):
-        return _OhsomeClientElementsAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["count"]
-        )
+        return self._endpoint(_OhsomeClientElementsAggregated, "count")
 
     @property
     def length(self):
-        return _OhsomeClientElementsAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["length"]
-        )
+        return self._endpoint(_OhsomeClientElementsAggregated, "length")
 
     @property
     def perimeter(self):
-        return _OhsomeClientElementsAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["perimeter"]
-        )
+        return self._endpoint(_OhsomeClientElementsAggregated, "perimeter")
 
     @property
     def bbox(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["bbox"]
-        )
+        return self._endpoint(_OhsomePostClient, "bbox")
 
     @property
     def centroid(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["centroid"]
-        )
+        return self._endpoint(_OhsomePostClient, "centroid")
 
     @property
     def geometry(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["geometry"]
-        )
+        return self._endpoint(_OhsomePostClient, "geometry")
 
 
 class _OhsomeClientElementsAggregated(_OhsomePostClient):
@@ -577,45 +1493,29 @@ class _OhsomeClientElementsAggregated(_OhsomePostClient):
 
     @property
     def density(self):
-        return _OhsomeClientElementsAggregatedDensity(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["density"]
-        )
+        return self._endpoint(_OhsomeClientElementsAggregatedDensity, "density")
 
     @property
     def groupByBoundary(self):
-        return _OhsomeClientElementsAggregatedDensityGroupByBoundary(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
+        return self._endpoint(
+            _OhsomeClientElementsAggregatedDensityGroupByBoundary, "groupBy", "boundary"
         )
 
     @property
     def ratio(self):
-        return _OhsomeClientElementsAggregatedRatio(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["ratio"]
-        )
+        return self._endpoint(_OhsomeClientElementsAggregatedRatio, "ratio")
 
     @property
     def groupByTag(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "tag"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "tag")
 
     @property
     def groupByType(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "type"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "type")
 
     @property
     def groupByKey(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "key"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "key")
 
 
 class _OhsomeClientElementsAggregatedDensity(_OhsomePostClient):
@@ -623,27 +1523,17 @@ class _OhsomeClientElementsAggregatedDensity(_OhsomePostClient):
 
     @property
     def groupByBoundary(self):
-        return _OhsomeClientElementsAggregatedDensityGroupByBoundary(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
+        return self._endpoint(
+            _OhsomeClientElementsAggregatedDensityGroupByBoundary, "groupBy", "boundary"
         )
 
     @property
     def groupByTag(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "tag"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "tag")
 
     @property
     def groupByType(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "type"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "type")
 
 
 class _OhsomeClientElementsAggregatedDensityGroupByBoundary(_OhsomePostClient):
@@ -651,9 +1541,7 @@ class _OhsomeClientElementsAggregatedDensityGroupByBoundary(_OhsomePostClient):
 
     @property
     def groupByTag(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "tag"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "tag")
 
 
 class _OhsomeClientElementsAggregatedRatio(_OhsomePostClient):
@@ -661,12 +1549,7 @@ class _OhsomeClientElementsAggregatedRatio(_OhsomePostClient):
 
     @property
     def groupByBoundary(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "boundary")
 
 
 class _OhsomeClientElementsFullHistory(_OhsomeBaseClient):
@@ -674,21 +1557,15 @@ class _OhsomeClientElementsFullHistory(_OhsomeBaseClient):
 
     @property
     def bbox(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["bbox"]
-        )
+        return self._endpoint(_OhsomePostClient, "bbox")
 
     @property
     def centroid(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["centroid"]
-        )
+        return self._endpoint(_OhsomePostClient, "centroid")
 
     @property
     def geometry(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["geometry"]
-        )
+        return self._endpoint(_OhsomePostClient, "geometry")
 
 
 class _OhsomeClientContributions(_OhsomeBaseClient):
@@ -696,61 +1573,39 @@ class _OhsomeClientContributions(_OhsomeBaseClient):
 
     @property
     def bbox(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["bbox"]
-        )
+        return self._endpoint(_OhsomePostClient, "bbox")
 
     @property
     def centroid(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["centroid"]
-        )
+        return self._endpoint(_OhsomePostClient, "centroid")
 
     @property
     def geometry(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["geometry"]
-        )
+        return self._endpoint(_OhsomePostClient, "geometry")
 
     @property
     def latest(self):
-        return _OhsomeClientContributionsLatest(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["latest"]
-        )
+        return self._endpoint(_OhsomeClientContributionsLatest, "latest")
 
     @property
     def count(self):
-        return _OhsomeClientContributionsAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["count"]
-        )
+        return self._endpoint(_OhsomeClientContributionsAggregated, "count")
 
 
 class _OhsomeClientContributionsAggregated(_OhsomePostClient):
     @property
     def density(self):
-        return _OhsomeClientContributionsAggregatedDensity(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["density"]
-        )
+        return self._endpoint(_OhsomeClientContributionsAggregatedDensity, "density")
 
     @property
     def groupByBoundary(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "boundary")
 
 
 class _OhsomeClientContributionsAggregatedDensity(_OhsomePostClient):
     @property
     def groupByBoundary(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "boundary")
 
 
 class _OhsomeClientContributionsLatest(_OhsomePostClient):
@@ -758,27 +1613,19 @@ class _OhsomeClientContributionsLatest(_OhsomePostClient):
 
     @property
     def bbox(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["bbox"]
-        )
+        return self._endpoint(_OhsomePostClient, "bbox")
 
     @property
     def centroid(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["centroid"]
-        )
+        return self._endpoint(_OhsomePostClient, "centroid")
 
     @property
     def geometry(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["geometry"]
-        )
+        return self._endpoint(_OhsomePostClient, "geometry")
 
     @property
     def count(self):
-        return _OhsomeClientContributionsAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["count"]
-        )
+        return self._endpoint(_OhsomeClientContributionsAggregated, "count")
 
 
 class _OhsomeClientUsers(_OhsomeBaseClient):
@@ -786,9 +1633,7 @@ class _OhsomeClientUsers(_OhsomeBaseClient):
 
     @property
     def count(self):
-        return _OhsomeClientUsersAggregated(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["count"]
-        )
+        return self._endpoint(_OhsomeClientUsersAggregated, "count")
 
 
 class _OhsomeClientUsersAggregated(_OhsomePostClient):
@@ -796,39 +1641,23 @@ class _OhsomeClientUsersAggregated(_OhsomePostClient):
 
     @property
     def density(self):
-        return _OhsomeClientUsersAggregatedDensity(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["density"]
-        )
+        return self._endpoint(_OhsomeClientUsersAggregatedDensity, "density")
 
     @property
     def groupByBoundary(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "boundary")
 
     @property
     def groupByTag(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "tag"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "tag")
 
     @property
     def groupByType(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "type"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "type")
 
     @property
     def groupByKey(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "key"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "key")
 
 
 class _OhsomeClientUsersAggregatedDensity(_OhsomePostClient):
@@ -836,24 +1665,12 @@ class _OhsomeClientUsersAggregatedDensity(_OhsomePostClient):
 
     @property
     def groupByBoundary(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "boundary"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "boundary")
 
     @property
     def groupByTag(self):
-        return _OhsomePostClient(
-            self._base_api_url, self.log, self.log_dir, self._cache + ["groupBy", "tag"]
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "tag")
 
     @property
     def groupByType(self):
-        return _OhsomePostClient(
-            self._base_api_url,
-            self.log,
-            self.log_dir,
-            self._cache + ["groupBy", "type"],
-        )
+        return self._endpoint(_OhsomePostClient, "groupBy", "type")
@@ -1,10 +1,48 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """Constants and default values"""
+import datetime as dt
 from pathlib import Path
 
 OHSOME_BASE_API_URL = "https://api.ohsome.org/v1/"
 DEFAULT_LOG = True
 DEFAULT_LOG_DIR = Path("./ohsome_log")
+DEFAULT_CACHE_DIR = Path("./ohsome_cache")
+DEFAULT_CACHE_MAX_SIZE = 1024**3
+DEFAULT_CACHE_CHECK_INTERVAL = dt.timedelta(minutes=1)
+DEFAULT_METADATA_TTL = dt.timedelta(hours=1)
+# number of parallel requests, equals the default number of connections kept open to the ohsome API
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_POOL_SIZE = 10
+# encodings of request bodies and the ones accepted for responses
+REQUEST_COMPRESSIONS = ["gzip", "deflate"]
+ACCEPT_ENCODING = "gzip, deflate"
+# smaller request bodies are sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+# handling of boundaries and timestamps outside the extent of the ohsome API by the client
+VALIDATION_MODES = ["reject", "drop", "clip"]
+EXTRACTION_ENDPOINTS = ["bbox", "centroid", "geometry"]
+# parameters of the ohsome API other than the boundary
+QUERY_PARAMETERS = [
+    "time",
+    "filter",
+    "filter2",
+    "format",
+    "showMetadata",
+    "timeout",
+    "groupByKey",
+    "groupByKeys",
+    "groupByValues",
+    "properties",
+    "clipGeometry",
+]
+# geometries converted from GeoJSON at once
+GEOJSON_BATCH_SIZE = 10000
+# features converted to Arrow and written to parquet files at once
+DEFAULT_ROW_GROUP_SIZE = 100000
+# features per GeoDataFrame of OhsomeResponse.iter_dataframes()
+DEFAULT_DATAFRAME_CHUNK_SIZE = 100000
+# bytes read at once from streamed responses
+STREAM_CHUNK_SIZE = 1024 * 1024
 # update version in pyproject.toml as well
 OHSOME_VERSION = "0.3.0"
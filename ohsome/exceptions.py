@@ -4,7 +4,9 @@
 """Class to handle error codes of ohsome API"""
 
 import datetime as dt
+import gzip
 import json
+import zlib
 from pathlib import Path
 
 from curlify2 import Curlify
@@ -41,7 +43,17 @@ class OhsomeException(Exception):
     def log_curl(self, log_dir: Path, log_file_name: str) -> None:
         """Log the respective curl command for the request for easy debugging and sharing."""
         log_file = log_dir / f"{log_file_name}_curl.sh"
-        curl = Curlify(self.response.request)
+        request = self.response.request
+        if "Content-Encoding" in request.headers:
+            # log the uncompressed body, which is readable and can be sent by curl as is
+            request = request.copy()
+            encoding = request.headers.pop("Content-Encoding")
+            if encoding == "gzip":
+                request.body = gzip.decompress(request.body)
+            else:
+                request.body = zlib.decompress(request.body)
+            request.prepare_content_length(request.body)
+        curl = Curlify(request)
         curl_command = curl.to_curl()
         with log_file.open(mode="w") as dst:
             dst.write(curl_command)
@@ -3,17 +3,37 @@
 
 """Ohsome utility functions"""
 
+import bz2
+import codecs
 import datetime
+import gzip
 import json
+import lzma
 import re
-from typing import Tuple, Union, List, Optional
+import sys
+import zlib
+from pathlib import Path
+from typing import Tuple, Union, List, Optional, Iterable, Iterator
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 import shapely
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ohsome import OhsomeException
+from ohsome.constants import GEOJSON_BATCH_SIZE
+
+FEATURES_START = re.compile(r'"features"\s*:\s*\[')
+SEPARATORS = re.compile(r"[\s,]*")
+POLYGONAL_TYPES = {"Polygon", "MultiPolygon"}
+ISO_DURATION = re.compile(
+    r"P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?"
+)
 
 
 def convert_arrays(params: dict) -> dict:
@@ -33,7 +53,8 @@ def convert_arrays(params: dict) -> dict:
 
 def format_time(time: any) -> str:
     """
-    Formats the 'time' parameter
+    Formats the 'time' parameter. Lists of timestamps are sorted and deduplicated. At least three regularly spaced
+    timestamps given as datetime objects, e.g. a pandas.DatetimeIndex, are sent as interval 'start/end/period'.
     :param time:
     :return:
     """
@@ -41,29 +62,138 @@ def format_time(time: any) -> str:
         return time
     if isinstance(time, datetime.datetime) or isinstance(time, datetime.date):
         return time.isoformat()
-    elif isinstance(time, list):
-        return ",".join([format_time(t) for t in time])
-    if isinstance(time, pd.DatetimeIndex) or isinstance(time, pd.Series):
-        return format_time(time.to_list())
-    else:
+    if not isinstance(time, (list, tuple, pd.DatetimeIndex, pd.Series)):
         raise ValueError(
             f"The given time format {type(time)} is not supported. Feel free to open an issue in "
             "the ohsome-py repository for a feature request."
         )
 
+    if isinstance(time, pd.DatetimeIndex):
+        return format_timestamps(time)
+    if isinstance(time, pd.Series) and pd.api.types.is_datetime64_any_dtype(time):
+        return format_timestamps(pd.DatetimeIndex(time))
+    values = list(time)
+    if values and all(isinstance(t, datetime.datetime) for t in values):
+        try:
+            return format_timestamps(pd.DatetimeIndex(values))
+        except (ValueError, TypeError):
+            # e.g. timestamps of different time zones
+            pass
+    strings = []
+    for t in values:
+        if isinstance(t, str):
+            strings.append(t)
+        elif isinstance(t, datetime.datetime) or isinstance(t, datetime.date):
+            strings.append(t.isoformat())
+        else:
+            raise ValueError(
+                f"The given time format {type(t)} is not supported. Feel free to open an issue in "
+                "the ohsome-py repository for a feature request."
+            )
+    return ",".join(sort_time_strings(strings))
+
+
+def format_timestamps(timestamps: pd.DatetimeIndex) -> str:
+    """
+    Formats timestamps as interval 'start/end/period' if they are regularly spaced, otherwise as comma separated list
+    :param timestamps: Timestamps in any order, which may contain duplicates
+    :return:
+    """
+    timestamps = timestamps.dropna().unique().sort_values()
+    if timestamps.tz is None:
+        period = iso_period(timestamps)
+    else:
+        # the interval is stepped through in UTC, in which local timestamps are not regular across DST changes
+        utc = timestamps.tz_convert("UTC")
+        period = iso_period(utc)
+        if period is not None:
+            offset = _period_offset(period)
+            steps = pd.DatetimeIndex([utc[0] + i * offset for i in range(len(utc))])
+            if not steps.equals(utc):
+                period = None
+    if period is not None:
+        # the interval is shorter than the list of the at least three timestamps
+        return f"{timestamps[0].isoformat()}/{timestamps[-1].isoformat()}/{period}"
+    return ",".join([t.isoformat() for t in timestamps.to_list()])
+
 
-def format_boundary(params: dict) -> dict:
+def iso_period(timestamps: pd.DatetimeIndex) -> Optional[str]:
+    """
+    Detects the period of regularly spaced timestamps
+    :param timestamps: Sorted unique timestamps
+    :return: Period as ISO-8601 duration, e.g. 'P1M' or 'PT6H', or None if the timestamps are not regularly spaced
+    """
+    if len(timestamps) < 3:
+        return None
+
+    # calendar months and years differ in length, so they are detected from the components of the timestamps
+    months = np.diff(timestamps.year * 12 + timestamps.month)
+    time_of_month = (
+        timestamps - timestamps.normalize() + pd.to_timedelta(timestamps.day, unit="D")
+    )
+    if (
+        (months == months[0]).all()
+        and months[0] > 0
+        and (time_of_month == time_of_month[0]).all()
+        and timestamps[0].day <= 28
+    ):
+        if months[0] % 12 == 0:
+            return f"P{months[0] // 12}Y"
+        return f"P{months[0]}M"
+
+    differences = timestamps[1:] - timestamps[:-1]
+    if not (differences == differences[0]).all():
+        return None
+    seconds = differences[0].total_seconds()
+    if seconds != int(seconds):
+        return None
+    seconds = int(seconds)
+    if seconds % 86400 == 0:
+        return f"P{seconds // 86400}D"
+    if seconds % 3600 == 0:
+        return f"PT{seconds // 3600}H"
+    if seconds % 60 == 0:
+        return f"PT{seconds // 60}M"
+    return f"PT{seconds}S"
+
+
+def sort_time_strings(strings: List[str]) -> List[str]:
+    """
+    Sorts ISO-8601 timestamps given as strings in time and drops duplicates, keeping the strings as they are given
+    :param strings: Timestamps, if any of them cannot be parsed, only identical strings are dropped
+    :return:
+    """
+    try:
+        parsed = pd.Series(pd.to_datetime(strings, format="ISO8601", utc=True))
+    except (ValueError, TypeError):
+        return list(dict.fromkeys(strings))
+    return [
+        strings[i] for i in parsed.drop_duplicates().sort_values(kind="stable").index
+    ]
+
+
+def format_boundary(
+    params: dict,
+    precision: Optional[int] = None,
+    simplify: Optional[float] = None,
+    drop_properties: bool = False,
+) -> dict:
     """
     Formats the boundary parameters 'bboxes', 'bcircles' and 'bpolys'
     :param params:
+    :param precision: Number of decimal places coordinates are rounded to
+    :param simplify: Tolerance of the simplification of 'bpolys' in degrees
+    :param drop_properties: Encode only the geometries and ids of 'bpolys'
     :return:
     """
     if params["bboxes"] is not None:
-        params["bboxes"] = format_bboxes(params["bboxes"])
+        params["bboxes"] = format_bboxes(params["bboxes"], precision)
     elif params["bpolys"] is not None:
-        params["bpolys"] = format_bpolys(params["bpolys"])
+        params["bpolys"] = format_bpolys(
+            params["bpolys"], precision, simplify, drop_properties
+        )
     elif params["bcircles"] is not None:
-        params["bcircles"] = format_bcircles(params["bcircles"])
+        params["bcircles"] = format_bcircles(params["bcircles"], precision)
     else:
         raise OhsomeException(
             message="No valid boundary parameter is given. Specify one of the parameters 'bboxes', 'bpolys' or "
@@ -75,6 +205,61 @@ def format_boundary(params: dict) -> dict:
     return params
 
 
+def format_numbers(
+    values: Iterable[Union[int, float, str]], precision: Optional[int] = None
+) -> List[str]:
+    """
+    Formats numbers as strings, floats are rounded to the given precision
+    :param values: Numbers, strings are kept as they are
+    :param precision: Number of decimal places, by default floats are formatted with as many digits as needed
+    :return:
+    """
+    return [
+        str(
+            round(x, precision) if precision is not None and isinstance(x, float) else x
+        )
+        for x in values
+    ]
+
+
+def format_columns(
+    columns: List[pd.Series],
+    ids: Optional[pd.Index] = None,
+    precision: Optional[int] = None,
+) -> str:
+    """
+    Formats coordinate columns as boundary string 'id1:x1,y1,...|id2:x2,y2,...' without creating a Series per row
+    :param columns: Columns of the coordinates of the boundaries
+    :param ids: Ids of the boundaries
+    :param precision: Number of decimal places floats are rounded to
+    :return:
+    """
+    strings = []
+    for column in columns:
+        if precision is not None and pd.api.types.is_float_dtype(column):
+            column = column.round(precision)
+        strings.append(map(str, column.tolist()))
+    rows = map(",".join, zip(*strings))
+    if ids is not None:
+        rows = (f"{boundary_id}:{row}" for boundary_id, row in zip(ids.tolist(), rows))
+    return "|".join(rows)
+
+
+def _row_columns(df: pd.DataFrame, names: List[str]) -> List[pd.Series]:
+    """
+    Gets columns with the data type their values have in the rows of the data frame, e.g. integers are converted to
+    floats if the data frame contains floats as well
+    :param df: Data frame
+    :param names: Names of the columns
+    :return:
+    """
+    columns = [df[name] for name in names]
+    row_dtype = df.iloc[:0].to_numpy().dtype
+    if row_dtype != object:
+        columns = [column.astype(row_dtype) for column in columns]
+    return columns
+
+
 def format_bcircles(
     bcircles: Union[
         str,
@@ -85,7 +270,8 @@ def format_bcircles(
         dict,
         gpd.GeoDataFrame,
         pd.DataFrame,
-    ]
+    ],
+    precision: Optional[int] = None,
 ) -> str:
     """
     Formats bcircles parameter to comply with ohsome API
@@ -95,15 +281,18 @@ def format_bcircles(
         list ([[id1:lon1,lat1,radius],[id2:lon1,lat1,radius],...]
         pandas.DataFrame with columns 'lon', 'lat' and 'radius' or
         geopandas.GeoDataFrame with geometry column with Point geometries only and a column 'radius'.
+    :param precision: Number of decimal places the coordinates and radii given as floats are rounded to
     :return:
     """
     if isinstance(bcircles, str):
         return bcircles
     elif isinstance(bcircles, list) or isinstance(bcircles, tuple):
         if isinstance(bcircles[0], list):
-            return "|".join([",".join([str(x) for x in box]) for box in bcircles])
+            return "|".join(
+                [",".join(format_numbers(box, precision)) for box in bcircles]
+            )
         elif isinstance(bcircles[1], float) or isinstance(bcircles[1], int):
-            return ",".join([str(x) for x in bcircles])
+            return ",".join(format_numbers(bcircles, precision))
         elif isinstance(bcircles[0], str) and (bcircles[0].find(",") != -1):
             return "|".join([str(c) for c in bcircles])
         else:
@@ -111,7 +300,7 @@ def format_bcircles(
     elif isinstance(bcircles, dict):
         return "|".join(
             [
-                f"{bcircle_id}:" + ",".join([str(c) for c in coords])
+                f"{bcircle_id}:" + ",".join(format_numbers(coords, precision))
                 for bcircle_id, coords in bcircles.items()
             ]
         )
@@ -123,18 +312,18 @@ def format_bcircles(
                 message="The geometry of the 'bcircles' GeoDataFrame may only include 'Point' geometry types and "
                 "requires a 'radius' column."
             )
-        formatted = bcircles.apply(
-            lambda r: f"{int(r.name)}:{r.geometry.x},{r.geometry.y},{r['radius']}",
-            axis=1,
+        return format_columns(
+            [bcircles.geometry.x, bcircles.geometry.y, bcircles["radius"]],
+            bcircles.index.astype(int),
+            precision,
         )
-        return "|".join(formatted.to_list())
     elif isinstance(bcircles, pd.DataFrame):
         try:
-            formatted = bcircles.apply(
-                lambda r: f"{int(r.name)}:{r['lon']},{r['lat']},{r['radius']}",
-                axis=1,
+            return format_columns(
+                _row_columns(bcircles, ["lon", "lat", "radius"]),
+                bcircles.index.astype(int),
+                precision,
             )
-            return "|".join(formatted.to_list())
         except KeyError as e:
             raise OhsomeException(
                 message=f"Column {e} is missing in the dataframe provided as 'bboxes'."
@@ -152,7 +341,8 @@ def format_bboxes(
         List[float],
         List[List[str]],
         List[List[float]],
-    ]
+    ],
+    precision: Optional[int] = None,
 ) -> str:
     """
     Formats bboxes parameter to comply with ohsome API
@@ -162,13 +352,16 @@ def format_bboxes(
         list: [[id1,lon1,lat1,lon2,lat2],[id2,lon1,lat1,lon2,lat2],...] or [lon1,lat1,lon2,lat2] if it's just one box
         pandas.DataFrame: with columns minx, miny, maxx, maxy. These columns can be created from a GeoDataFrame using
         the 'GeoDataFrame.bounds' method.
+    :param precision: Number of decimal places the coordinates given as floats are rounded to
     :return: Bounding boxes formatted as a string compliant with ohsome API
     """
     if isinstance(bboxes, list) or isinstance(bboxes, tuple):
         if isinstance(bboxes[0], list):
-            return "|".join([",".join([str(x) for x in box]) for box in bboxes])
+            return "|".join(
+                [",".join(format_numbers(box, precision)) for box in bboxes]
+            )
         elif isinstance(bboxes[1], float) or isinstance(bboxes[1], int):
-            return ",".join([str(x) for x in bboxes])
+            return ",".join(format_numbers(bboxes, precision))
         elif isinstance(bboxes[0], str) and (bboxes[0].find(",") != -1):
             return "|".join([str(c) for c in bboxes])
         else:
@@ -176,7 +369,7 @@ def format_bboxes(
     elif isinstance(bboxes, dict):
         return "|".join(
             [
-                f"{bbox_id}:" + ",".join([str(c) for c in coords])
+                f"{bbox_id}:" + ",".join(format_numbers(coords, precision))
                 for bbox_id, coords in bboxes.items()
             ]
         )
@@ -188,11 +381,11 @@ def format_bboxes(
         )
     elif isinstance(bboxes, pd.DataFrame):
         try:
-            formatted = bboxes.apply(
-                lambda r: f"{r.name}:{r['minx']},{r['miny']},{r['maxx']},{r['maxy']}",
-                axis=1,
+            return format_columns(
+                _row_columns(bboxes, ["minx", "miny", "maxx", "maxy"]),
+                bboxes.index,
+                precision,
             )
-            return "|".join(formatted.to_list())
         except KeyError as e:
             raise OhsomeException(
                 message=f"Column {e} is missing in the dataframe provided as 'bboxes'."
@@ -206,35 +399,519 @@ def format_bboxes(
 def format_bpolys(
     bpolys: Union[
         gpd.GeoDataFrame, gpd.GeoSeries, shapely.Polygon, shapely.MultiPolygon, str
-    ]
+    ],
+    precision: Optional[int] = None,
+    simplify: Optional[float] = None,
+    drop_properties: bool = False,
 ) -> str:
     """
     Formats bpolys parameter to comply with ohsome API
     :param
     bpolys: Polygons given as geopandas.GeoDataFrame, geopandas.GeoSeries, Shapely.Polygon or GeoJSON FeatureCollection as string.
-    :return:
+    :param precision: Number of decimal places the coordinates are rounded to
+    :param simplify: Tolerance in degrees the polygons are simplified with, see shapely.coverage_simplify(). Borders
+    shared by adjacent polygons are simplified the same way.
+    :param drop_properties: Encode only the geometries and ids, i.e. the index or an 'id' column, of the polygons
+    :return: GeoJSON FeatureCollection, which is encoded without whitespace if any of the options is given. A
+    GeoJSON string is only checked and returned as it is if no option is given and all its features have an id.
     """
+    options = (precision, simplify, drop_properties)
     if isinstance(bpolys, gpd.GeoDataFrame):
-        return bpolys.to_json(na="drop", show_bbox=False, drop_id=False, to_wgs84=True)
+        if drop_properties:
+            bpolys = bpolys[
+                bpolys.columns.intersection(["id"]).to_list() + [bpolys.geometry.name]
+            ]
+        if precision is not None or simplify is not None:
+            if bpolys.crs is not None:
+                bpolys = bpolys.to_crs(epsg=4326)
+            geometry = bpolys.geometry
+            if simplify is not None:
+                # simplified as coverage to keep the borders shared by adjacent polygons free of gaps and overlaps
+                simplified = geometry.to_numpy().copy()
+                present = ~shapely.is_missing(simplified)
+                simplified[present] = shapely.coverage_simplify(
+                    simplified[present], simplify
+                )
+                geometry = gpd.GeoSeries(
+                    simplified, index=geometry.index, crs=geometry.crs
+                )
+            if precision is not None:
+                geometry = gpd.GeoSeries(
+                    shapely.transform(
+                        geometry.to_numpy(), lambda c: np.round(c, precision)
+                    ),
+                    index=geometry.index,
+                    crs=geometry.crs,
+                )
+            bpolys = bpolys.assign(**{bpolys.geometry.name: geometry})
+        # shrunk polygons are encoded without whitespace as well
+        separators = (",", ":") if options != (None, None, False) else None
+        return bpolys.to_json(
+            na="drop",
+            show_bbox=False,
+            drop_id=False,
+            to_wgs84=True,
+            separators=separators,
+        )
     elif isinstance(bpolys, gpd.GeoSeries):
-        return format_bpolys(bpolys.to_frame("geometry"))
+        return format_bpolys(bpolys.to_frame("geometry"), *options)
     elif isinstance(bpolys, shapely.Polygon) or isinstance(
         bpolys, shapely.MultiPolygon
     ):
-        return format_bpolys(gpd.GeoDataFrame(geometry=[bpolys], crs="EPSG:4326"))
+        return format_bpolys(
+            gpd.GeoDataFrame(geometry=[bpolys], crs="EPSG:4326"), *options
+        )
     elif isinstance(bpolys, str):
+        collection = check_geojson_bpolys(bpolys)
+        features = collection["features"]
+        if options == (None, None, False):
+            if all("id" in feature for feature in features):
+                return bpolys
+            # features without id are numbered by their position like those of geopandas objects
+            collection["features"] = [
+                feature if "id" in feature else {**feature, "id": str(i)}
+                for i, feature in enumerate(features)
+            ]
+            return json.dumps(collection)
         try:
-            return format_bpolys(
-                gpd.GeoDataFrame.from_features(json.loads(bpolys), crs="EPSG:4326")
-            )
+            geometries = gpd.GeoDataFrame.from_features(features, crs="EPSG:4326")
         except Exception as e:
             raise OhsomeException(message="Invalid geojson.") from e
+        # keep the ids of the features, which from_features() drops
+        geometries.index = [feature.get("id", i) for i, feature in enumerate(features)]
+        return format_bpolys(geometries, *options)
     else:
         raise OhsomeException(
             message="bpolys must be a geojson string, a shapely polygonal object or a geopandas object"
         )
 
 
+def check_geojson_bpolys(geojson: str) -> dict:
+    """
+    Checks the structure of bpolys given as GeoJSON string without creating geometries: It must be a
+    FeatureCollection of Polygon or MultiPolygon features, whose ids are unique
+    :param geojson: GeoJSON string
+    :return: Decoded FeatureCollection
+    """
+    try:
+        collection = load_json(geojson)
+    except ValueError as e:
+        raise OhsomeException(message="Invalid geojson.") from e
+    if not (
+        isinstance(collection, dict)
+        and collection.get("type") == "FeatureCollection"
+        and isinstance(collection.get("features"), list)
+    ):
+        raise OhsomeException(
+            message="Invalid geojson: 'bpolys' must be a FeatureCollection."
+        )
+
+    ids = set()
+    for i, feature in enumerate(collection["features"]):
+        geometry = feature.get("geometry") if isinstance(feature, dict) else None
+        if not (isinstance(geometry, dict) and geometry.get("type") in POLYGONAL_TYPES):
+            raise OhsomeException(
+                message=f"Invalid geojson: Feature {i} of 'bpolys' is not a Polygon or MultiPolygon."
+            )
+        feature_id = feature.get("id", (feature.get("properties") or {}).get("id"))
+        if feature_id is not None:
+            if str(feature_id) in ids:
+                raise OhsomeException(
+                    message=f"Invalid geojson: The id '{feature_id}' of 'bpolys' is not unique."
+                )
+            ids.add(str(feature_id))
+    return collection
+
+
+def bpolys_size(
+    bpolys: Union[
+        gpd.GeoDataFrame, gpd.GeoSeries, shapely.Polygon, shapely.MultiPolygon, str
+    ],
+    precision: Optional[int] = None,
+    simplify: Optional[float] = None,
+    drop_properties: bool = False,
+) -> int:
+    """
+    Size of the bpolys parameter encoded with the given options, which can be used to choose the options sent with
+    post() by trading precision for a smaller request
+    :param bpolys: Polygons, see format_bpolys()
+    :param precision: Number of decimal places the coordinates are rounded to
+    :param simplify: Tolerance in degrees the polygons are simplified with, see shapely.coverage_simplify(). Borders
+    shared by adjacent polygons are simplified the same way.
+    :param drop_properties: Encode only the geometries and ids of the polygons
+    :return: Number of bytes of the encoded GeoJSON
+    """
+    return len(
+        format_bpolys(bpolys, precision, simplify, drop_properties).encode("utf-8")
+    )
+
+
+def validate_boundary(params: dict, spatial_extent: dict, mode: str) -> dict:
+    """
+    Checks the formatted boundary parameters against the spatial extent of the ohsome API, since the ohsome API only
+    accepts boundaries lying completely within it
+    :param params: Parameters containing a boundary formatted by format_boundary()
+    :param spatial_extent: GeoJSON geometry of the data extract, see metadata["extractRegion"]["spatialExtent"]
+    :param mode: 'reject' raises an OhsomeException for boundaries not lying within the extent, 'drop' removes them
+    and 'clip' clips 'bboxes' and 'bpolys' to the extent and removes the 'bcircles'
+    :return:
+    """
+    extent = shapely.from_geojson(json.dumps(spatial_extent))
+    shapely.prepare(extent)
+
+    if params.get("bpolys") is not None:
+        collection = load_json(params["bpolys"])
+        features = collection["features"]
+        ids = [feature.get("id", i) for i, feature in enumerate(features)]
+        geometries = geometries_from_geojson([f["geometry"] for f in features])
+    elif params.get("bboxes") is not None:
+        parts, ids, coordinates = _parse_boundary_string(params["bboxes"])
+        geometries = shapely.box(*coordinates.T)
+    else:
+        parts, ids, coordinates = _parse_boundary_string(params["bcircles"])
+        geometries = _circles(coordinates)
+
+    inside = shapely.covered_by(geometries, extent)
+    if inside.all():
+        return params
+    if mode == "reject":
+        raise OhsomeException(
+            message=f"The boundaries {[i for i, k in zip(ids, inside) if not k]} do not lie completely within the "
+            "spatial extent of the ohsome API.",
+            params=params,
+        )
+
+    clipped = geometries.copy()
+    if mode == "clip" and params.get("bcircles") is None:
+        clipped[~inside] = shapely.intersection(geometries[~inside], extent)
+        if params.get("bboxes") is not None:
+            clipped[~inside] = shapely.box(*shapely.bounds(clipped[~inside]).T)
+        keep = shapely.covered_by(clipped, extent) & (shapely.area(clipped) > 0)
+    else:
+        keep = inside
+    if not keep.any():
+        raise OhsomeException(
+            message="None of the boundaries lies within the spatial extent of the ohsome API.",
+            params=params,
+        )
+
+    if params.get("bpolys") is not None:
+        params["bpolys"] = json.dumps(
+            {
+                **collection,
+                "features": [
+                    feature
+                    if is_inside
+                    else {
+                        **feature,
+                        "geometry": json.loads(shapely.to_geojson(geometry)),
+                    }
+                    for feature, geometry, is_inside, is_kept in zip(
+                        features, clipped, inside, keep
+                    )
+                    if is_kept
+                ],
+            }
+        )
+    elif params.get("bboxes") is not None:
+        params["bboxes"] = "|".join(
+            part
+            if is_inside
+            else ("" if box_id is None else f"{box_id}:")
+            + ",".join(str(x) for x in shapely.bounds(geometry))
+            for part, box_id, geometry, is_inside, is_kept in zip(
+                parts, ids, clipped, inside, keep
+            )
+            if is_kept
+        )
+    else:
+        params["bcircles"] = "|".join(
+            part for part, is_kept in zip(parts, keep) if is_kept
+        )
+    return params
+
+
+def _parse_boundary_string(
+    boundary: str,
+) -> Tuple[List[str], List[Optional[str]], np.ndarray]:
+    """
+    Parses 'bboxes' or 'bcircles' given as string 'id1:x1,y1,...|id2:x2,y2,...'
+    :param boundary: Formatted boundary
+    :return: Boundaries as strings, their ids and their coordinates
+    """
+    parts = boundary.split("|")
+    ids, coordinates = [], []
+    for part in parts:
+        boundary_id, _, numbers = part.rpartition(":")
+        ids.append(boundary_id or None)
+        coordinates.append([float(x) for x in numbers.split(",")])
+    return parts, ids, np.array(coordinates, dtype=float)
+
+
+def _circles(coordinates: np.ndarray, vertices: int = 32) -> np.ndarray:
+    """
+    Approximates circles given by longitude, latitude and radius in meters by polygons in WGS 84
+    :param coordinates: Array of the longitudes, latitudes and radii of the circles
+    :param vertices: Number of vertices of the polygons
+    :return: Array of shapely polygons
+    """
+    lon, lat, radius = coordinates.T
+    angles = np.linspace(0, 2 * np.pi, vertices, endpoint=False)
+    # length of a degree of latitude in meters
+    dy = radius / 111320
+    dx = dy / np.maximum(np.cos(np.radians(lat)), 1e-6)
+    return shapely.polygons(
+        np.stack(
+            [
+                lon[:, None] + dx[:, None] * np.cos(angles),
+                lat[:, None] + dy[:, None] * np.sin(angles),
+            ],
+            axis=-1,
+        )
+    )
+
+
+def validate_time(
+    time: str, temporal_extent: dict, mode: str, min_timestamps: int = 1
+) -> str:
+    """
+    Checks the formatted time parameter against the temporal extent of the ohsome API
+    :param time: Timestamps and intervals 'start/end[/period]' separated by commas, see format_time()
+    :param temporal_extent: Temporal extent of the data extract, see metadata["extractRegion"]["temporalExtent"]
+    :param mode: 'reject' raises an OhsomeException for timestamps outside the extent, 'drop' removes them and
+    'clip' replaces them by the first or last timestamp of the extent. Intervals are shortened to the extent in both
+    modes, keeping the timestamps given by their period.
+    :param min_timestamps: Minimum number of timestamps that have to remain, e.g. 2 for the interval of full history,
+    contribution and user queries. Intervals count as two timestamps.
+    :return:
+    """
+    extent_start = temporal_extent["fromTimestamp"]
+    extent_end = temporal_extent["toTimestamp"]
+    first, last = _utc_timestamp(extent_start), _utc_timestamp(extent_end)
+
+    items, outside = [], []
+    for item in time.split(","):
+        parts = item.split("/")
+        # the ohsome API uses the extent for omitted starts and ends of intervals
+        start = _utc_timestamp(parts[0]) if parts[0] else first
+        end = _utc_timestamp((parts[1] if len(parts) > 1 else parts[0]) or extent_end)
+        if start >= first and end <= last:
+            items.append(item)
+            continue
+        outside.append(item)
+        if len(parts) == 1:
+            if mode == "clip":
+                items.append(extent_start if start < first else extent_end)
+            continue
+        if end < first or start > last:
+            continue
+        if start < first:
+            if len(parts) < 3:
+                parts[0] = extent_start
+            else:
+                start = _first_timestamp_of_period(start, parts[2], first)
+                if start > last:
+                    continue
+                parts[0] = start.isoformat()
+        if end > last:
+            parts[1] = extent_end
+        items.append("/".join(parts))
+
+    if outside and mode == "reject":
+        raise OhsomeException(
+            message=f"The timestamps {outside} are not within the temporal extent of the ohsome API from "
+            f"{extent_start} to {extent_end}.",
+            params={"time": time},
+        )
+    if not items:
+        raise OhsomeException(
+            message=f"None of the timestamps is within the temporal extent of the ohsome API from {extent_start} "
+            f"to {extent_end}.",
+            params={"time": time},
+        )
+    items = list(dict.fromkeys(items))
+    if sum(2 if "/" in item else 1 for item in items) < min_timestamps:
+        raise OhsomeException(
+            message=f"The query requires at least {min_timestamps} timestamps, but only {items} remain within the "
+            f"temporal extent of the ohsome API from {extent_start} to {extent_end}.",
+            params={"time": time},
+        )
+    return ",".join(items)
+
+
+def _utc_timestamp(timestamp: str) -> pd.Timestamp:
+    """
+    Parses an ISO-8601 timestamp, timestamps without time zone are in UTC like in the ohsome API
+    :param timestamp: Timestamp
+    :return: Timestamp in UTC without time zone
+    """
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert(None)
+    return timestamp
+
+
+def _first_timestamp_of_period(
+    start: pd.Timestamp, period: str, minimum: pd.Timestamp
+) -> pd.Timestamp:
+    """
+    First timestamp of the series start, start + period, start + 2 * period, ... which is not before the minimum
+    :param start: First timestamp of the series
+    :param period: ISO-8601 duration, e.g. 'P1M' or 'PT6H'
+    :param minimum: Earliest timestamp
+    :return:
+    """
+    offset = _period_offset(period)
+    if isinstance(offset, pd.DateOffset):
+        while start < minimum:
+            start = start + offset
+        return start
+    return start + -((start - minimum) // offset) * offset
+
+
+def _period_offset(period: str) -> Union[pd.DateOffset, pd.Timedelta]:
+    """
+    Converts an ISO-8601 duration to a pandas offset
+    :param period: ISO-8601 duration, e.g. 'P1M' or 'PT6H'
+    :return: Calendar offset if the duration contains years or months, otherwise a fixed length
+    """
+    match = ISO_DURATION.fullmatch(period)
+    if match is None or not any(match.groups()):
+        raise OhsomeException(
+            message=f"Invalid period '{period}' of the time parameter."
+        )
+    years, months, weeks, days, hours, minutes, seconds = (
+        int(x or 0) for x in match.groups()
+    )
+    if years or months:
+        return pd.DateOffset(
+            years=years,
+            months=months,
+            weeks=weeks,
+            days=days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds,
+        )
+    return pd.Timedelta(
+        weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds
+    )
+
+
+def split_bpolys(
+    bpolys: Union[gpd.GeoDataFrame, gpd.GeoSeries],
+    max_features: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> List[gpd.GeoDataFrame]:
+    """
+    Splits the bpolys parameter into chunks, which can be sent as separate requests
+    :param bpolys: Polygons given as geopandas.GeoDataFrame or geopandas.GeoSeries
+    :param max_features: Maximum number of features per chunk
+    :param max_bytes: Maximum size of the GeoJSON features per chunk. A feature exceeding the size on its own makes up
+    a chunk.
+    :return: List of GeoDataFrames keeping the index of bpolys, which is used as boundary id
+    """
+    if isinstance(bpolys, gpd.GeoSeries):
+        bpolys = bpolys.to_frame("geometry")
+    if not isinstance(bpolys, gpd.GeoDataFrame):
+        raise OhsomeException(
+            message="Only bpolys given as geopandas object can be split into chunks."
+        )
+
+    if max_bytes is None:
+        sizes = np.zeros(len(bpolys), dtype=int)
+        max_bytes = 0
+    else:
+        features = (bpolys.to_crs(epsg=4326) if bpolys.crs else bpolys).iterfeatures(
+            na="drop", show_bbox=False, drop_id=False
+        )
+        sizes = np.array([len(json.dumps(feature)) for feature in features], dtype=int)
+
+    chunk_starts = [0]
+    chunk_bytes = 0
+    for i, size in enumerate(sizes):
+        chunk_length = i - chunk_starts[-1]
+        if chunk_length > 0 and (
+            (max_features and chunk_length >= max_features)
+            or (max_bytes and chunk_bytes + size > max_bytes)
+        ):
+            chunk_starts.append(i)
+            chunk_bytes = 0
+        chunk_bytes += size
+
+    chunk_ends = chunk_starts[1:] + [len(bpolys)]
+    return [bpolys.iloc[start:end] for start, end in zip(chunk_starts, chunk_ends)]
+
+
+def split_time_interval(time: str, period: Union[str, pd.DateOffset]) -> List[str]:
+    """
+    Splits a time interval into consecutive sub-intervals
+    :param time: Interval given as two comma separated ISO-8601 timestamps
+    :param period: Length of the sub-intervals given as pandas frequency string (e.g. 'YS' or '6MS') or
+    pandas.DateOffset. The sub-intervals are aligned to the frequency.
+    :return: Timestamps bounding the sub-intervals in UTC, including start and end
+    """
+    timestamps = time.split(",")
+    if len(timestamps) != 2:
+        raise OhsomeException(
+            message="Only a time interval given as start and end timestamp can be split into chunks."
+        )
+    start, end = [pd.Timestamp(t.strip()) for t in timestamps]
+    start, end = [t if t.tzinfo is None else t.tz_convert(None) for t in (start, end)]
+
+    borders = pd.date_range(start, end, freq=period)
+    borders = borders[(borders > start) & (borders < end)]
+    return [t.strftime("%Y-%m-%dT%H:%M:%S") for t in [start, *borders, end]]
+
+
+def stitch_history_features(
+    chunk_features: List[List[dict]], borders: List[str]
+) -> List[dict]:
+    """
+    Concatenates features of consecutive time intervals. Versions of an OSM element that are valid across the border
+    of two intervals are merged into one feature. Contributions at a border that are returned for both intervals are
+    kept once.
+    :param chunk_features: Features of each interval
+    :param borders: Timestamps bounding the intervals as returned by split_time_interval()
+    :return: List of features
+    """
+
+    def stitch_key(feature: dict) -> str:
+        properties = {
+            k: v
+            for k, v in feature["properties"].items()
+            if k not in ("@validFrom", "@validTo")
+        }
+        return json.dumps([properties, feature.get("geometry")], sort_keys=True)
+
+    features = []
+    open_features = {}
+    for i, chunk in enumerate(chunk_features):
+        start, end = borders[i], borders[i + 1]
+        next_open_features = {}
+        for feature in chunk:
+            properties = feature["properties"]
+            valid_from = properties.get("@validFrom", properties.get("@timestamp"))
+            if i > 0 and str(valid_from)[:19] == start:
+                previous = open_features.pop(stitch_key(feature), None)
+                if previous is None:
+                    features.append(feature)
+                elif "@validTo" in properties:
+                    previous["properties"]["@validTo"] = properties["@validTo"]
+                    feature = previous
+                else:
+                    continue
+            else:
+                features.append(feature)
+
+            valid_to = properties.get("@validTo", properties.get("@timestamp"))
+            if i < len(chunk_features) - 1 and str(valid_to)[:19] == end:
+                next_open_features[stitch_key(feature)] = feature
+        open_features = next_open_features
+
+    return features
+
+
 def format_list_parameters(parameters: dict) -> dict:
     """Converts parameters of type list to strings using ',' as seperator."""
     list_parameters = ["groupByKeys", "groupByValues", "properties"]
@@ -245,6 +922,137 @@ def format_list_parameters(parameters: dict) -> dict:
     return parameters
 
 
+def iter_geojson_features(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """
+    Parses the features of a GeoJSON FeatureCollection incrementally, so they can be used while the rest of the
+    document is still being downloaded
+    :param chunks: Consecutive parts of the UTF-8 encoded GeoJSON document, e.g. from requests.Response.iter_content()
+    :return: Iterator of features
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+
+    def read(min_length: int = 1) -> bool:
+        """Append at least min_length characters to the buffer, returns False if the document is exhausted."""
+        nonlocal buffer
+        length = len(buffer)
+        for chunk in chunks:
+            buffer += text_decoder.decode(chunk)
+            if len(buffer) - length >= min_length:
+                return True
+        buffer += text_decoder.decode(b"", final=True)
+        return len(buffer) > length
+
+    def broken_response() -> OhsomeException:
+        read(min_length=sys.maxsize)
+        error_code, message = extract_error_message_from_invalid_json(buffer)
+        return OhsomeException(message=message, error_code=error_code)
+
+    start = FEATURES_START.search(buffer)
+    while start is None:
+        if not read():
+            raise broken_response()
+        start = FEATURES_START.search(buffer)
+
+    position = start.end()
+    while True:
+        position = SEPARATORS.match(buffer, position).end()
+        if position == len(buffer):
+            buffer, position = "", 0
+            if not read():
+                raise broken_response()
+            continue
+        if buffer[position] == "]":
+            return
+
+        try:
+            feature, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # read at least as much as already buffered, so large features are not parsed too often
+            buffer, position = buffer[position:], 0
+            if not read(min_length=len(buffer)):
+                raise broken_response()
+            continue
+
+        if "geometry" not in feature and "message" in feature:
+            # ohsome API reports errors occurring while the response is streamed in place of a feature
+            buffer = buffer[position:]
+            raise broken_response()
+        position = end
+        yield feature
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Compress the body of a request
+    :param body: Encoded body of the request
+    :param encoding: Content encoding, either 'gzip' or 'deflate'
+    :return: Compressed body
+    """
+    if encoding == "gzip":
+        return gzip.compress(body)
+    return zlib.compress(body)
+
+
+def geometries_from_geojson(geometries: List[Optional[dict]]) -> np.ndarray:
+    """
+    Convert GeoJSON geometries to shapely geometries in bulk, which is faster than converting them one by one
+    :param geometries: GeoJSON geometries, None for missing geometries
+    :return: Array of shapely geometries
+    """
+    dumps = orjson.dumps if orjson is not None else json.dumps
+    result = np.empty(len(geometries), dtype=object)
+    # convert in batches, so only the GeoJSON strings of one batch are kept in memory
+    for start in range(0, len(geometries), GEOJSON_BATCH_SIZE):
+        batch = geometries[start : start + GEOJSON_BATCH_SIZE]
+        result[start : start + len(batch)] = shapely.from_geojson(
+            [dumps(geometry) if geometry is not None else None for geometry in batch]
+        )
+    return result
+
+
+def dump_json_line(obj: dict) -> bytes:
+    """
+    Serialize an object to compact JSON without line breaks, using orjson if it is installed
+    :param obj: Object to serialize
+    :return: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(content: Union[bytes, str]) -> dict:
+    """
+    Decode JSON, using orjson if it is installed
+    :param content: Encoded JSON
+    :return: Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def open_compressed(path: Union[str, Path], compression: Optional[str] = "infer"):
+    """
+    Open a file for writing bytes, which are compressed if requested
+    :param path: Path of the file
+    :param compression: 'gzip', 'bz2', 'xz' or None. 'infer' derives it from the file extension.
+    :return: File object
+    """
+    openers = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open, None: open}
+    if compression == "infer":
+        extensions = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+        compression = extensions.get(Path(path).suffix.lower())
+    if compression not in openers:
+        raise ValueError(
+            f"Compression '{compression}' is not supported, use one of {list(openers)}."
+        )
+    return openers[compression](path, "wb")
+
+
 def find_groupby_names(url: Optional[str]) -> List[str]:
     """
     Get the groupBy names
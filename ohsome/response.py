@@ -3,26 +3,244 @@
 
 """Class for ohsome API response"""
 
+import itertools
 import json
-from typing import Optional, Union
+import operator
+from pathlib import Path
+from typing import Optional, Union, List, Iterator, Tuple, Dict
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from pandas import DataFrame
+from requests import Response
+from requests.exceptions import JSONDecodeError
 
-from ohsome.helper import find_groupby_names
+try:
+    # private pandas module, which allows creating sparse columns from the positions of their values
+    from pandas._libs.sparse import IntIndex
+except ImportError:
+    IntIndex = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+if pa is not None:
+    # OSM tags are key value pairs of strings
+    OTHER_TAGS_TYPE = pa.map_(pa.string(), pa.string())
+
+from ohsome.constants import (
+    STREAM_CHUNK_SIZE,
+    DEFAULT_ROW_GROUP_SIZE,
+    DEFAULT_DATAFRAME_CHUNK_SIZE,
+)
+from ohsome.exceptions import OhsomeException
+from ohsome.helper import (
+    dump_json_line,
+    load_json,
+    open_compressed,
+    find_groupby_names,
+    geometries_from_geojson,
+    iter_geojson_features,
+    extract_error_message_from_invalid_json,
+)
+
+PANDAS_MAJOR_VERSION = int(pd.__version__.split(".")[0])
+RESULT_KEYS = {
+    "result",
+    "ratioResult",
+    "groupByResult",
+    "groupByBoundaryResult",
+    "features",
+}
+RESULT_TIME_COLUMNS = ["timestamp", "fromTimestamp", "toTimestamp"]
+TAG_DTYPES = [None, "sparse", "category"]
+FEATURE_TIME_COLUMNS = ["@validFrom", "@validTo", "@snapshotTimestamp", "@timestamp"]
+
+
+def _tag_column(
+    n_features: int, positions: List[int], values: list, tag_dtype: str
+) -> Union[pd.arrays.SparseArray, pd.Categorical]:
+    """
+    Creates the column of a tag without creating a column of Python objects first
+    :param n_features: Number of features
+    :param positions: Positions of the features having the tag
+    :param values: Values of the tag of these features
+    :param tag_dtype: 'sparse' or 'category'
+    :return:
+    """
+    if tag_dtype == "sparse":
+        if IntIndex is None:
+            dense = np.full(n_features, np.nan, dtype=object)
+            dense[positions] = values
+            return pd.arrays.SparseArray(dense, dtype=pd.SparseDtype(object, np.nan))
+        return pd.arrays.SparseArray(
+            np.array(values, dtype=object),
+            sparse_index=IntIndex(n_features, np.array(positions, dtype=np.int32)),
+            dtype=pd.SparseDtype(object, np.nan),
+        )
+    codes, categories = pd.factorize(np.array(values, dtype=object))
+    all_codes = np.full(n_features, -1, dtype=codes.dtype)
+    all_codes[positions] = codes
+    return pd.Categorical.from_codes(all_codes, categories=categories)
 
 
 class OhsomeResponse:
     """Contains the response of the request to the ohsome API"""
 
-    def __init__(self, data: dict, url: str = None):
-        """Initialize the OhsomeResponse class."""
-        self.data = data
+    def __init__(
+        self,
+        data: dict = None,
+        url: str = None,
+        stream: Optional[Response] = None,
+        content: Optional[bytes] = None,
+    ):
+        """
+        Initialize the OhsomeResponse class.
+        :param data: Decoded content of the response
+        :param url: Url of the request
+        :param stream: Response of a request sent with stream=True, whose content has not been read yet. It is decoded
+        when data is accessed for the first time.
+        :param content: Raw content of the response, which is decoded when data is accessed for the first time
+        """
+        self._data = data
         self.url = url
+        self._stream = stream
+        self._content = content
+        # converted data frames by the arguments of as_dataframe()
+        self._dataframes = {}
+
+    @property
+    def data(self) -> dict:
+        """Decoded content of the response"""
+        if self._data is None and self._content is not None:
+            try:
+                self._data = load_json(self._content)
+            except ValueError:
+                error_code, message = extract_error_message_from_invalid_json(
+                    self._content.decode("utf-8", errors="replace")
+                )
+                raise OhsomeException(
+                    message=message, url=self.url, error_code=error_code
+                )
+        elif self._data is None and self._stream is not None:
+            stream, self._stream = self._stream, None
+            with stream:
+                try:
+                    self._data = stream.json()
+                except (ValueError, JSONDecodeError):
+                    error_code, message = extract_error_message_from_invalid_json(
+                        stream.text
+                    )
+                    raise OhsomeException(
+                        message=message,
+                        url=self.url,
+                        error_code=error_code,
+                        response=stream,
+                    )
+        elif self._data is None:
+            raise ValueError(
+                "The streamed response has already been consumed by iter_features()."
+            )
+        return self._data
+
+    @data.setter
+    def data(self, data: dict) -> None:
+        self._data = data
+        self._content = None
+        self._dataframes = {}
+
+    def drop_content(self) -> None:
+        """
+        Release the raw content of the response to save memory, e.g. after it has been converted. The content is
+        decoded before if this has not happened yet.
+        :return:
+        """
+        if self._content is not None:
+            _ = self.data
+            self._content = None
+
+    def save(
+        self, outfile: Union[str, Path], compression: Optional[str] = None
+    ) -> None:
+        """
+        Write the content of the response to a file. The raw content, e.g. of responses restored from the response cache,
+        is written as it is without decoding it. A streamed response is written while it is downloaded and can not be
+        used afterwards. Otherwise, the decoded data is written as compact JSON.
+        :param outfile: Path of the output file
+        :param compression: 'gzip', 'bz2', 'xz' or 'infer' to derive it from the file extension, default: None
+        :return:
+        """
+        with open_compressed(outfile, compression) as dst:
+            if self._content is not None:
+                dst.write(self._content)
+            elif self._data is None and self._stream is not None:
+                stream, self._stream = self._stream, None
+                with stream:
+                    for chunk in stream.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        dst.write(chunk)
+            else:
+                dst.write(dump_json_line(self.data))
+
+    def iter_features(self) -> Iterator[dict]:
+        """
+        Iterates over the features of a data extraction response. If the request was sent with stream=True, the
+        features are parsed while they are downloaded without loading the complete response into memory. In this case,
+        the features can only be iterated once, unless data was accessed before.
+        :return: Iterator of GeoJSON features
+        """
+        if self._stream is None:
+            yield from self.data["features"]
+            return
+
+        stream, self._stream = self._stream, None
+        with stream:
+            try:
+                yield from iter_geojson_features(
+                    stream.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+                )
+            except OhsomeException as ohsome_exception:
+                ohsome_exception.url = self.url
+                raise ohsome_exception
+
+    @classmethod
+    def concat(
+        cls, responses: List["OhsomeResponse"], drop_duplicate_features: bool = False
+    ) -> "OhsomeResponse":
+        """
+        Concatenates the results of several responses of the same endpoint, e.g. of requests for different boundaries
+        :param responses: Responses to concatenate, other information than the results is taken from the first one
+        :param drop_duplicate_features: Keep only the first of identical features, which may be returned for each
+        boundary they intersect
+        :return: OhsomeResponse
+        """
+        data = dict(responses[0].data)
+        for key in RESULT_KEYS.intersection(data.keys()):
+            data[key] = list(
+                itertools.chain.from_iterable(r.data[key] for r in responses)
+            )
+        if drop_duplicate_features and "features" in data:
+            seen = set()
+            features = []
+            for feature in data["features"]:
+                key = json.dumps(feature, sort_keys=True)
+                if key not in seen:
+                    seen.add(key)
+                    features.append(feature)
+            data["features"] = features
+        return cls(data=data, url=responses[0].url)
 
     def as_dataframe(
-        self, multi_index: Optional[bool] = True, explode_tags: Optional[tuple] = ()
+        self,
+        multi_index: Optional[bool] = True,
+        explode_tags: Optional[tuple] = (),
+        tag_dtype: Optional[str] = None,
+        utc: bool = False,
     ) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
         """
         Converts the ohsome response to a pandas.DataFrame or a geopandas.GeoDataFrame if the
@@ -30,15 +248,33 @@ class OhsomeResponse:
         :param multi_index: If true returns the dataframe with a multi index
         :param explode_tags: By default, tags of extracted features are stored in a single dict-column. You can specify
         a tuple of tags that should be popped from this column. To disable it completely, pass None. Yet, be aware that
-        you may get a large but sparse data frame.
+        you may get a large but sparse data frame, consider using tag_dtype or tags_as_dataframe() in this case.
+        :param tag_dtype: Data type of the columns of exploded tags. 'sparse' stores only the tags present, which
+        needs the least memory if most features do not have a tag. 'category' stores each distinct value only once.
+        By default, the columns contain Python objects.
+        :param utc: If true, timestamps are time zone aware in UTC, otherwise they are naive timestamps in UTC
         :return: pandas.DataFrame or geopandas.GeoDataFrame
         """
-        if "features" not in self.data.keys():
-            return self._as_dataframe(multi_index)
-        else:
-            return self._as_geodataframe(multi_index, explode_tags)
+        if tag_dtype not in TAG_DTYPES:
+            raise ValueError(f"tag_dtype must be one of {TAG_DTYPES}.")
+        key = (
+            multi_index,
+            tuple(explode_tags) if explode_tags is not None else None,
+            tag_dtype,
+            utc,
+        )
+        if key not in self._dataframes:
+            if "features" not in self.data.keys():
+                self._dataframes[key] = self._as_dataframe(multi_index, utc)
+            else:
+                self._dataframes[key] = self._as_geodataframe(
+                    multi_index, explode_tags, tag_dtype, utc
+                )
+        # copy-on-write keeps changes to shallow copies from modifying the memoized data frame
+        copy_on_write = PANDAS_MAJOR_VERSION >= 3 or pd.options.mode.copy_on_write
+        return self._dataframes[key].copy(deep=copy_on_write is not True)
 
-    def _as_dataframe(self, multi_index=True) -> pd.DataFrame:
+    def _as_dataframe(self, multi_index=True, utc: bool = False) -> pd.DataFrame:
         groupby_names = []
         if "result" in self.data.keys():
             result_df = pd.DataFrame().from_records(self.data["result"])
@@ -59,10 +295,8 @@ class OhsomeResponse:
         else:
             raise TypeError("This result type is not implemented.")
 
-        time_columns = result_df.columns.intersection(
-            ["timestamp", "fromTimestamp", "toTimestamp"]
-        )
-        result_df[time_columns] = result_df[time_columns].apply(self._format_timestamp)
+        for column in result_df.columns.intersection(RESULT_TIME_COLUMNS):
+            result_df[column] = self._format_timestamp(result_df[column], utc)
 
         if multi_index:
             self._set_index(result_df, groupby_names)
@@ -70,7 +304,11 @@ class OhsomeResponse:
         return result_df.sort_index()
 
     def _as_geodataframe(
-        self, multi_index: Optional[bool] = True, explode_tags: Optional[tuple] = ()
+        self,
+        multi_index: Optional[bool] = True,
+        explode_tags: Optional[tuple] = (),
+        tag_dtype: Optional[str] = None,
+        utc: bool = False,
     ) -> gpd.GeoDataFrame:
         if len(self.data["features"]) == 0:
             return gpd.GeoDataFrame(
@@ -83,44 +321,311 @@ class OhsomeResponse:
                 ),
             )
 
+        features = self._features_to_geodataframe(
+            self.data["features"], explode_tags, tag_dtype, utc
+        )
+        if multi_index:
+            features = self._set_feature_index(features)
+
+        return features.sort_index()
+
+    def iter_dataframes(
+        self,
+        chunk_size: int = DEFAULT_DATAFRAME_CHUNK_SIZE,
+        multi_index: Optional[bool] = True,
+        explode_tags: tuple = (),
+        utc: bool = False,
+    ) -> Iterator[gpd.GeoDataFrame]:
+        """
+        Converts the features of a data extraction response to geopandas.GeoDataFrames of at most chunk_size rows, so
+        that large responses can be processed without converting them at once. If the request was sent with
+        stream=True, the features are converted while they are downloaded. All chunks have the columns and data types
+        of the first one and contain the features in the order of the response. Integer and boolean columns have the
+        nullable data types 'Int64' and 'boolean', since later chunks may contain missing values.
+        :param chunk_size: Maximum number of features per GeoDataFrame
+        :param multi_index: If true returns the dataframes with a multi index
+        :param explode_tags: Tags that are popped from the dict-column of tags into their own column. Unlike
+        as_dataframe(), None is not supported since the tags of later chunks are not known in advance.
+        :param utc: If true, timestamps are time zone aware in UTC, otherwise they are naive timestamps in UTC
+        :return: Iterator of geopandas.GeoDataFrame
+        """
+        if explode_tags is None:
+            raise ValueError(
+                "explode_tags=None is not supported, since the columns of all chunks must be known in advance. Use "
+                "tags_as_dataframe() to get all tags instead."
+            )
+        if self._stream is None and "features" not in self.data.keys():
+            raise TypeError(
+                "Only data extraction responses can be converted in chunks."
+            )
+        dtypes = None
+        features = self.iter_features()
+        while True:
+            batch = list(itertools.islice(features, chunk_size))
+            if not batch:
+                return
+            chunk = self._features_to_geodataframe(batch, explode_tags, None, utc)
+            if dtypes is None:
+                # later chunks may contain missing values in columns without any in the first chunk
+                dtypes = chunk.dtypes.map(
+                    lambda dtype: (
+                        "Int64"
+                        if dtype.kind in "iu"
+                        else "boolean"
+                        if dtype.kind == "b"
+                        else dtype
+                    )
+                )
+            else:
+                unknown_columns = chunk.columns.difference(dtypes.index)
+                if len(unknown_columns) > 0:
+                    raise ValueError(
+                        f"The features contain properties {sorted(unknown_columns)} missing in the first chunk. Use "
+                        "a larger chunk_size or as_dataframe()."
+                    )
+            chunk = chunk.reindex(columns=dtypes.index).astype(dtypes.to_dict())
+            if multi_index:
+                chunk = self._set_feature_index(chunk)
+            yield chunk
+
+    def _features_to_geodataframe(
+        self,
+        features: List[dict],
+        explode_tags: Optional[tuple] = (),
+        tag_dtype: Optional[str] = None,
+        utc: bool = False,
+    ) -> gpd.GeoDataFrame:
+        """
+        Converts GeoJSON features to a geopandas.GeoDataFrame without index
+        :param features: GeoJSON features
+        :param explode_tags: Tags that get their own column
+        :param tag_dtype: Data type of the columns of exploded tags
+        :param utc: If true, timestamps are time zone aware
+        :return:
+        """
         try:
-            if explode_tags is not None:
-                for feature in self.data["features"]:
-                    properties = feature["properties"]
-                    tags = {}
-                    new_properties = {k: None for k in explode_tags}
-                    for k in properties.keys():
-                        if (
-                            (k.startswith("@"))
-                            or (k == "timestamp")
-                            or (k in explode_tags)
-                        ):
-                            new_properties[k] = properties.get(k)
-                        else:
-                            tags[k] = properties.get(k)
-                    new_properties["@other_tags"] = tags
-                    feature["properties"] = new_properties
-
-            features = gpd.GeoDataFrame().from_features(self.data, crs="epsg:4326")
+            features = gpd.GeoDataFrame(
+                {
+                    "geometry": geometries_from_geojson(
+                        [feature["geometry"] for feature in features]
+                    ),
+                    **self._property_columns(
+                        [feature["properties"] for feature in features],
+                        explode_tags,
+                        tag_dtype,
+                    ),
+                },
+                crs="epsg:4326",
+            )
 
         except TypeError:
             raise TypeError(
                 "This result type cannot be converted to a GeoPandas GeoDataFrame object."
             )
 
-        time_columns = ["@validFrom", "@validTo", "@snapshotTimestamp", "@timestamp"]
-        existing_time_columns = features.columns.intersection(time_columns)
-        features[existing_time_columns] = features[existing_time_columns].apply(
-            self._format_timestamp
+        for column in features.columns.intersection(FEATURE_TIME_COLUMNS):
+            features[column] = self._format_timestamp(features[column], utc)
+        return features
+
+    @staticmethod
+    def _set_feature_index(features: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Sets the OSM id and the timestamps of the features as index
+        :param features: Converted features
+        :return:
+        """
+        index_columns = features.columns.intersection(
+            ["@osmId"] + FEATURE_TIME_COLUMNS
+        ).to_list()
+        return features.set_index(index_columns)
+
+    @staticmethod
+    def _property_columns(
+        properties: List[dict],
+        explode_tags: Optional[tuple] = (),
+        tag_dtype: Optional[str] = None,
+    ) -> dict:
+        """
+        Collects the properties of all features column by column in a single pass
+        :param properties: Properties of the features
+        :param explode_tags: Tags that get their own column, all other tags are collected in the column '@other_tags'.
+        If None, all tags get their own column.
+        :param tag_dtype: Data type of the columns of exploded tags, 'sparse', 'category' or None for Python objects
+        :return: Columns by name
+        """
+        n_features = len(properties)
+        columns = {}
+        if tag_dtype is not None:
+            # collect the tags by key first, to never create columns of Python objects for them
+            metadata_columns, other_tags = {}, []
+            tags = {key: ([], []) for key in explode_tags or ()}
+            for i, feature_properties in enumerate(properties):
+                feature_other_tags = {}
+                for key, value in feature_properties.items():
+                    if key.startswith("@") or key == "timestamp":
+                        if key not in metadata_columns:
+                            metadata_columns[key] = [None] * n_features
+                        metadata_columns[key][i] = value
+                    elif explode_tags is None or key in tags:
+                        positions, values = tags.setdefault(key, ([], []))
+                        positions.append(i)
+                        values.append(value)
+                    else:
+                        feature_other_tags[key] = value
+                other_tags.append(feature_other_tags)
+            columns.update(
+                {
+                    key: _tag_column(n_features, positions, values, tag_dtype)
+                    for key, (positions, values) in tags.items()
+                }
+            )
+            columns.update(metadata_columns)
+            if explode_tags is not None:
+                columns["@other_tags"] = other_tags
+            return columns
+
+        if explode_tags is None:
+            for i, feature_properties in enumerate(properties):
+                for key, value in feature_properties.items():
+                    if key not in columns:
+                        columns[key] = [None] * n_features
+                    columns[key][i] = value
+            return columns
+
+        columns = {key: [None] * n_features for key in explode_tags}
+        other_tags = []
+        for i, feature_properties in enumerate(properties):
+            tags = {}
+            for key, value in feature_properties.items():
+                if key.startswith("@") or key == "timestamp" or key in columns:
+                    if key not in columns:
+                        columns[key] = [None] * n_features
+                    columns[key][i] = value
+                else:
+                    tags[key] = value
+            other_tags.append(tags)
+        columns["@other_tags"] = other_tags
+        return columns
+
+    def tags_as_dataframe(self) -> pd.DataFrame:
+        """
+        Converts the tags of extracted features to a long-format pandas.DataFrame with one row per tag. This needs
+        much less memory than a column per tag, if the features have many different tags.
+        :return: pandas.DataFrame with the columns 'feature', which is the position of the feature in the response and
+        the row of as_dataframe(multi_index=False), 'key' and 'value'. Keys and values are categorical.
+        """
+        features, keys, values = [], [], []
+        for i, feature in enumerate(self.iter_features()):
+            for key, value in feature["properties"].items():
+                if not (key.startswith("@") or key == "timestamp"):
+                    features.append(i)
+                    keys.append(key)
+                    values.append(value)
+        return pd.DataFrame(
+            {
+                "feature": np.array(features, dtype=np.int64),
+                "key": pd.Categorical(keys),
+                "value": pd.Categorical(values),
+            }
         )
 
-        if multi_index:
-            index_columns = features.columns.intersection(
-                ["@osmId"] + time_columns
-            ).to_list()
-            features = features.set_index(index_columns)
+    def as_array(self, utc: bool = False) -> Tuple[np.ndarray, Dict[str, pd.Index]]:
+        """
+        Converts an aggregation response to a cube of its values with one dimension per groupBy level, one for time and
+        one for the fields of the results, e.g. 'value' or 'value', 'value2' and 'ratio'. The cube is filled directly
+        from the response, combinations missing in the response are NaN. It can be passed to xarray using
+        xarray.DataArray(cube, coords=coords, dims=list(coords)).
+        :param utc: If true, timestamps are time zone aware in UTC, otherwise they are naive timestamps in UTC
+        :return: numpy.ndarray of float and the coordinates of its dimensions as pandas.Index by dimension name. The
+        time dimension is named 'timestamp', for contributions it is a pandas.IntervalIndex of the time intervals.
+        """
+        if "groupByResult" in self.data.keys():
+            records = self.data["groupByResult"]
+        elif "groupByBoundaryResult" in self.data.keys():
+            records = self.data["groupByBoundaryResult"]
+        elif "result" in self.data.keys() or "ratioResult" in self.data.keys():
+            records = None
+        else:
+            raise TypeError("This result type cannot be converted to an array.")
 
-        return features.sort_index()
+        if records is None:
+            rows = self.data.get("result", self.data.get("ratioResult"))
+            groupby_names, row_groups, group_levels = [], None, []
+        elif len(records) == 0:
+            rows = []
+            groupby_names = find_groupby_names(self.url)
+            row_groups, group_levels = None, [() for _ in groupby_names]
+        else:
+            groupby_names = find_groupby_names(self.url)
+            rows, row_groups, group_levels = self._flatten_groupby(
+                records, groupby_names
+            )
+
+        coords, positions = {}, []
+        for name, groups in zip(groupby_names, group_levels):
+            codes, uniques = pd.factorize(np.array(groups, dtype=object))
+            coords[name] = pd.Index(uniques, name=name)
+            positions.append(codes[row_groups] if row_groups is not None else codes)
+
+        time_key = (
+            "fromTimestamp" if rows and "fromTimestamp" in rows[0] else "timestamp"
+        )
+        codes, uniques = pd.factorize(
+            np.array(list(map(operator.itemgetter(time_key), rows)), dtype=object),
+            sort=True,
+        )
+        times = pd.Index(self._format_timestamp(pd.Series(uniques), utc))
+        if time_key == "fromTimestamp":
+            _, first_rows = np.unique(codes, return_index=True)
+            to_times = self._format_timestamp(
+                pd.Series([rows[i]["toTimestamp"] for i in first_rows], dtype=object),
+                utc,
+            )
+            times = pd.IntervalIndex.from_arrays(times, to_times, closed="right")
+        coords["timestamp"] = times.rename("timestamp")
+        positions.append(codes)
+
+        fields = (
+            [key for key in rows[0].keys() if key not in RESULT_TIME_COLUMNS]
+            if rows
+            else ["value"]
+        )
+        coords["field"] = pd.Index(fields, name="field")
+
+        cube = np.full([len(index) for index in coords.values()], np.nan)
+        for i, field in enumerate(fields):
+            cube[(*positions, i)] = np.array(
+                list(map(operator.itemgetter(field), rows)), dtype=np.float64
+            )
+        return cube, coords
+
+    def as_wide_dataframe(self, utc: bool = False) -> pd.DataFrame:
+        """
+        Converts an aggregation response to a pandas.DataFrame with one row per timestamp and one column per group,
+        e.g. per boundary, without creating the data frame of as_dataframe() first
+        :param utc: If true, timestamps are time zone aware in UTC, otherwise they are naive timestamps in UTC
+        :return: pandas.DataFrame indexed by time. Its columns are the groups or, for results with several groupBy
+        levels or fields, e.g. of ratio requests, a pandas.MultiIndex of the fields and the groups.
+        """
+        cube, coords = self.as_array(utc)
+        *groups, times, fields = coords.values()
+        # move the time dimension first and flatten the others in the order field, groups
+        values = np.moveaxis(cube, [-2, -1], [0, 1]).reshape(
+            len(times), len(fields) * int(np.prod([len(g) for g in groups]))
+        )
+        if not groups:
+            columns = fields
+        elif len(fields) == 1:
+            columns = (
+                groups[0]
+                if len(groups) == 1
+                else pd.MultiIndex.from_product(groups, names=[g.name for g in groups])
+            )
+        else:
+            columns = pd.MultiIndex.from_product(
+                [fields, *groups], names=[fields.name] + [g.name for g in groups]
+            )
+        return pd.DataFrame(values, index=times, columns=columns)
 
     def to_json(self, outfile) -> None:
         """
@@ -131,6 +636,259 @@ class OhsomeResponse:
         with open(outfile, "w", encoding="utf-8") as dst:
             json.dump(self.data, dst, indent=2, ensure_ascii=False)
 
+    def to_geojsonseq(
+        self,
+        outfile: Union[str, Path],
+        record_separator: bool = True,
+        compression: Optional[str] = "infer",
+    ) -> None:
+        """
+        Write the extracted features to a GeoJSON text sequence file (RFC 8142) with one feature per line, which can be
+        read feature by feature e.g. by ogr2ogr or tippecanoe. The features of streamed responses are written while
+        they are downloaded. The features are serialized using orjson if it is installed.
+        :param outfile: Path of the output file, e.g. 'features.geojsons'
+        :param record_separator: Start each feature with the record separator character as specified by RFC 8142,
+        otherwise newline-delimited GeoJSON is written
+        :param compression: 'gzip', 'bz2', 'xz' or None, by default it is inferred from the file extension
+        :return:
+        """
+        if self._stream is None and "features" not in self.data.keys():
+            raise TypeError(
+                "Only data extraction responses can be written as GeoJSON text sequence."
+            )
+        prefix = b"\x1e" if record_separator else b""
+        with open_compressed(outfile, compression) as dst:
+            for feature in self.iter_features():
+                dst.write(prefix + dump_json_line(feature) + b"\n")
+
+    def to_arrow(self, explode_tags: Optional[tuple] = ()) -> "pa.Table":
+        """
+        Converts the ohsome response to a pyarrow.Table without creating a data frame first. Geometries of extracted
+        features are encoded as WKB and described by GeoParquet metadata.
+        :param explode_tags: By default, tags of extracted features are stored in the map column '@other_tags'. You can
+        specify a tuple of tags that get their own column. Pass None to store all tags in their own column.
+        :return: pyarrow.Table
+        """
+        self._check_pyarrow()
+        if self._stream is None and "features" not in self.data.keys():
+            return self._results_to_arrow()
+
+        geometry_types = set()
+        tables = list(
+            self._iter_feature_tables(
+                explode_tags, DEFAULT_ROW_GROUP_SIZE, geometry_types
+            )
+        )
+        if tables:
+            table = pa.concat_tables(tables, promote_options="permissive")
+        else:
+            table = self._empty_feature_table(explode_tags)
+        return table.replace_schema_metadata(
+            {"geo": json.dumps(self._geo_metadata(geometry_types))}
+        )
+
+    def to_parquet(
+        self,
+        outfile: Union[str, Path],
+        explode_tags: Optional[tuple] = (),
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        """
+        Writes the ohsome response to a parquet file, using GeoParquet for extracted features. Features are converted and
+        written one row group at a time, so streamed responses are never loaded completely into memory.
+        :param outfile: Path of the parquet file
+        :param explode_tags: By default, tags of extracted features are stored in the map column '@other_tags'. You can
+        specify a tuple of tags that get their own column. Pass None to store all tags in their own column, which
+        requires to convert all features before writing them, since the columns are not known before.
+        :param row_group_size: Maximum number of rows per row group. The first row group determines the types of the
+        columns, properties without any value in it are stored as strings.
+        :return:
+        """
+        self._check_pyarrow()
+        if explode_tags is None or (
+            self._stream is None and "features" not in self.data.keys()
+        ):
+            pq.write_table(
+                self.to_arrow(explode_tags), outfile, row_group_size=row_group_size
+            )
+            return
+
+        geometry_types = set()
+        writer = None
+        try:
+            for table in self._iter_feature_tables(
+                explode_tags, row_group_size, geometry_types
+            ):
+                if writer is None:
+                    # properties without any value in the first row group are stored as strings
+                    schema = pa.schema(
+                        [
+                            (
+                                field.with_type(pa.string())
+                                if pa.types.is_null(field.type)
+                                else field
+                            )
+                            for field in table.schema
+                        ],
+                        metadata=table.schema.metadata,
+                    )
+                    writer = pq.ParquetWriter(outfile, schema)
+                writer.write_table(self._conform_table(table, writer.schema))
+            if writer is None:
+                table = self._empty_feature_table(explode_tags)
+                writer = pq.ParquetWriter(outfile, table.schema)
+                writer.write_table(table)
+            writer.add_key_value_metadata(
+                {"geo": json.dumps(self._geo_metadata(geometry_types))}
+            )
+        finally:
+            if writer is not None:
+                writer.close()
+
+    @staticmethod
+    def _check_pyarrow() -> None:
+        if pa is None:
+            raise ImportError(
+                "The conversion to Arrow requires pyarrow. Install it using 'pip install ohsome[arrow]'."
+            )
+
+    def _results_to_arrow(self) -> "pa.Table":
+        """
+        Converts aggregation results to a pyarrow.Table
+        :return:
+        """
+        if "result" in self.data.keys():
+            table = pa.Table.from_pylist(self.data["result"])
+        elif "ratioResult" in self.data.keys():
+            table = pa.Table.from_pylist(self.data["ratioResult"])
+        elif "groupByResult" in self.data.keys() or (
+            "groupByBoundaryResult" in self.data.keys()
+        ):
+            groupby_names = find_groupby_names(self.url)
+            records = self.data[
+                "groupByResult"
+                if "groupByResult" in self.data
+                else "groupByBoundaryResult"
+            ]
+            if len(records) == 0:
+                return pa.table(
+                    {name: pa.array([], type=pa.string()) for name in groupby_names}
+                )
+            rows, row_groups, group_levels = self._flatten_groupby(
+                records, groupby_names
+            )
+            table = pa.Table.from_pylist(rows)
+            for position, (name, groups) in enumerate(zip(groupby_names, group_levels)):
+                table = table.add_column(
+                    position, name, pc.take(pa.array(list(groups)), row_groups)
+                )
+        else:
+            raise TypeError("This result type is not implemented.")
+        return self._arrow_timestamps(table, RESULT_TIME_COLUMNS)
+
+    def _iter_feature_tables(
+        self, explode_tags: Optional[tuple], batch_size: int, geometry_types: set
+    ) -> Iterator["pa.Table"]:
+        """
+        Converts the extracted features to pyarrow.Tables of at most batch_size rows
+        :param explode_tags: Tags that get their own column
+        :param batch_size: Maximum number of features per table
+        :param geometry_types: Set the GeoJSON types of the converted geometries are added to
+        :return:
+        """
+        features = self.iter_features()
+        while True:
+            batch = list(itertools.islice(features, batch_size))
+            if not batch:
+                return
+            geometries = [feature["geometry"] for feature in batch]
+            geometry_types.update(g["type"] for g in geometries if g is not None)
+            columns = {
+                "geometry": pa.array(
+                    shapely.to_wkb(geometries_from_geojson(geometries)),
+                    type=pa.binary(),
+                )
+            }
+            properties = self._property_columns(
+                [feature["properties"] for feature in batch], explode_tags
+            )
+            for name, values in properties.items():
+                if name == "@other_tags":
+                    columns[name] = pa.array(values, type=OTHER_TAGS_TYPE)
+                elif explode_tags is not None and name in explode_tags:
+                    columns[name] = pa.array(values, type=pa.string())
+                else:
+                    columns[name] = pa.array(values)
+            yield self._arrow_timestamps(pa.table(columns), FEATURE_TIME_COLUMNS)
+
+    @staticmethod
+    def _empty_feature_table(explode_tags: Optional[tuple]) -> "pa.Table":
+        """Table of a response without features."""
+        columns = {
+            "geometry": pa.array([], type=pa.binary()),
+            "@osmId": pa.array([], type=pa.string()),
+        }
+        if explode_tags is not None:
+            columns.update(
+                {tag: pa.array([], type=pa.string()) for tag in explode_tags}
+            )
+            columns["@other_tags"] = pa.array([], type=OTHER_TAGS_TYPE)
+        return pa.table(columns)
+
+    @staticmethod
+    def _conform_table(table: "pa.Table", schema: "pa.Schema") -> "pa.Table":
+        """
+        Conforms a table to the schema of a parquet file, missing columns are filled with nulls and the others are
+        cast to the type of the schema
+        :param table: Table of a batch of features
+        :param schema: Schema of the first batch of features
+        :return:
+        """
+        unknown_columns = set(table.column_names).difference(schema.names)
+        if unknown_columns:
+            raise ValueError(
+                f"The features contain properties {sorted(unknown_columns)} missing in the first row group. Use a "
+                "larger row_group_size or write the table returned by to_arrow()."
+            )
+        return pa.table(
+            [
+                (
+                    table[field.name].cast(field.type)
+                    if field.name in table.column_names
+                    else pa.nulls(len(table), type=field.type)
+                )
+                for field in schema
+            ],
+            schema=schema,
+        )
+
+    @staticmethod
+    def _arrow_timestamps(table: "pa.Table", time_columns: List[str]) -> "pa.Table":
+        """Converts the time columns of a table to timestamps in UTC without time zone like as_dataframe()."""
+        for name in table.column_names:
+            if name in time_columns and pa.types.is_string(table[name].type):
+                timestamps = pc.replace_substring(table[name], "Z", "")
+                table = table.set_column(
+                    table.column_names.index(name),
+                    name,
+                    pc.cast(timestamps, pa.timestamp("us")),
+                )
+        return table
+
+    @staticmethod
+    def _geo_metadata(geometry_types: set) -> dict:
+        """Returns the GeoParquet metadata of the WKB encoded geometry column, the default CRS is WGS 84 (OGC:CRS84)."""
+        return {
+            "version": "1.1.0",
+            "primary_column": "geometry",
+            "columns": {
+                "geometry": {
+                    "encoding": "WKB",
+                    "geometry_types": sorted(geometry_types),
+                }
+            },
+        }
+
     def _set_index(self, result_df, groupby_names) -> None:
         """
         Set multi-index based on groupby names and time
@@ -147,30 +905,71 @@ class OhsomeResponse:
 
     def _create_groupby_dataframe(self, data, groupby_names) -> DataFrame:
         """
-        Formats groupby results
+        Formats groupby results of any number of groupBy levels column by column
         :param data:
         :param groupby_names:
         :return:
         """
+        rows, row_groups, group_levels = self._flatten_groupby(data, groupby_names)
+        columns = {}
+        for name, groups in zip(groupby_names, group_levels):
+            columns[name] = pd.Series(list(groups)).take(row_groups)
+
+        fields = rows[0].keys() if rows else []
+        for field in fields:
+            values = map(operator.itemgetter(field), rows)
+            if field in RESULT_TIME_COLUMNS:
+                columns[field] = pd.Series(list(values), dtype=object)
+                continue
+            try:
+                columns[field] = pd.Series(
+                    np.fromiter(values, dtype=np.float64, count=len(rows))
+                )
+            except (TypeError, ValueError):
+                columns[field] = pd.Series(list(map(operator.itemgetter(field), rows)))
+        return pd.DataFrame(
+            {name: column.reset_index(drop=True) for name, column in columns.items()}
+        )
+
+    @staticmethod
+    def _flatten_groupby(
+        data: List[dict], groupby_names: List[str]
+    ) -> Tuple[List[dict], np.ndarray, List[tuple]]:
+        """
+        Flattens groupby results of any number of groupBy levels
+        :param data: Groupby results
+        :param groupby_names: Names of the groupBy levels
+        :return: Result rows, position of the group of each row and the groups of each groupBy level
+        """
         keys = list(data[0].keys())
         keys.remove("groupByObject")
-        record_dfs = []
+        results = [record[keys[0]] for record in data]
+        lengths = np.fromiter(map(len, results), dtype=np.int64, count=len(results))
+        rows = list(itertools.chain.from_iterable(results))
+        row_groups = np.repeat(np.arange(len(results)), lengths)
+
+        group_objects = [record["groupByObject"] for record in data]
         if len(groupby_names) == 1:
-            for record in data:
-                record_dict = {groupby_names[0]: record["groupByObject"]}
-                record_result = [{**record_dict, **x} for x in record[keys[0]]]
-                record_dfs.extend(record_result)
-        elif len(groupby_names) == 2:
-            for record in data:
-                record_dict = {
-                    groupby_names[0]: record["groupByObject"][0],
-                    groupby_names[1]: record["groupByObject"][1],
-                }
-                record_result = [{**record_dict, **x} for x in record[keys[0]]]
-                record_dfs.extend(record_result)
-        return pd.DataFrame().from_records(record_dfs)
+            group_levels = [tuple(group_objects)]
+        else:
+            group_levels = list(zip(*group_objects))
+        return rows, row_groups, group_levels
 
     @staticmethod
-    def _format_timestamp(dt: pd.Series) -> pd.Series:
-        """Format timestamp column as datetime."""
-        return pd.to_datetime(dt.str.replace("Z", ""), format="ISO8601")
+    def _format_timestamp(dt: pd.Series, utc: bool = False) -> pd.Series:
+        """
+        Format timestamp column as datetime. Each distinct timestamp is parsed only once, since results repeat the
+        same timestamps for every group.
+        :param dt: Column of ISO 8601 timestamps in UTC
+        :param utc: Keep the time zone instead of returning naive timestamps
+        :return:
+        """
+        codes, uniques = pd.factorize(dt)
+        uniques = pd.Index(uniques, dtype=object)
+        if utc:
+            timestamps = pd.to_datetime(uniques, format="ISO8601", utc=True)
+        else:
+            timestamps = pd.to_datetime(uniques.str.replace("Z", ""), format="ISO8601")
+        return pd.Series(
+            timestamps.take(codes, fill_value=pd.NaT), index=dt.index, name=dt.name
+        )
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the response cache"""
+
+import datetime as dt
+import json
+import os
+import time
+
+import pytest
+import responses
+
+from ohsome import OhsomeClient, ResponseCache, MetadataCache
+
+
+def test_key_ignores_unset_parameters():
+    """Test if the cache key is independent of unset parameters and their order."""
+    key = ResponseCache.key("https://mock.com/elements/count", {"a": 1, "b": None})
+    assert key == ResponseCache.key("https://mock.com/elements/count", {"a": "1"})
+    assert key != ResponseCache.key("https://mock.com/elements/area", {"a": "1"})
+
+
+def test_invalidated_by_sequence_number(tmpdir):
+    """Test if cached responses are only returned for the data they were computed from."""
+    cache = ResponseCache(cache_dir=tmpdir.strpath)
+    key = ResponseCache.key("https://mock.com/elements/count", {})
+    cache.put(key, b"content", sequence_number=1)
+
+    assert cache.get(key, sequence_number=1) == b"content"
+    assert cache.get(key, sequence_number=2) is None
+    assert cache.get(key, sequence_number=1) is None
+
+
+def test_eviction(tmpdir):
+    """Test if expired and least recently used responses are removed."""
+    cache = ResponseCache(cache_dir=tmpdir.strpath, max_size=10)
+    old, used, new = [
+        ResponseCache.key("https://mock.com/elements/count", {"filter": name})
+        for name in ["old", "used", "new"]
+    ]
+    cache.put(old, b"12345", sequence_number=1)
+    cache.put(used, b"12345", sequence_number=1)
+    past = time.time() - 60
+    os.utime(tmpdir / f"{old}_1.json", (past, past))
+    os.utime(tmpdir / f"{used}_1.json", (past, past))
+    cache.get(used, sequence_number=1)
+
+    cache.put(new, b"12345", sequence_number=1)
+
+    assert cache.get(old, sequence_number=1) is None
+    assert cache.get(used, sequence_number=1) == b"12345"
+    assert cache.get(new, sequence_number=1) == b"12345"
+
+    cache.max_age = dt.timedelta(seconds=30)
+    assert cache.get(used, sequence_number=1) is None
+    assert cache.get(new, sequence_number=1) == b"12345"
+
+
+def test_foreign_files_kept(tmpdir):
+    """Test if other files in the cache directory survive eviction and clearing of the cache."""
+    cache = ResponseCache(
+        cache_dir=tmpdir.strpath, max_size=1, max_age=dt.timedelta(minutes=1)
+    )
+    foreign = [tmpdir / "my_data.json", tmpdir / "data_2020.json"]
+    past = time.time() - 3600
+    for path in foreign:
+        path.write_text(json.dumps({}), encoding="utf-8")
+        os.utime(path, (past, past))
+    key = ResponseCache.key("https://mock.com/elements/count", {})
+
+    cache.put(key, b"content", sequence_number=1)
+    cache.clear()
+
+    assert all(path.exists() for path in foreign)
+    assert not (tmpdir / f"{key}_1.json").exists()
+    with pytest.raises(ValueError, match="Invalid cache key"):
+        cache.put("my_data", b"content", sequence_number=1)
+
+
+@responses.activate
+def test_client_response_cache(tmpdir, mocked_metadata):
+    """Test if the client answers repeated requests from the cache until the data of the ohsome API is updated."""
+    url = "https://mock.com/elements/count"
+    result = {"result": [{"timestamp": "2018-01-01T00:00:00Z", "value": 1.0}]}
+    responses.get("https://mock.com/metadata", json=mocked_metadata)
+    query = responses.post(url, json=result)
+    cache = ResponseCache(cache_dir=tmpdir.strpath, check_interval=dt.timedelta(0))
+    client = OhsomeClient(base_api_url="https://mock.com", response_cache=cache)
+
+    for _ in range(2):
+        response = client.elements.count.post(bboxes=[8.67, 49.41, 8.68, 49.42])
+        assert response.data == result
+    assert query.call_count == 1
+
+    mocked_metadata["extractRegion"]["replicationSequenceNumber"] += 1
+    responses.replace(responses.GET, "https://mock.com/metadata", json=mocked_metadata)
+    client.elements.count.post(bboxes=[8.67, 49.41, 8.68, 49.42])
+    assert query.call_count == 2
+    assert len(os.listdir(tmpdir)) == 1
+    assert json.loads((tmpdir / os.listdir(tmpdir)[0]).read_binary()) == result
+
+
+@responses.activate
+def test_metadata_cache_shared(mocked_metadata):
+    """Test if the metadata is requested once for all clients of the same ohsome API."""
+    query = responses.get("https://mock.com/metadata", json=mocked_metadata)
+    cache = MetadataCache()
+
+    for _ in range(2):
+        client = OhsomeClient(base_api_url="https://mock.com", metadata_cache=cache)
+        assert client.api_version == "1.10.1"
+        assert client.end_timestamp == dt.datetime(2023, 11, 25, 13)
+    assert query.call_count == 1
+
+    cache.ttl = dt.timedelta(0)
+    assert client.api_version == "1.10.1"
+    assert query.call_count == 2
+
+
+@responses.activate
+def test_metadata_cache_on_disk(tmpdir, mocked_metadata):
+    """Test if the metadata on disk is used by other processes and refreshed in the background."""
+    query = responses.get("https://mock.com/metadata", json=mocked_metadata)
+    ttl = dt.timedelta(minutes=10)
+    client = OhsomeClient(
+        base_api_url="https://mock.com",
+        metadata_cache=MetadataCache(ttl=ttl, cache_dir=tmpdir.strpath),
+    )
+    assert client.metadata == mocked_metadata
+    assert query.call_count == 1
+
+    # metadata stored by another process, which is about to expire
+    past = time.time() - 6 * 60
+    os.utime(tmpdir / os.listdir(tmpdir)[0], (past, past))
+    client = OhsomeClient(
+        base_api_url="https://mock.com",
+        metadata_cache=MetadataCache(ttl=ttl, cache_dir=tmpdir.strpath),
+    )
+    assert client.metadata == mocked_metadata
+    for _ in range(100):
+        if query.call_count == 2:
+            break
+        time.sleep(0.01)
+    assert query.call_count == 2
@@ -2,16 +2,26 @@
 # -*- coding: utf-8 -*-
 
 """Tests for ohsome client"""
+import asyncio
 import datetime as dt
+import gzip
+import json
 import logging
 import os
+from unittest.mock import patch, AsyncMock
+from urllib.parse import parse_qs
 
+import aiohttp
 import geopandas as gpd
 import pandas as pd
 import pytest
+import responses
+from aioresponses import aioresponses
+from urllib3 import Retry
+from yarl import URL
 
 import ohsome
-from ohsome import OhsomeClient
+from ohsome import OhsomeClient, AsyncOhsomeClient, MetadataCache
 from ohsome.constants import OHSOME_VERSION
 
 script_path = os.path.dirname(os.path.realpath(__file__))
@@ -317,3 +327,512 @@ def test_none_init():
         user_agent=None,
         retry=None,
     )
+
+
+def test_shared_transport():
+    """Test if all endpoints share the connection pool and retry configuration of the client."""
+    retry = Retry(total=1)
+    client = OhsomeClient(user_agent="test", retry=retry, pool_size=4)
+    endpoint = client.elements.count.groupBy.boundary
+
+    session = endpoint._session()
+    assert session is client._session()
+    assert session.headers["user-agent"] == f"ohsome-py/{OHSOME_VERSION} test"
+    assert session.get_adapter(client._base_api_url).max_retries is retry
+    assert session.get_adapter(client._base_api_url)._pool_maxsize == 4
+
+
+def test_async_client_post():
+    """Test whether the asynchronous client sends concurrent requests along the endpoint chain."""
+    url = "https://api.ohsome.org/v1/elements/count/groupBy/boundary"
+    bboxes = {"A": [8.67066, 49.41423, 8.68177, 49.4204]}
+    result = {
+        "groupByResult": [
+            {
+                "groupByObject": "A",
+                "result": [{"timestamp": "2018-01-01T00:00:00Z", "value": 3.0}],
+            }
+        ]
+    }
+
+    async def run():
+        async with AsyncOhsomeClient(log=False) as client:
+            endpoint = client.elements.count.groupByBoundary
+            with aioresponses() as mocked:
+                mocked.post(url, payload=result, repeat=True)
+                results = await asyncio.gather(
+                    *[
+                        endpoint.post(bboxes=bboxes, time=f"201{i}-01-01")
+                        for i in range(3)
+                    ]
+                )
+                sent_times = [
+                    call.kwargs["data"]["time"]
+                    for call in mocked.requests[("POST", URL(url))]
+                ]
+        return results, sent_times
+
+    results, sent_times = asyncio.run(run())
+
+    assert sorted(sent_times) == ["2010-01-01", "2011-01-01", "2012-01-01"]
+    for response in results:
+        assert isinstance(response, ohsome.OhsomeResponse)
+        assert response.as_dataframe().index.names == ["boundary", "timestamp"]
+
+
+def test_async_client_error(tmpdir):
+    """Test whether the asynchronous client raises OhsomeExceptions with the message of the ohsome API."""
+    url = "https://api.ohsome.org/v1/elements/count"
+
+    async def run():
+        async with AsyncOhsomeClient(log_dir=tmpdir.strpath) as client:
+            with aioresponses() as mocked:
+                mocked.post(url, payload={"message": "Invalid filter."}, status=400)
+                await client.elements.count.post(bboxes=[8.67, 49.41, 8.68, 49.42])
+
+    with pytest.raises(ohsome.OhsomeException, match="Invalid filter.") as e:
+        asyncio.run(run())
+
+    assert e.value.error_code == 400
+    assert len(tmpdir.listdir()) == 3
+
+
+def test_async_client_retry_connection_error():
+    """Test whether the asynchronous client retries connection errors like the synchronous one."""
+    url = "https://api.ohsome.org/v1/elements/count"
+
+    async def run(retry):
+        async with AsyncOhsomeClient(log=False, retry=retry) as client:
+            with aioresponses() as mocked:
+                mocked.post(url, exception=aiohttp.ClientConnectionError("reset"))
+                mocked.post(url, payload={"result": []})
+                return await client.elements.count.post(
+                    bboxes=[8.67, 49.41, 8.68, 49.42]
+                )
+
+    assert asyncio.run(run(Retry(total=1, backoff_factor=0))).data == {"result": []}
+    with pytest.raises(ohsome.OhsomeException, match="Connection Error"):
+        asyncio.run(run(Retry(total=0)))
+
+
+def test_async_client_retry_status():
+    """Test whether the asynchronous client counts status retries and respects the Retry-After header."""
+    url = "https://api.ohsome.org/v1/elements/count"
+    retry = Retry(
+        total=None,
+        status=2,
+        status_forcelist=[503],
+        allowed_methods=["POST"],
+        backoff_factor=0,
+    )
+
+    async def run():
+        async with AsyncOhsomeClient(log=False, retry=retry) as client:
+            with aioresponses() as mocked:
+                mocked.post(url, status=503, headers={"Retry-After": "5"}, repeat=True)
+                with pytest.raises(ohsome.OhsomeException) as e:
+                    await client.elements.count.post(bboxes=[8.67, 49.41, 8.68, 49.42])
+                return e.value, len(mocked.requests[("POST", URL(url))])
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        error, n_requests = asyncio.run(run())
+
+    assert error.error_code == 503
+    assert n_requests == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [5, 5]
+
+
+def test_async_client_post_many():
+    """Test whether post_many is refused by the asynchronous client instead of returning coroutines."""
+    client = AsyncOhsomeClient(log=False)
+    with pytest.raises(ohsome.OhsomeException, match="asyncio.gather"):
+        client.elements.count.post_many([{"bboxes": [8.67, 49.41, 8.68, 49.42]}])
+
+    query = client.elements.count.prepare(bboxes=[8.67, 49.41, 8.68, 49.42])
+    with pytest.raises(ohsome.OhsomeException, match="asyncio.gather"):
+        query.post_many([{"filter": "building=*"}])
+
+
+def test_async_client_new_event_loop():
+    """Test whether the session of a previous event loop is closed once the client is used in a new one."""
+    client = AsyncOhsomeClient(log=False)
+    sessions = []
+
+    async def run():
+        sessions.append(await client._transport.async_session())
+
+    asyncio.run(run())
+    asyncio.run(run())
+    assert sessions[0] is not sessions[1]
+    assert sessions[0].closed and not sessions[1].closed
+
+    asyncio.run(client.close())
+    assert sessions[1].closed
+
+
+@responses.activate
+def test_post_many(base_client_without_log):
+    """Test whether several requests are sent in parallel and failed requests are returned as exception."""
+    url = "https://api.ohsome.org/v1/elements/count"
+
+    def callback(request):
+        if "invalid" in request.body:
+            return 400, {}, json.dumps({"message": "Invalid filter."})
+        return (
+            200,
+            {},
+            json.dumps(
+                {"result": [{"timestamp": "2018-01-01T00:00:00Z", "value": 1.0}]}
+            ),
+        )
+
+    responses.add_callback(responses.POST, url, callback=callback)
+    parameters = [
+        {"bboxes": [8.67, 49.41, 8.68, 49.42], "filter": "building=*"},
+        {"bboxes": [8.67, 49.41, 8.68, 49.42], "filter": "invalid"},
+        {"bboxes": [8.67, 49.41, 8.68, 49.42], "filter": "highway=*"},
+    ]
+
+    results = list(
+        base_client_without_log.elements.count.post_many(parameters, max_workers=2)
+    )
+
+    assert isinstance(results[0], ohsome.OhsomeResponse)
+    assert isinstance(results[1], ohsome.OhsomeException)
+    assert results[1].message == "Invalid filter."
+    assert isinstance(results[2], ohsome.OhsomeResponse)
+    assert len(responses.calls) == 3
+
+    unordered = base_client_without_log.elements.count.post_many(
+        parameters, ordered=False
+    )
+    assert sorted(type(r).__name__ for r in unordered) == [
+        "OhsomeException",
+        "OhsomeResponse",
+        "OhsomeResponse",
+    ]
+
+
+@responses.activate
+def test_post_many_invalid_parameters(base_client_without_log):
+    """Test whether other errors of one request are returned as exception without aborting the other requests."""
+    url = "https://api.ohsome.org/v1/elements/count"
+    responses.add(responses.POST, url, json={"result": []})
+    parameters = [
+        {"bboxes": [8.67, 49.41, 8.68, 49.42], "time": "2020-01-01"},
+        {"bboxes": [8.67, 49.41, 8.68, 49.42], "time": {"a": 1}},
+        {"bboxes": [8.67, 49.41, 8.68, 49.42], "time": "2021-01-01"},
+    ]
+
+    results = list(base_client_without_log.elements.count.post_many(parameters))
+
+    assert isinstance(results[0], ohsome.OhsomeResponse)
+    assert isinstance(results[1], ohsome.OhsomeException)
+    assert results[1].message.startswith("ValueError")
+    assert results[1].url == url
+    assert results[1].parameters["time"] == {"a": 1}
+    assert isinstance(results[1].__cause__, ValueError)
+    assert isinstance(results[2], ohsome.OhsomeResponse)
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_post_bpolys_chunks(base_client_without_log):
+    """Test whether chunks of bpolys are sent separately and merged as if it was a single request."""
+    url = "https://api.ohsome.org/v1/elements/count/groupBy/boundary"
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson").set_index("id")
+
+    def callback(request):
+        boundaries = json.loads(parse_qs(request.body)["bpolys"][0])
+        result = [
+            {
+                "groupByObject": feature["id"],
+                "result": [{"timestamp": "2018-01-01T00:00:00Z", "value": 1.0}],
+            }
+            for feature in boundaries["features"]
+        ]
+        return 200, {}, json.dumps({"apiVersion": "1.10.1", "groupByResult": result})
+
+    responses.add_callback(responses.POST, url, callback=callback)
+
+    response = base_client_without_log.elements.count.groupByBoundary.post(
+        bpolys=bpolys, time="2018-01-01", chunk_features=1
+    )
+
+    assert len(responses.calls) == 2
+    assert response.data["apiVersion"] == "1.10.1"
+    assert [r["groupByObject"] for r in response.data["groupByResult"]] == ["0", "1"]
+    assert response.as_dataframe().index.get_level_values("boundary").to_list() == [
+        "0",
+        "1",
+    ]
+
+
+def test_post_bpolys_chunks_not_supported(base_client_without_log):
+    """Test whether chunking is refused for results that cannot be merged."""
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson")
+
+    with pytest.raises(ohsome.OhsomeException, match="only supported for groupBy"):
+        base_client_without_log.elements.count.post(bpolys=bpolys, chunk_features=1)
+
+
+@responses.activate
+def test_post_bpolys_chunks_extraction(base_client_without_log):
+    """Test whether features of extraction queries are merged unclipped and chunking of clipped features is refused."""
+    url = "https://api.ohsome.org/v1/elements/geometry"
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson")
+    feature = {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [8.7, 49.4]},
+        "properties": {
+            "@osmId": "node/1",
+            "@snapshotTimestamp": "2018-01-01T00:00:00Z",
+        },
+    }
+    responses.add(
+        responses.POST,
+        url,
+        json={"type": "FeatureCollection", "features": [feature]},
+    )
+
+    for clip_geometry in [None, True, "true"]:
+        with pytest.raises(ohsome.OhsomeException, match="clipGeometry=False"):
+            base_client_without_log.elements.geometry.post(
+                bpolys=bpolys, chunk_features=1, clipGeometry=clip_geometry
+            )
+    assert len(responses.calls) == 0
+
+    response = base_client_without_log.elements.geometry.post(
+        bpolys=bpolys, chunk_features=1, clipGeometry=False
+    )
+    assert len(responses.calls) == 2
+    assert response.data["features"] == [feature]
+
+
+@responses.activate
+def test_post_time_chunks(base_client_without_log):
+    """Test whether a full history query is split by time and versions cut at the borders are merged again."""
+    url = "https://api.ohsome.org/v1/elementsFullHistory/geometry"
+
+    def callback(request):
+        start, end = parse_qs(request.body)["time"][0].split(",")
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [8.7, 49.4]},
+            "properties": {
+                "@osmId": "node/1",
+                "@validFrom": f"{start}Z",
+                "@validTo": f"{end}Z",
+            },
+        }
+        return 200, {}, json.dumps({"type": "FeatureCollection", "features": [feature]})
+
+    responses.add_callback(responses.POST, url, callback=callback)
+
+    response = base_client_without_log.elementsFullHistory.geometry.post(
+        bboxes=[8.67, 49.41, 8.68, 49.42],
+        time="2010-01-01,2013-01-01",
+        chunk_period="YS",
+    )
+
+    assert len(responses.calls) == 3
+    assert len(response.data["features"]) == 1
+    assert response.data["features"][0]["properties"] == {
+        "@osmId": "node/1",
+        "@validFrom": "2010-01-01T00:00:00Z",
+        "@validTo": "2013-01-01T00:00:00Z",
+    }
+
+
+@responses.activate
+def test_post_stream(base_client_without_log):
+    """Test whether the features of a streamed response can be iterated or loaded at once."""
+    url = "https://api.ohsome.org/v1/elements/geometry"
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [8.7, 49.4]},
+            "properties": {
+                "@osmId": f"node/{i}",
+                "@snapshotTimestamp": "2020-01-01T00:00:00Z",
+            },
+        }
+        for i in range(3)
+    ]
+    responses.post(url, json={"type": "FeatureCollection", "features": features})
+    bboxes = [8.67, 49.41, 8.68, 49.42]
+
+    response = base_client_without_log.elements.geometry.post(
+        bboxes=bboxes, stream=True
+    )
+    assert list(response.iter_features()) == features
+    with pytest.raises(ValueError):
+        response.as_dataframe()
+
+    response = base_client_without_log.elements.geometry.post(
+        bboxes=bboxes, stream=True
+    )
+    assert len(response.as_dataframe()) == 3
+    assert list(response.iter_features()) == features
+
+
+@responses.activate
+def test_post_compressed(tmpdir):
+    """Test whether large request bodies are compressed and logged uncompressed."""
+    url = "https://mock.com/elements/count"
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson")
+    bpolys = pd.concat([bpolys] * 3, ignore_index=True)
+    requests_bodies = []
+
+    def callback(request):
+        assert request.headers["Content-Encoding"] == "gzip"
+        requests_bodies.append(parse_qs(gzip.decompress(request.body).decode()))
+        return 400, {}, json.dumps({"message": "Failed on purpose"})
+
+    responses.add_callback(responses.POST, url, callback=callback)
+    client = OhsomeClient(
+        base_api_url="https://mock.com", log_dir=tmpdir.strpath, compression="gzip"
+    )
+
+    with pytest.raises(ohsome.OhsomeException):
+        client.elements.count.post(bpolys=bpolys, time="2018-01-01")
+    assert requests_bodies[0]["time"] == ["2018-01-01"]
+    assert len(gpd.read_file(requests_bodies[0]["bpolys"][0])) == len(bpolys)
+
+    curl = tmpdir.listdir("*_curl.sh")[0].read_text("utf-8")
+    assert "Content-Encoding" not in curl
+    assert "bpolys=" in curl
+
+
+@responses.activate
+def test_post_bpolys_options():
+    """Test whether the encoding options of bpolys are applied to the request of each chunk."""
+    url = "https://mock.com/elements/count/groupBy/boundary"
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson")
+    requests_bodies = []
+
+    def callback(request):
+        requests_bodies.append(parse_qs(request.body))
+        return 200, {}, json.dumps({"groupByResult": []})
+
+    responses.add_callback(responses.POST, url, callback=callback)
+    client = OhsomeClient(base_api_url="https://mock.com", log=False)
+
+    client.elements.count.groupByBoundary.post(
+        bpolys=bpolys, precision=2, drop_properties=True, chunk_features=1
+    )
+
+    assert len(requests_bodies) == len(bpolys)
+    for body in requests_bodies:
+        feature = json.loads(body["bpolys"][0])["features"][0]
+        assert set(feature["properties"]).issubset({"id"})
+        coordinates = gpd.read_file(body["bpolys"][0]).get_coordinates()
+        pd.testing.assert_frame_equal(coordinates, coordinates.round(2))
+
+
+@responses.activate
+def test_prepare():
+    """Test whether the boundary of a prepared query is formatted once and sent with every request."""
+    url = "https://mock.com/elements/count/groupBy/boundary"
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson")
+    requests_bodies = []
+
+    def callback(request):
+        requests_bodies.append(parse_qs(request.body))
+        return 200, {}, json.dumps({"groupByResult": []})
+
+    responses.add_callback(responses.POST, url, callback=callback)
+    client = OhsomeClient(base_api_url="https://mock.com", log=False)
+
+    with patch(
+        "ohsome.clients.format_boundary", wraps=ohsome.clients.format_boundary
+    ) as format_boundary:
+        query = client.elements.count.groupByBoundary.prepare(
+            bpolys=bpolys, time="2020-01-01"
+        )
+        query.post(filter="building=*")
+        list(
+            query.post_many(
+                [{"filter": "highway=*"}, {"filter": "shop=*", "time": "2021-01-01"}]
+            )
+        )
+
+    assert format_boundary.call_count == 1
+    # the requests of post_many() are sent in parallel
+    assert sorted((body["filter"][0], body["time"][0]) for body in requests_bodies) == [
+        ("building=*", "2020-01-01"),
+        ("highway=*", "2020-01-01"),
+        ("shop=*", "2021-01-01"),
+    ]
+    assert len({body["bpolys"][0] for body in requests_bodies}) == 1
+
+    with pytest.raises(ohsome.OhsomeException):
+        query.post(bboxes=[8.67, 49.41, 8.68, 49.42])
+
+
+@responses.activate
+def test_validate(mocked_metadata):
+    """Test whether boundaries and timestamps are checked against the extent of the ohsome API before sending."""
+    url = "https://mock.com/elements/count"
+    requests_bodies = []
+
+    def callback(request):
+        requests_bodies.append(parse_qs(request.body))
+        return 200, {}, json.dumps({"result": []})
+
+    responses.add(responses.GET, "https://mock.com/metadata", json=mocked_metadata)
+    responses.add_callback(responses.POST, url, callback=callback)
+    metadata_cache = MetadataCache()
+
+    client = OhsomeClient(
+        base_api_url="https://mock.com",
+        log=False,
+        metadata_cache=metadata_cache,
+        validate="drop",
+    )
+    client.elements.count.post(
+        bboxes={"A": [8.67, 49.41, 8.68, 49.42], "B": [179.9, 49.41, 180.1, 49.42]},
+        time=["2000-01-01", "2020-01-01", "2030-01-01"],
+    )
+    assert requests_bodies[0]["bboxes"] == ["A:8.67,49.41,8.68,49.42"]
+    assert requests_bodies[0]["time"] == ["2020-01-01"]
+
+    client = OhsomeClient(
+        base_api_url="https://mock.com",
+        log=False,
+        metadata_cache=metadata_cache,
+        validate="reject",
+    )
+    with pytest.raises(ohsome.OhsomeException, match="temporal extent"):
+        client.elements.count.post(bboxes=[8.67, 49.41, 8.68, 49.42], time="2000-01-01")
+    with pytest.raises(ohsome.OhsomeException, match="spatial extent"):
+        client.elements.count.prepare(bcircles=[179.9999, 49.41, 1000])
+    assert len(requests_bodies) == 1
+    assert len(responses.calls) == 2
+
+    with pytest.raises(ValueError):
+        OhsomeClient(validate="fix")
+
+
+@responses.activate
+@pytest.mark.parametrize("chunk_period", [None, "YS"])
+@pytest.mark.parametrize(
+    "time", ["2000-01-01,2005-01-01", "2000-01-01,2010-01-01", "2030-01-01,2000-01-01"]
+)
+def test_validate_full_history_interval(mocked_metadata, chunk_period, time):
+    """Test whether dropping timestamps is refused if less than the interval of a full history query remains."""
+    responses.add(responses.GET, "https://mock.com/metadata", json=mocked_metadata)
+    client = OhsomeClient(
+        base_api_url="https://mock.com",
+        log=False,
+        metadata_cache=MetadataCache(),
+        validate="drop",
+    )
+
+    with pytest.raises(ohsome.OhsomeException, match="temporal extent"):
+        client.elementsFullHistory.geometry.post(
+            bboxes=[8.67, 49.41, 8.68, 49.42],
+            time=time,
+            chunk_period=chunk_period,
+        )
+    assert len(responses.calls) == 1
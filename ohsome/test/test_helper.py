@@ -11,7 +11,8 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
-from shapely import Polygon
+import shapely
+from shapely import Polygon, Point
 
 from ohsome import OhsomeException
 from ohsome.helper import (
@@ -21,6 +22,16 @@ from ohsome.helper import (
     convert_arrays,
     format_list_parameters,
     format_bpolys,
+    split_bpolys,
+    split_time_interval,
+    stitch_history_features,
+    iter_geojson_features,
+    geometries_from_geojson,
+    format_bboxes,
+    format_bcircles,
+    bpolys_size,
+    validate_boundary,
+    validate_time,
 )
 
 script_path = os.path.dirname(os.path.realpath(__file__))
@@ -186,6 +197,71 @@ def test_format_time():
         assert v["output"] == output, f"Input type {k} not correctly formatted."
 
 
+@pytest.mark.parametrize(
+    "time,expected",
+    [
+        (
+            pd.date_range("2010-01-01", periods=120, freq="MS"),
+            "2010-01-01T00:00:00/2019-12-01T00:00:00/P1M",
+        ),
+        (
+            pd.date_range("2010-01-01", periods=10, freq="YS"),
+            "2010-01-01T00:00:00/2019-01-01T00:00:00/P1Y",
+        ),
+        (
+            pd.date_range("2010-01-01", periods=100, freq="6h")[::-1],
+            "2010-01-01T00:00:00/2010-01-25T18:00:00/PT6H",
+        ),
+        (
+            pd.DatetimeIndex(["2012-01-01", "2010-01-01", "2011-01-01", "2010-01-01"]),
+            "2010-01-01T00:00:00/2012-01-01T00:00:00/P1Y",
+        ),
+        (
+            pd.DatetimeIndex(["2010-01-01", "2010-01-02", "2010-01-04"]),
+            "2010-01-01T00:00:00,2010-01-02T00:00:00,2010-01-04T00:00:00",
+        ),
+        (
+            ["2020-01-01", "2019-01-01T00:00:00Z", "2020-01-01T00:00:00"],
+            "2019-01-01T00:00:00Z,2020-01-01",
+        ),
+    ],
+)
+def test_format_time_sorted_and_compact(time, expected):
+    """Test whether timestamps are sorted and deduplicated and regular ones are sent as interval."""
+    assert format_time(time) == expected
+
+
+@pytest.mark.parametrize(
+    "time,expected",
+    [
+        (
+            pd.date_range("2020-01-01", periods=12, freq="MS", tz="Europe/Berlin"),
+            ",".join(
+                t.isoformat()
+                for t in pd.date_range(
+                    "2020-01-01", periods=12, freq="MS", tz="Europe/Berlin"
+                )
+            ),
+        ),
+        (
+            pd.date_range("2020-03-28", periods=3, freq="D", tz="Europe/Berlin"),
+            "2020-03-28T00:00:00+01:00,2020-03-29T00:00:00+01:00,2020-03-30T00:00:00+02:00",
+        ),
+        (
+            pd.date_range("2020-03-29", periods=4, freq="h", tz="Europe/Berlin"),
+            "2020-03-29T00:00:00+01:00/2020-03-29T04:00:00+02:00/PT1H",
+        ),
+        (
+            pd.date_range("2020-01-01", periods=12, freq="MS", tz="UTC"),
+            "2020-01-01T00:00:00+00:00/2020-12-01T00:00:00+00:00/P1M",
+        ),
+    ],
+)
+def test_format_time_time_zone(time, expected):
+    """Test whether time zone aware timestamps are only sent as interval if they are regular in UTC."""
+    assert format_time(time) == expected
+
+
 def test_format_time_error_format_not_supported():
     """Test weather a time with wrong type (e.g. a dict) raises an error."""
     with pytest.raises(
@@ -261,3 +337,376 @@ def test_format_bpolys():
         crs="EPSG:4326",
     )
     assert format_bpolys(df) == geojson
+
+
+def test_split_bpolys():
+    """Test if bpolys are split into chunks by number of features and size."""
+    bpolys = gpd.read_file(f"{script_path}/data/polygons.geojson").set_index("id")
+
+    chunks = split_bpolys(bpolys, max_features=1)
+    assert [chunk.index.to_list() for chunk in chunks] == [["0"], ["1"]]
+
+    chunks = split_bpolys(bpolys, max_bytes=10)
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+
+    chunks = split_bpolys(bpolys["geometry"], max_features=5, max_bytes=10**6)
+    assert [chunk.index.to_list() for chunk in chunks] == [["0", "1"]]
+
+    with pytest.raises(OhsomeException):
+        split_bpolys(json.dumps({}), max_features=1)
+
+
+def test_split_time_interval():
+    """Test if a time interval is split into sub-intervals aligned to the period."""
+    borders = split_time_interval("2010-03-01,2012-06-01T00:00:00Z", "YS")
+    assert borders == [
+        "2010-03-01T00:00:00",
+        "2011-01-01T00:00:00",
+        "2012-01-01T00:00:00",
+        "2012-06-01T00:00:00",
+    ]
+
+    with pytest.raises(OhsomeException):
+        split_time_interval("2010-01-01/2012-01-01/P1Y", "YS")
+
+
+def test_stitch_history_features():
+    """Test if versions cut at the border of two intervals are merged again."""
+
+    def feature(osm_id, valid_from, valid_to, highway="primary"):
+        return {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [0.0, 0.0]},
+            "properties": {
+                "@osmId": osm_id,
+                "@validFrom": valid_from,
+                "@validTo": valid_to,
+                "highway": highway,
+            },
+        }
+
+    borders = ["2010-01-01T00:00:00", "2011-01-01T00:00:00", "2012-01-01T00:00:00"]
+    chunks = [
+        [
+            feature("way/1", "2010-01-01T00:00:00Z", "2011-01-01T00:00:00Z"),
+            feature("way/2", "2010-01-01T00:00:00Z", "2010-06-01T00:00:00Z"),
+            feature("way/3", "2010-01-01T00:00:00Z", "2011-01-01T00:00:00Z"),
+        ],
+        [
+            feature("way/1", "2011-01-01T00:00:00Z", "2012-01-01T00:00:00Z"),
+            feature("way/3", "2011-01-01T00:00:00Z", "2012-01-01T00:00:00Z", "road"),
+        ],
+    ]
+
+    features = stitch_history_features(chunks, borders)
+
+    assert [
+        (f["properties"]["@osmId"], f["properties"]["@validTo"]) for f in features
+    ] == [
+        ("way/1", "2012-01-01T00:00:00Z"),
+        ("way/2", "2010-06-01T00:00:00Z"),
+        ("way/3", "2011-01-01T00:00:00Z"),
+        ("way/3", "2012-01-01T00:00:00Z"),
+    ]
+    assert features[0]["properties"]["@validFrom"] == "2010-01-01T00:00:00Z"
+
+
+def test_iter_geojson_features():
+    """Test if features are parsed from a GeoJSON document split into arbitrary chunks."""
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [8.7, 49.4]},
+            "properties": {"@osmId": f"node/{i}", "name": "Café ü"},
+        }
+        for i in range(3)
+    ]
+    document = json.dumps(
+        {
+            "attribution": {"text": "©"},
+            "type": "FeatureCollection",
+            "features": features,
+        },
+        ensure_ascii=False,
+        indent=2,
+    ).encode("utf-8")
+
+    for chunk_size in (1, 7, len(document)):
+        chunks = [
+            document[i : i + chunk_size] for i in range(0, len(document), chunk_size)
+        ]
+        assert list(iter_geojson_features(chunks)) == features
+
+    assert list(iter_geojson_features([b'{"features" : [ ]}'])) == []
+
+
+def test_iter_geojson_features_broken_response():
+    """Test if errors reported within or after the features are raised."""
+    invalid_response = f"{script_path}/data/invalid_response.txt"
+    with open(invalid_response, "rb") as src:
+        with pytest.raises(OhsomeException) as e:
+            list(iter_geojson_features(src))
+    assert e.value.error_code == 500
+
+    document = (
+        b'{"type" : "FeatureCollection", "features" : [{\n  "timestamp" : "2024-07-31T10:37:31",\n'
+        b'  "status" : 413,\n  "message" : "The given query is too large in respect to the given timeout."\n}'
+    )
+    with pytest.raises(OhsomeException, match="too large") as e:
+        list(iter_geojson_features([document]))
+    assert e.value.error_code == 413
+
+
+def test_geometries_from_geojson():
+    """Test whether GeoJSON geometries are converted in bulk including missing geometries."""
+    geometries = geometries_from_geojson(
+        [
+            {"type": "Point", "coordinates": [8.7, 49.4]},
+            None,
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        ]
+    )
+    assert geometries[0] == Point(8.7, 49.4)
+    assert geometries[1] is None
+    assert geometries[2] == Polygon([(0, 0), (1, 0), (1, 1)])
+
+
+def test_format_bboxes_dataframe_as_rows():
+    """Test whether bboxes given as DataFrame are formatted as if each row was formatted on its own."""
+    bboxes = pd.DataFrame(
+        {
+            "minx": [8.1, 1 / 3, 1e-5],
+            "miny": [49, 50, 51],
+            "maxx": [8.2, 0.1 + 0.2, 2.0],
+            "maxy": [49.5, 50.5, 51.5],
+        },
+        index=["a", "b", "c"],
+    )
+    expected = "|".join(
+        f"{name}:{row['minx']},{row['miny']},{row['maxx']},{row['maxy']}"
+        for name, row in bboxes.iterrows()
+    )
+
+    assert format_bboxes(bboxes) == expected
+    assert format_bboxes(bboxes, precision=2).split("|")[1] == "b:0.33,50.0,0.3,50.5"
+
+
+def test_format_bcircles_geodataframe_precision():
+    """Test whether the coordinates of bcircles given as GeoDataFrame are rounded to the precision."""
+    bcircles = gpd.GeoDataFrame(
+        {"radius": [100, 200]},
+        geometry=[Point(8.123456, 49.123456), Point(8.5, 49.5)],
+        index=[1, 2],
+    )
+
+    assert format_bcircles(bcircles) == "1:8.123456,49.123456,100|2:8.5,49.5,200"
+    assert format_bcircles(bcircles, precision=3) == "1:8.123,49.123,100|2:8.5,49.5,200"
+    assert format_bcircles([8.123456, 49.1, 100], precision=3) == "8.123,49.1,100"
+
+
+def test_format_bpolys_options():
+    """Test whether bpolys are rounded, simplified and stripped of their columns when encoded."""
+    bpolys = gpd.GeoDataFrame(
+        {"name": ["a"], "id": ["boundary1"]},
+        geometry=[
+            Polygon(
+                [(0.123456, 0.0), (0.5, 1e-9), (1.0, 0.0), (1.0, 1.0), (0.123456, 0.0)]
+            )
+        ],
+        crs="EPSG:4326",
+    )
+
+    encoded = format_bpolys(bpolys, precision=3, simplify=1e-4, drop_properties=True)
+
+    feature = json.loads(encoded)["features"][0]
+    assert feature["properties"] == {"id": "boundary1"}
+    assert feature["geometry"]["coordinates"] == [
+        [[0.123, 0.0], [1.0, 0.0], [1.0, 1.0], [0.123, 0.0]]
+    ]
+    assert " " not in encoded
+    assert bpolys_size(bpolys, precision=3, simplify=1e-4, drop_properties=True) == len(
+        encoded
+    )
+    assert bpolys_size(bpolys) > len(encoded)
+
+
+def test_format_bpolys_simplify_coverage():
+    """Test whether adjacent polygons are simplified without gaps and overlaps along their shared border."""
+    x = 1 + 0.04 * np.sin(np.arange(21) * 2.3)
+    x[0] = x[-1] = 1
+    border = list(zip(x, np.linspace(0, 1, 21)))
+    bpolys = gpd.GeoSeries(
+        [
+            Polygon([*border[7:], (0, 1), (0, 0), *border[:7]]),
+            Polygon([(2, 0), (2, 1), *border[::-1]]),
+        ],
+        crs="EPSG:4326",
+    )
+
+    features = json.loads(format_bpolys(bpolys, simplify=0.05))["features"]
+
+    a, b = [shapely.geometry.shape(feature["geometry"]) for feature in features]
+    assert len(a.exterior.coords) < len(border) + 2
+    assert a.intersection(b).area < 1e-12
+    assert bpolys.union_all().difference(a.union(b)).area < 1e-12
+
+
+def test_format_bpolys_geojson_string():
+    """Test whether bpolys given as GeoJSON string are checked and sent unchanged, keeping their ids."""
+    polygon = {
+        "type": "Polygon",
+        "coordinates": [[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]],
+    }
+    geojson = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "id": "a", "properties": {}, "geometry": polygon},
+                {"type": "Feature", "id": "b", "properties": {}, "geometry": polygon},
+            ],
+        },
+        indent=1,
+    )
+
+    assert format_bpolys(geojson) is geojson
+    encoded = json.loads(format_bpolys(geojson, precision=3))
+    assert [feature["id"] for feature in encoded["features"]] == ["a", "b"]
+
+    with pytest.raises(OhsomeException, match="not unique"):
+        format_bpolys(geojson.replace('"b"', '"a"'))
+    with pytest.raises(OhsomeException, match="Polygon"):
+        format_bpolys(geojson.replace('"Polygon"', '"LineString"'))
+    with pytest.raises(OhsomeException, match="FeatureCollection"):
+        format_bpolys(json.dumps(polygon))
+    with pytest.raises(OhsomeException, match="Invalid geojson"):
+        format_bpolys(geojson[:-1])
+
+
+def test_format_bpolys_geojson_string_without_ids():
+    """Test whether features of a GeoJSON string without id get their position as id."""
+    polygon = {
+        "type": "Polygon",
+        "coordinates": [[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]],
+    }
+    geojson = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "properties": {}, "geometry": polygon},
+                {"type": "Feature", "id": "b", "properties": {}, "geometry": polygon},
+                {"type": "Feature", "properties": {}, "geometry": polygon},
+            ],
+        }
+    )
+
+    for encoded in (format_bpolys(geojson), format_bpolys(geojson, precision=3)):
+        features = json.loads(encoded)["features"]
+        assert [feature["id"] for feature in features] == ["0", "b", "2"]
+
+
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        ("drop", {"bboxes": "a:1,1,2,2", "bcircles": "a:1,1,100"}),
+        (
+            "clip",
+            {"bboxes": "a:1,1,2,2|b:8.0,8.0,10.0,10.0", "bcircles": "a:1,1,100"},
+        ),
+    ],
+)
+def test_validate_boundary(mode, expected):
+    """Test whether boundaries outside the spatial extent are dropped or clipped."""
+    extent = {
+        "type": "Polygon",
+        "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]],
+    }
+    bpolys = gpd.GeoDataFrame(
+        geometry=[
+            Polygon([(1, 1), (2, 1), (2, 2), (1, 2)]),
+            Polygon([(8, 8), (12, 8), (12, 12), (8, 12)]),
+            Polygon([(20, 20), (21, 20), (21, 21), (20, 21)]),
+        ],
+        crs="EPSG:4326",
+    )
+
+    boundaries = {
+        "bboxes": "a:1,1,2,2|b:8,8,12,12|c:20,20,21,21",
+        "bcircles": "a:1,1,100|b:9.99999,5,1000|c:20,20,100",
+    }
+    for name, boundary in boundaries.items():
+        assert validate_boundary({name: boundary}, extent, mode) == {
+            name: expected[name]
+        }
+
+    params = validate_boundary({"bpolys": format_bpolys(bpolys)}, extent, mode)
+    result = gpd.read_file(params["bpolys"])
+    assert result["id"].tolist() == (["0"] if mode == "drop" else ["0", "1"])
+    assert result.union_all().bounds == (
+        (1.0, 1.0, 2.0, 2.0) if mode == "drop" else (1.0, 1.0, 10.0, 10.0)
+    )
+
+    with pytest.raises(OhsomeException, match="'b', 'c'"):
+        validate_boundary(
+            {"bboxes": "a:1,1,2,2|b:8,8,12,12|c:20,20,21,21"}, extent, "reject"
+        )
+    with pytest.raises(OhsomeException, match="None of the boundaries"):
+        validate_boundary({"bcircles": "20,20,100"}, extent, mode)
+
+
+@pytest.mark.parametrize(
+    "time,mode,expected",
+    [
+        ("2010-01-01,2020-01-01", "reject", "2010-01-01,2020-01-01"),
+        ("2000-01-01,2010-01-01,2030-01-01", "drop", "2010-01-01"),
+        (
+            "2000-01-01,2001-01-01,2010-01-01,2030-01-01",
+            "clip",
+            "2007-10-08T00:00:00Z,2010-01-01,2023-11-25T13:00:00Z",
+        ),
+        (
+            "2000-01-01/2030-01-01/P1M",
+            "drop",
+            "2007-11-01T00:00:00/2023-11-25T13:00:00Z/P1M",
+        ),
+        (
+            "2000-01-01/2030-01-01/P1M",
+            "clip",
+            "2007-11-01T00:00:00/2023-11-25T13:00:00Z/P1M",
+        ),
+        ("2000-01-01/2010-01-01/P1Y", "clip", "2008-01-01T00:00:00/2010-01-01/P1Y"),
+        ("2000-01-01/2010-01-01", "clip", "2007-10-08T00:00:00Z/2010-01-01"),
+        ("2007-10-01/2008-01-01/PT6H", "drop", "2007-10-08T00:00:00/2008-01-01/PT6H"),
+        (
+            "2000-01-01/2010-01-01,2010-01-01//P1Y",
+            "drop",
+            "2007-10-08T00:00:00Z/2010-01-01,2010-01-01//P1Y",
+        ),
+    ],
+)
+def test_validate_time(time, mode, expected):
+    """Test whether timestamps outside the temporal extent are dropped or clipped."""
+    extent = {
+        "fromTimestamp": "2007-10-08T00:00:00Z",
+        "toTimestamp": "2023-11-25T13:00:00Z",
+    }
+    assert validate_time(time, extent, mode) == expected
+
+
+def test_validate_time_outside_extent():
+    """Test whether timestamps outside the temporal extent raise an exception."""
+    extent = {
+        "fromTimestamp": "2007-10-08T00:00:00Z",
+        "toTimestamp": "2023-11-25T13:00:00Z",
+    }
+    with pytest.raises(OhsomeException, match=r"\['2000-01-01'\]"):
+        validate_time("2000-01-01,2010-01-01", extent, "reject")
+    with pytest.raises(OhsomeException, match="None of the timestamps"):
+        validate_time("2030-01-01,2000-01-01/2001-01-01", extent, "drop")
+    with pytest.raises(OhsomeException, match="at least 2 timestamps"):
+        validate_time("2000-01-01,2010-01-01", extent, "drop", min_timestamps=2)
+    with pytest.raises(OhsomeException, match="at least 2 timestamps"):
+        validate_time("2030-01-01,2040-01-01", extent, "clip", min_timestamps=2)
+    assert (
+        validate_time("2000-01-01/2010-01-01", extent, "drop", min_timestamps=2)
+        == "2007-10-08T00:00:00Z/2010-01-01"
+    )
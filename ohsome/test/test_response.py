@@ -1,17 +1,24 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """Tests for ohsome API response"""
+import copy
+import gzip
+import json
 import warnings
 from datetime import datetime
+from unittest.mock import patch
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from geopandas.testing import assert_geodataframe_equal
 from requests import Response
 from shapely import Point
 
-from ohsome import OhsomeResponse
+from ohsome import OhsomeResponse, OhsomeException
 
 
 @pytest.mark.vcr
@@ -566,3 +573,471 @@ def test_explode_tags_present_on_empty_result():
     )
 
     assert_geodataframe_equal(computed_df, expected_df, check_like=True)
+
+
+def test_concat(dummy_ohsome_response):
+    """Test whether responses are concatenated and duplicate features can be dropped."""
+    concatenated = OhsomeResponse.concat([dummy_ohsome_response, dummy_ohsome_response])
+    assert len(concatenated.data["features"]) == 2
+
+    concatenated = OhsomeResponse.concat(
+        [dummy_ohsome_response, dummy_ohsome_response], drop_duplicate_features=True
+    )
+    assert len(concatenated.data["features"]) == 1
+    assert len(dummy_ohsome_response.data["features"]) == 1
+
+
+def test_groupby_dataframe_any_number_of_levels():
+    """Test whether groupBy results are converted for any number of groupBy levels."""
+    data = {
+        "groupByResult": [
+            {
+                "groupByObject": ["boundary1", "amenity=cafe", "node"],
+                "result": [
+                    {
+                        "fromTimestamp": "2018-01-01T00:00:00Z",
+                        "toTimestamp": "2019-01-01T00:00:00Z",
+                        "value": 1.0,
+                    },
+                    {
+                        "fromTimestamp": "2019-01-01T00:00:00Z",
+                        "toTimestamp": "2020-01-01T00:00:00Z",
+                        "value": 2.0,
+                    },
+                ],
+            },
+            {"groupByObject": ["boundary2", "amenity=cafe", "way"], "result": []},
+            {
+                "groupByObject": ["boundary2", "amenity=bar", "node"],
+                "result": [
+                    {
+                        "fromTimestamp": "2018-01-01T00:00:00Z",
+                        "toTimestamp": "2019-01-01T00:00:00Z",
+                        "value": 3.0,
+                    },
+                ],
+            },
+        ]
+    }
+    response = OhsomeResponse(
+        data=data,
+        url="https://mock.com/contributions/count/groupBy/a/groupBy/b/groupBy/c",
+    )
+
+    result = response.as_dataframe(multi_index=False)
+
+    expected = pd.DataFrame(
+        {
+            "a": ["boundary1", "boundary1", "boundary2"],
+            "b": ["amenity=cafe", "amenity=cafe", "amenity=bar"],
+            "c": ["node", "node", "node"],
+            "fromTimestamp": pd.to_datetime(["2018-01-01", "2019-01-01", "2018-01-01"]),
+            "toTimestamp": pd.to_datetime(["2019-01-01", "2020-01-01", "2019-01-01"]),
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+    assert response.as_dataframe().index.names == [
+        "a",
+        "b",
+        "c",
+        "fromTimestamp",
+        "toTimestamp",
+    ]
+
+
+def test_as_dataframe_does_not_change_data(dummy_ohsome_response):
+    """Test whether conversions with different arguments neither change the data nor each other."""
+    features = copy.deepcopy(dummy_ohsome_response.data["features"])
+
+    exploded = dummy_ohsome_response.as_dataframe(explode_tags=("highway",))
+    not_exploded = dummy_ohsome_response.as_dataframe()
+    all_tags = dummy_ohsome_response.as_dataframe(explode_tags=None)
+
+    assert dummy_ohsome_response.data["features"] == features
+    assert exploded["highway"].tolist() == ["primary"]
+    assert not_exploded["@other_tags"].tolist() == [
+        {"highway": "primary", "width": "10"}
+    ]
+    assert all_tags["width"].tolist() == ["10"]
+
+
+def test_as_dataframe_memoized(dummy_ohsome_response):
+    """Test whether a data frame is converted once for the same arguments and changes to it are not kept."""
+    with patch.object(
+        OhsomeResponse,
+        "_as_geodataframe",
+        autospec=True,
+        side_effect=OhsomeResponse._as_geodataframe,
+    ) as conversion:
+        first = dummy_ohsome_response.as_dataframe(explode_tags=["highway"])
+        first["highway"] = "secondary"
+        second = dummy_ohsome_response.as_dataframe(explode_tags=("highway",))
+
+    assert conversion.call_count == 1
+    assert second["highway"].tolist() == ["primary"]
+
+
+def test_to_parquet(dummy_ohsome_response, tmpdir):
+    """Test whether extracted features are written to GeoParquet in row groups."""
+    features = dummy_ohsome_response.data["features"]
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                **features[0],
+                "properties": {**features[0]["properties"], "@osmId": f"node/{i}"},
+            }
+            for i in range(3)
+        ],
+    }
+    outfile = tmpdir / "features.parquet"
+
+    dummy_ohsome_response.to_parquet(
+        outfile.strpath, explode_tags=("highway",), row_group_size=2
+    )
+
+    assert pq.ParquetFile(outfile.strpath).num_row_groups == 2
+    result = gpd.read_parquet(outfile.strpath)
+    assert result.crs == "OGC:CRS84"
+    assert result.geometry.tolist() == [Point(0, 0)] * 3
+    assert result["@osmId"].tolist() == ["node/0", "node/1", "node/2"]
+    assert result["highway"].tolist() == ["primary"] * 3
+    assert result["@other_tags"].tolist() == [[("width", "10")]] * 3
+    assert result["@snapshotTimestamp"].tolist() == [pd.Timestamp("2024-01-01")] * 3
+
+
+def test_to_parquet_null_first_row_group(dummy_ohsome_response, tmpdir):
+    """Test whether properties without value in the first row group are written as strings."""
+    feature = dummy_ohsome_response.data["features"][0]
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": [
+            {**feature, "properties": {**feature["properties"], "@version": version}}
+            for version in (None, 2)
+        ],
+    }
+    outfile = tmpdir / "features.parquet"
+
+    dummy_ohsome_response.to_parquet(outfile.strpath, row_group_size=1)
+
+    table = pq.read_table(outfile.strpath)
+    assert table.schema.field("@version").type == pa.string()
+    assert table["@version"].to_pylist() == [None, "2"]
+
+
+@pytest.mark.parametrize(
+    "filename,opener,separator",
+    [("features.geojsons", open, b"\x1e"), ("features.ndjson.gz", gzip.open, b"")],
+)
+def test_to_geojsonseq(dummy_ohsome_response, tmpdir, filename, opener, separator):
+    """Test whether extracted features are written one per line, optionally compressed."""
+    outfile = tmpdir / filename
+
+    dummy_ohsome_response.to_geojsonseq(
+        outfile.strpath, record_separator=bool(separator)
+    )
+
+    with opener(outfile.strpath, "rb") as src:
+        lines = src.read().splitlines()
+    assert all(line.startswith(separator) for line in lines)
+    assert [json.loads(line[len(separator) :]) for line in lines] == (
+        dummy_ohsome_response.data["features"]
+    )
+
+
+def test_to_geojsonseq_aggregation(tmpdir):
+    """Test whether aggregation results cannot be written as GeoJSON text sequence."""
+    response = OhsomeResponse(data={"result": []})
+    with pytest.raises(TypeError):
+        response.to_geojsonseq((tmpdir / "result.geojsons").strpath)
+
+
+def test_iter_dataframes(dummy_ohsome_response):
+    """Test whether features are converted in chunks with the same columns and data types."""
+    feature = dummy_ohsome_response.data["features"][0]
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": [
+            {**feature, "properties": {**feature["properties"], "@osmId": "node/1"}},
+            {**feature, "properties": {**feature["properties"], "@osmId": "node/2"}},
+            {
+                **feature,
+                "properties": {
+                    "@osmId": "node/3",
+                    "@snapshotTimestamp": "2024-01-01",
+                },
+            },
+        ],
+    }
+
+    chunks = list(
+        dummy_ohsome_response.iter_dataframes(chunk_size=2, explode_tags=("highway",))
+    )
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0].dtypes.equals(chunks[1].dtypes)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks),
+        dummy_ohsome_response.as_dataframe(explode_tags=("highway",)),
+    )
+
+
+def test_iter_dataframes_missing_values(dummy_ohsome_response):
+    """Test whether missing values in later chunks are kept in integer and boolean columns."""
+    feature = dummy_ohsome_response.data["features"][0]
+    properties = {**feature["properties"], "@version": 1, "@deletion": False}
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": [
+            {**feature, "properties": properties},
+            {**feature, "properties": {**properties, "@version": 2}},
+            {**feature, "properties": {**properties, "@version": None}},
+            {**feature, "properties": {**properties, "@deletion": None}},
+        ],
+    }
+
+    chunks = list(
+        dummy_ohsome_response.iter_dataframes(chunk_size=2, multi_index=False)
+    )
+
+    assert chunks[0].dtypes.equals(chunks[1].dtypes)
+    assert chunks[1]["@version"].dtype == "Int64"
+    assert chunks[1]["@version"].isna().tolist() == [True, False]
+    assert chunks[1]["@deletion"].dtype == "boolean"
+    assert chunks[1]["@deletion"].isna().tolist() == [False, True]
+
+
+def test_iter_dataframes_unknown_column(dummy_ohsome_response):
+    """Test whether properties missing in the first chunk raise an error."""
+    feature = dummy_ohsome_response.data["features"][0]
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": [
+            feature,
+            {**feature, "properties": {**feature["properties"], "@version": 2}},
+        ],
+    }
+    with pytest.raises(ValueError):
+        list(dummy_ohsome_response.iter_dataframes(chunk_size=1))
+
+
+def test_lazy_content(tmpdir):
+    """Test whether raw content is decoded on first access only and saved as it is."""
+    content = b'{"result": [{"timestamp": "2024-01-01T00:00:00Z", "value": 1.0}]}'
+    response = OhsomeResponse(content=content)
+    outfile = tmpdir / "response.json"
+
+    response.save(outfile.strpath)
+    assert response._data is None
+    assert outfile.read_binary() == content
+
+    response.drop_content()
+    assert response._content is None
+    assert response.data["result"][0]["value"] == 1.0
+    response.save(outfile.strpath)
+    assert json.loads(outfile.read_binary()) == json.loads(content)
+
+
+def test_lazy_content_invalid():
+    """Test whether invalid raw content raises an OhsomeException on access."""
+    response = OhsomeResponse(content=b'{"result": [')
+    with pytest.raises(OhsomeException):
+        _ = response.data
+
+
+def test_groupby_to_arrow():
+    """Test whether groupBy results are converted to Arrow tables with a column per groupBy level."""
+    data = {
+        "groupByResult": [
+            {
+                "groupByObject": ["boundary1", "amenity=cafe"],
+                "result": [{"timestamp": "2018-01-01T00:00:00Z", "value": 1.0}],
+            },
+            {
+                "groupByObject": ["boundary2", "amenity=cafe"],
+                "result": [
+                    {"timestamp": "2018-01-01T00:00:00Z", "value": 2.0},
+                    {"timestamp": "2019-01-01T00:00:00Z", "value": 3.0},
+                ],
+            },
+        ]
+    }
+    response = OhsomeResponse(
+        data=data, url="https://mock.com/elements/count/groupBy/boundary/groupBy/tag"
+    )
+
+    table = response.to_arrow()
+
+    assert table.column_names == ["boundary", "tag", "timestamp", "value"]
+    assert table["boundary"].to_pylist() == ["boundary1", "boundary2", "boundary2"]
+    assert table["timestamp"].type == pa.timestamp("us")
+    assert table["value"].to_pylist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("key", ["groupByResult", "groupByBoundaryResult"])
+def test_empty_groupby_to_arrow(key):
+    """Test whether empty groupBy results are converted to empty Arrow tables."""
+    response = OhsomeResponse(
+        data={key: []}, url="https://mock.com/elements/count/groupBy/boundary"
+    )
+
+    table = response.to_arrow()
+
+    assert table.num_rows == 0
+    assert table.column_names == ["boundary"]
+
+
+@pytest.mark.parametrize("tag_dtype", ["sparse", "category"])
+def test_tag_dtype(dummy_ohsome_response, tag_dtype):
+    """Test whether exploded tags can be stored in memory-efficient columns."""
+    features = dummy_ohsome_response.data["features"]
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": features
+        + [
+            {
+                **features[0],
+                "properties": {
+                    "@osmId": "node/1",
+                    "@snapshotTimestamp": "2024-01-01",
+                    "name": "x",
+                },
+            }
+        ],
+    }
+
+    expected = dummy_ohsome_response.as_dataframe(explode_tags=None)
+    result = dummy_ohsome_response.as_dataframe(explode_tags=None, tag_dtype=tag_dtype)
+
+    assert set(result.columns) == set(expected.columns)
+    for tag in ["highway", "width", "name"]:
+        assert result[tag].dtype.name.lower().startswith(tag_dtype)
+        pd.testing.assert_series_equal(
+            result[tag].astype(object), expected[tag].astype(object)
+        )
+
+    result = dummy_ohsome_response.as_dataframe(
+        explode_tags=("name",), tag_dtype=tag_dtype
+    )
+    assert result["@other_tags"].tolist() == [{}, {"highway": "primary", "width": "10"}]
+
+
+def test_sparse_tag_without_private_pandas(dummy_ohsome_response):
+    """Test whether sparse tag columns are created without the private pandas module as well."""
+    feature = dummy_ohsome_response.data["features"][0]
+    dummy_ohsome_response.data = {
+        "type": "FeatureCollection",
+        "features": [
+            feature,
+            {**feature, "properties": {"@osmId": "node/1", "name": "x"}},
+        ],
+    }
+    expected = dummy_ohsome_response.as_dataframe(explode_tags=None, tag_dtype="sparse")
+    with patch("ohsome.response.IntIndex", None):
+        result = dummy_ohsome_response.as_dataframe(
+            explode_tags=None, tag_dtype="sparse"
+        )
+    assert_geodataframe_equal(result, expected)
+
+
+def test_tags_as_dataframe(dummy_ohsome_response):
+    """Test whether tags are converted to a long-format data frame."""
+    result = dummy_ohsome_response.tags_as_dataframe()
+
+    assert result["feature"].tolist() == [0, 0]
+    assert result["key"].tolist() == ["highway", "width"]
+    assert result["value"].tolist() == ["primary", "10"]
+    assert isinstance(result["key"].dtype, pd.CategoricalDtype)
+
+
+def test_as_wide_dataframe():
+    """Test whether groupBy results are converted to one column per group and row per timestamp."""
+    timestamps = ["2020-01-01T00:00:00Z", "2021-01-01T00:00:00Z"]
+    data = {
+        "groupByResult": [
+            {
+                "groupByObject": boundary,
+                "result": [
+                    {"timestamp": t, "value": value + i}
+                    for i, t in enumerate(timestamps)
+                ],
+            }
+            for boundary, value in [("b", 1.0), ("a", 10.0)]
+        ]
+    }
+    response = OhsomeResponse(
+        data=data, url="https://api.ohsome.org/v1/elements/count/groupBy/boundary"
+    )
+
+    expected = response.as_dataframe()["value"].unstack("boundary")
+    pd.testing.assert_frame_equal(
+        response.as_wide_dataframe(),
+        expected[["b", "a"]],
+        check_names=False,
+        check_column_type=False,
+    )
+
+
+def test_as_array_ratio():
+    """Test whether ratio results of several groupBy levels are converted to a cube with a dimension per field."""
+    data = {
+        "groupByBoundaryResult": [
+            {
+                "groupByObject": ["boundary1", "building=yes"],
+                "ratioResult": [
+                    {
+                        "timestamp": "2020-01-01T00:00:00Z",
+                        "value": 1.0,
+                        "value2": 2.0,
+                        "ratio": 2.0,
+                    }
+                ],
+            },
+            {
+                "groupByObject": ["boundary2", "remainder"],
+                "ratioResult": [
+                    {
+                        "timestamp": "2020-01-01T00:00:00Z",
+                        "value": 0.0,
+                        "value2": 0.0,
+                        "ratio": "NaN",
+                    }
+                ],
+            },
+        ]
+    }
+    response = OhsomeResponse(
+        data=data,
+        url="https://api.ohsome.org/v1/elements/count/ratio/groupBy/boundary/groupBy/tag",
+    )
+
+    cube, coords = response.as_array()
+
+    assert list(coords) == ["boundary", "tag", "timestamp", "field"]
+    assert cube.shape == (2, 2, 1, 3)
+    assert cube[0, 0, 0].tolist() == [1.0, 2.0, 2.0]
+    assert np.isnan(cube[0, 1]).all()
+    assert np.isnan(cube[1, 1, 0, 2])
+
+
+def test_format_timestamp():
+    """Test whether timestamps are parsed as naive or time zone aware timestamps in UTC."""
+    timestamps = pd.Series(
+        ["2020-01-01T00:00:00Z", None, "2020-01-01T00:00:00Z", "2021-06-01T12:30:00Z"],
+        index=[3, 2, 1, 0],
+    )
+
+    naive = OhsomeResponse._format_timestamp(timestamps)
+    aware = OhsomeResponse._format_timestamp(timestamps, utc=True)
+
+    expected = pd.Series(
+        pd.to_datetime(
+            ["2020-01-01T00:00", None, "2020-01-01T00:00", "2021-06-01T12:30"]
+        ),
+        index=[3, 2, 1, 0],
+    )
+    pd.testing.assert_series_equal(naive, expected, check_dtype=False)
+    pd.testing.assert_series_equal(
+        aware, expected.dt.tz_localize("UTC"), check_dtype=False
+    )